@@ -0,0 +1,186 @@
+"""
+Compare the markdown engines: HTML parity on a corpus and throughput in MB/s.
+
+Usage:
+    python benchmarks/markdown_engine_benchmark.py parity [FILE ...]
+    python benchmarks/markdown_engine_benchmark.py throughput [--size-mb 2.0]
+
+parity renders the built-in feature corpus (plus any FILEs given) with both
+engines through IncrementalMarkdownRenderer, normalizes known cosmetic
+differences, and exits non-zero if any document differs. The same check
+runs as tests/test_markdown_engine_parity.py.
+
+throughput renders a generated note as a whole document and block by block
+(cold cache) with each engine and profile.
+"""
+import argparse
+import difflib
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import main
+
+# Features both engines must render the same way
+PARITY_CORPUS = {
+    'headings': "# Title\n\n## Sub *title*\n\n### Same\n\n### Same\n",
+    'emphasis': "Some *em*, **strong**, `code` and ***both***.\n",
+    'links': (
+        "Inline [link](https://example.com \"Title\"), reference [ref][r] "
+        "and shortcut [r].\n\n<https://auto.example>\n\n[r]: https://r.example\n"
+    ),
+    'lists': "- one\n- two\n- three\n\nBetween\n\n1. first\n2. second\n",
+    'nested_lists': "- one\n    - nested\n    - nested two\n- two\n",
+    'blockquote': "> quoted *text*\n> second line\n",
+    'fenced_code': "```python\ndef f(x):\n    return x < 2 and \"s\"\n```\n",
+    'indented_code': "Text\n\n    code line\n    more code\n",
+    'table': "| a | b |\n| --- | --- |\n| 1 | 2 |\n| 3 | 4 |\n",
+    'footnotes': "Claim[^1] and another[^note].\n\n[^1]: First note.\n[^note]: Second *note*.\n",
+    'html': "<div>\nraw html\n</div>\n\nInline <span>span</span>.\n",
+    'rule': "Above\n\n---\n\nBelow\n",
+    'escapes': "5 < 6 & \"quotes\" 'single'\n",
+    'escaping': (
+        "Not a tag: <script alert('x') and 3 <4 > 2 & AT&T.\n\n"
+        "Code `<script>alert(\"x\")</script>` and `a && b < c`.\n\n"
+        "```\n<script>alert('x')</script>\n```\n"
+    ),
+}
+
+# Equivalent spellings of the same character; &lt;, &gt; and &amp; are never unescaped
+TEXT_ENTITIES = {'&quot;': '"', '&#34;': '"', '&#x22;': '"', '&#39;': "'", '&#x27;': "'",
+                 '&#60;': '&lt;', '&#62;': '&gt;', '&#38;': '&amp;'}
+ATTRIBUTE_ENTITIES = {'&#34;': '&quot;', '&#x22;': '&quot;', '&#39;': "'", '&#x27;': "'",
+                      '&#60;': '&lt;', '&#62;': '&gt;', '&#38;': '&amp;'}
+ENTITY_RE = re.compile('|'.join(re.escape(entity) for entity in TEXT_ENTITIES))
+TAG_OR_TEXT_RE = re.compile(r'(<[^>]*>)|([^<]+)')
+
+
+def normalize_entities(html_text):
+    """Spell quote and numeric entities one way, separately in tags and in text"""
+    def replace(match):
+        tag, text = match.groups()
+        if tag is not None:
+            return ENTITY_RE.sub(lambda entity: ATTRIBUTE_ENTITIES.get(entity.group(), entity.group()), tag)
+        return ENTITY_RE.sub(lambda entity: TEXT_ENTITIES[entity.group()], text)
+    return TAG_OR_TEXT_RE.sub(replace, html_text)
+
+
+def normalize(html_text):
+    """Remove cosmetic differences between engines, keeping escaped text escaped"""
+    text = normalize_entities(html_text)
+    # Whitespace and table cell alignment attributes
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'>\s+<', '><', text).strip()
+    text = re.sub(r' style="text-align:\s*\w+;?"', '', text)
+    # Nesting order of combined ***strong emphasis***
+    text = re.sub(r'<em><strong>((?:(?!</?(?:em|strong)>).)*)</strong></em>',
+                  r'<strong><em>\1</em></strong>', text)
+    # Tight single-paragraph list items
+    text = re.sub(r'<li><p>((?:(?!</?p>).)*)</p></li>', r'<li>\1</li>', text)
+    # Language class on code blocks
+    text = re.sub(r'<code class="language-[^"]*">', '<code>', text)
+    text = text.replace('<br/>', '<br />').replace('<hr/>', '<hr />')
+    return text
+
+
+def build_renderers(profile):
+    highlighter = main.CodeHighlighter()
+    return {
+        name: main.IncrementalMarkdownRenderer(
+            engine(), profile, code_block_renderer=highlighter.highlight, footnotes=True
+        )
+        for name, engine in main.MARKDOWN_ENGINES.items()
+    }
+
+
+def run_parity(files):
+    corpus = dict(PARITY_CORPUS)
+    for path in files:
+        with open(path, 'r', encoding='utf-8') as f:
+            corpus[path] = f.read()
+
+    renderers = build_renderers('export')
+    (reference_name, reference), (candidate_name, candidate) = renderers.items()
+
+    failures = 0
+    for name, text in corpus.items():
+        expected = normalize(reference.render(text))
+        actual = normalize(candidate.render(text))
+        if expected == actual:
+            print(f"PASS  {name}")
+            continue
+        failures += 1
+        print(f"FAIL  {name}")
+        diff = difflib.unified_diff(
+            expected.replace('><', '>\n<').splitlines(),
+            actual.replace('><', '>\n<').splitlines(),
+            reference_name, candidate_name, lineterm='', n=1
+        )
+        for line in list(diff)[:20]:
+            print(f"      {line}")
+
+    print(f"\n{len(corpus) - failures}/{len(corpus)} documents match")
+    return 1 if failures else 0
+
+
+def build_note(size_mb):
+    """Concatenate the parity corpus until the note is roughly size_mb"""
+    sample = '\n'.join(PARITY_CORPUS.values()).replace('[^', '[^x')
+    parts = []
+    size = 0
+    n = 0
+    while size < size_mb * 1024 * 1024:
+        # Vary the text so block caches cannot serve repeats
+        part = f"## Section {n}\n\nParagraph {n}.\n\n" + sample.replace('one', f'one {n}')
+        parts.append(part)
+        size += len(part)
+        n += 1
+    return ''.join(parts)
+
+
+def throughput(func, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(text)
+    elapsed = (time.perf_counter() - start) / repeat
+    return len(text.encode('utf-8')) / 1024 / 1024 / elapsed
+
+
+def run_throughput(size_mb, repeat):
+    note = build_note(size_mb)
+    print(f"Note size: {len(note.encode('utf-8')) / 1024 / 1024:.2f} MB, {repeat} repeats\n")
+    print(f"{'engine':<16} {'profile':<8} {'document MB/s':>14} {'blocks MB/s':>12}")
+    for profile in main.MARKDOWN_PROFILES:
+        for name, engine in main.MARKDOWN_ENGINES.items():
+            converter = engine()
+            whole = throughput(lambda text: converter.convert(text, profile), note, repeat)
+
+            def render_cold(text):
+                renderer = main.IncrementalMarkdownRenderer(converter, profile, footnotes=True)
+                renderer.render(text)
+
+            blocks = throughput(render_cold, note, repeat)
+            print(f"{name:<16} {profile:<8} {whole:>14.2f} {blocks:>12.2f}")
+    return 0
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    parity_parser = subparsers.add_parser('parity')
+    parity_parser.add_argument('files', nargs='*')
+    throughput_parser = subparsers.add_parser('throughput')
+    throughput_parser.add_argument('--size-mb', type=float, default=2.0)
+    throughput_parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == 'parity':
+        return run_parity(args.files)
+    return run_throughput(args.size_mb, args.repeat)
+
+
+if __name__ == '__main__':
+    sys.exit(main_benchmark())
@@ -0,0 +1,69 @@
+"""
+Measure per-render overhead of markdown.markdown() against a reused
+markdown.Markdown instance (MarkdownConverter) for each extension profile.
+
+Usage:
+    python benchmarks/markdown_instance_benchmark.py [--runs 500]
+
+Small inputs are used on purpose: with block-level rendering most
+conversions are a single paragraph, so fixed setup cost dominates.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+import markdown
+
+import main
+
+SAMPLES = {
+    'paragraph': "A paragraph with *emphasis*, `code` and a [link](https://example.com).",
+    'heading': "## A heading",
+    'list': "- one\n- two\n- three",
+    'code': "```python\ndef f(x):\n    return x * 2\n```",
+}
+
+
+def time_calls(func, runs):
+    """Return per-call timings in microseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=500)
+    args = parser.parse_args()
+
+    converter = main.MarkdownConverter()
+
+    print(f"{'profile':<9} {'sample':<10} {'markdown()':>12} {'reused':>10} {'speedup':>8}")
+    for profile, config in main.MARKDOWN_PROFILES.items():
+        # Build the reused instance outside the timed loop
+        converter.instance(profile)
+        for name, text in SAMPLES.items():
+            before = statistics.median(time_calls(
+                lambda: markdown.markdown(
+                    text,
+                    extensions=config['extensions'],
+                    extension_configs=config['extension_configs']
+                ),
+                args.runs
+            ))
+            after = statistics.median(time_calls(
+                lambda: converter.convert(text, profile),
+                args.runs
+            ))
+            print(f"{profile:<9} {name:<10} {before:>10.0f}us {after:>8.0f}us {before / after:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main_benchmark()
@@ -0,0 +1,95 @@
+"""
+Measure metadata store cold scan, warm start and incremental update times.
+
+Usage:
+    python benchmarks/metadata_store_benchmark.py [--notes 100000] [--corpus DIR]
+
+Without --corpus a synthetic corpus is generated in a temporary directory:
+2 KB notes with headings, inline and wiki links and tags, 1,000 per
+directory. The store is scanned from scratch (parsed by the process pool),
+then reconciled again with nothing changed, then after touching 1% of notes.
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from PyQt5.QtCore import QCoreApplication
+
+import main
+
+WORDS = ['alpha', 'beta', 'gamma', 'delta', 'notes', 'idea', 'draft', 'plan', 'review', 'later']
+
+
+def build_corpus(root, notes):
+    """Write notes, 1,000 per directory, and return their paths"""
+    paths = []
+    for n in range(notes):
+        directory = os.path.join(root, f'd{n // 1000}')
+        os.makedirs(directory, exist_ok=True)
+        sections = []
+        for section in range(4):
+            words = ' '.join(random.choices(WORDS, k=60))
+            sections.append(
+                f"## Section {section}\n\n{words} [link](n{random.randrange(notes)}.md) "
+                f"[[n{random.randrange(notes)}]] #{random.choice(WORDS)}"
+            )
+        path = os.path.join(directory, f'n{n}.md')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"# Note {n}\n\n" + '\n\n'.join(sections))
+        paths.append(path)
+    return paths
+
+
+def timed_reconcile(store, label):
+    start = time.perf_counter()
+    store.reconcile()
+    store.writer_pool.waitForDone()
+    print(f"{label:<22} {time.perf_counter() - start:>7.2f} s")
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--notes', type=int, default=100000)
+    parser.add_argument('--corpus', help="scan this directory instead of a generated corpus")
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    random.seed(1)
+
+    root = args.corpus or tempfile.mkdtemp(prefix='noteism-metadata-')
+    try:
+        if not args.corpus:
+            start = time.perf_counter()
+            paths = build_corpus(root, args.notes)
+            print(f"Generated {len(paths)} notes in {time.perf_counter() - start:.1f} s")
+        else:
+            paths = list(main.iter_note_files(root))
+        print(f"{os.cpu_count()} cores\n")
+
+        store = main.MetadataStore(root)
+        timed_reconcile(store, "Cold scan")
+        timed_reconcile(store, "Warm start, unchanged")
+
+        if not args.corpus:
+            for path in random.sample(paths, max(1, len(paths) // 100)):
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write("\n\nEdited #touched")
+            timed_reconcile(store, "Warm start, 1% edited")
+
+        count, words = store.summary()
+        print(f"\n{count} notes, {words} words in the store")
+        store.close()
+    finally:
+        if not args.corpus:
+            shutil.rmtree(root, ignore_errors=True)
+    app.quit()
+
+
+if __name__ == '__main__':
+    main_benchmark()
@@ -0,0 +1,130 @@
+"""
+Compare full preview reloads (setHtml) against DOM patching on a ~1 MB note.
+
+Usage:
+    python benchmarks/preview_patch_benchmark.py [--size-mb 1.0] [--runs 20]
+
+Each run edits one paragraph in the middle of the note, then measures the
+time until the preview has applied the change: loadFinished for a full
+reload, the runJavaScript callback for a patch.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWebEngineWidgets import QWebEngineView
+
+import main
+
+
+def build_note(size_mb):
+    """Build a markdown note of roughly size_mb megabytes"""
+    section = (
+        "## Section {n}\n\n"
+        "Paragraph {n} with *emphasis*, `inline code` and a [link](https://example.com/{n}).\n\n"
+        "- item one\n- item two\n- item three\n\n"
+        "```python\ndef f{n}(x):\n    return x * {n}\n```\n\n"
+    )
+    parts = []
+    size = 0
+    n = 0
+    while size < size_mb * 1024 * 1024:
+        part = section.format(n=n)
+        parts.append(part)
+        size += len(part)
+        n += 1
+    return parts
+
+
+def wait_for(signal, timeout_ms=60000):
+    """Spin an event loop until signal fires"""
+    loop = QEventLoop()
+    signal.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec_()
+    signal.disconnect(loop.quit)
+
+
+def run_javascript_sync(view, script):
+    """Run a script and wait for its callback"""
+    loop = QEventLoop()
+    view.page().runJavaScript(script, lambda _: loop.quit())
+    loop.exec_()
+
+
+def edited(parts, run):
+    """Return the note with one paragraph in the middle changed"""
+    middle = len(parts) // 2
+    changed = list(parts)
+    changed[middle] = changed[middle].replace("Paragraph", f"Edited paragraph {run}", 1)
+    return ''.join(changed)
+
+
+def bench_full_reload(view, renderer, parts, runs):
+    timings = []
+    for run in range(runs):
+        html = main.build_preview_shell(renderer.render(edited(parts, run)))
+        start = time.perf_counter()
+        view.setHtml(html)
+        wait_for(view.loadFinished)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def bench_patch(view, renderer, parts, runs):
+    patcher = main.PreviewDomPatcher(view, main.build_preview_shell)
+    patcher.apply(renderer.render_blocks(''.join(parts)))
+    wait_for(view.loadFinished)
+
+    timings = []
+    for run in range(runs):
+        blocks = renderer.render_blocks(edited(parts, run))
+        start = time.perf_counter()
+        patcher.apply(blocks)
+        # runJavaScript calls are ordered, so a no-op round trip marks completion
+        run_javascript_sync(view, '0')
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name, timings):
+    print(f"{name:<12} median {statistics.median(timings) * 1000:8.1f} ms   "
+          f"min {min(timings) * 1000:8.1f} ms   max {max(timings) * 1000:8.1f} ms")
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size-mb', type=float, default=1.0)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    view = QWebEngineView()
+    view.resize(800, 900)
+    view.show()
+
+    parts = build_note(args.size_mb)
+    renderer = main.IncrementalMarkdownRenderer(
+        main.MarkdownConverter(),
+        'preview',
+        code_block_renderer=main.CodeHighlighter().highlight
+    )
+    # Warm the block cache so both paths measure only the preview update
+    renderer.render(''.join(parts))
+
+    print(f"Note size: {len(''.join(parts)) / 1024 / 1024:.2f} MB, {len(parts)} sections, {args.runs} runs")
+    report("full reload", bench_full_reload(view, renderer, parts, args.runs))
+    report("dom patch", bench_patch(view, renderer, parts, args.runs))
+
+    view.close()
+    app.quit()
+
+
+if __name__ == '__main__':
+    main_benchmark()
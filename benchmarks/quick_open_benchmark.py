@@ -0,0 +1,95 @@
+"""
+Measure quick-open index build time and query latency on a large workspace.
+
+Usage:
+    python benchmarks/quick_open_benchmark.py [--paths 200000] [--workspace DIR]
+
+Without --workspace, empty notes are created in a temporary directory with
+names built from a small syllable set, so many paths share words. The
+synchronous column is the time search() takes on the GUI thread; the
+fuzzy column is how long the background subsequence scan takes to report
+when the contiguous matches do not fill the result list.
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from PyQt5.QtCore import QCoreApplication
+
+import main
+
+SYLLABLES = [
+    'ka', 'lo', 'mi', 'ne', 'ru', 'sa', 'ti', 'vo', 'ze', 'pa', 'qu', 'er',
+    'notes', 'daily', 'project', 'meeting', 'readme', 'index', 'draft'
+]
+QUERIES = ['m', 'mee', 'meeting', 'daily_notes', 'kalo/ne', 'prjrd', 'meetdr']
+
+
+def word():
+    return ''.join(random.choice(SYLLABLES) for _ in range(random.randint(1, 3)))
+
+
+def build_workspace(root, count):
+    directories = ['/'.join(word() for _ in range(random.randint(1, 4))) for _ in range(count // 25)]
+    for n in range(count):
+        directory = os.path.join(root, *random.choice(directories).split('/'))
+        os.makedirs(directory, exist_ok=True)
+        open(os.path.join(directory, f"{word()}_{word()}-{n}.md"), 'w').close()
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--paths', type=int, default=200000)
+    parser.add_argument('--workspace', help="index this directory instead of a generated one")
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    random.seed(2)
+    root = args.workspace or tempfile.mkdtemp(prefix='noteism-quick-open-')
+    try:
+        if not args.workspace:
+            start = time.perf_counter()
+            build_workspace(root, args.paths)
+            print(f"Created {args.paths} notes in {time.perf_counter() - start:.1f} s")
+
+        index = main.PathIndex(root)
+        start = time.perf_counter()
+        index.rebuild()
+        index.thread_pool.waitForDone()
+        QCoreApplication.processEvents()
+        print(f"Index build: {time.perf_counter() - start:.2f} s for {len(index)} paths\n")
+
+        fuzzy = {}
+        index.fuzzy_ready.connect(lambda query_id, revision, results: fuzzy.__setitem__(query_id, results))
+        print(f"{'query':<12} {'synchronous':>12} {'fuzzy':>10} {'results':>8}")
+        for query in QUERIES:
+            timings = []
+            for _ in range(args.runs):
+                start = time.perf_counter()
+                query_id, results = index.search(query)
+                timings.append(time.perf_counter() - start)
+                index.thread_pool.waitForDone()
+            # Time the background scan separately from the synchronous lookup
+            start = time.perf_counter()
+            query_id, results = index.search(query)
+            index.thread_pool.waitForDone()
+            QCoreApplication.processEvents()
+            scan = f"{(time.perf_counter() - start) * 1000:.0f} ms" if query_id in fuzzy else "-"
+            count = len(fuzzy.get(query_id, results))
+            print(f"{query:<12} {statistics.median(timings) * 1000:>9.2f} ms {scan:>10} {count:>8}")
+    finally:
+        if not args.workspace:
+            shutil.rmtree(root, ignore_errors=True)
+    app.quit()
+
+
+if __name__ == '__main__':
+    main_benchmark()
@@ -0,0 +1,118 @@
+"""
+Measure search index build time and query latency on a notes corpus.
+
+Usage:
+    python benchmarks/search_index_benchmark.py [--size-mb 300] [--corpus DIR]
+
+Without --corpus a synthetic corpus is generated in a temporary directory:
+10 KB notes whose words follow a Zipf distribution, so the first few
+words of the vocabulary appear in nearly every note. The index is built
+from scratch, then each query kind is timed on the query thread.
+"""
+import argparse
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from PyQt5.QtCore import QCoreApplication
+
+import main
+
+SYLLABLES = ['ka', 'lo', 'mi', 'ne', 'ru', 'sa', 'ti', 'vo', 'ze', 'pa', 'qu', 'er', 'an', 'is', 'ot', 'ul']
+
+
+def build_vocabulary(size=60000):
+    words = (
+        ''.join(random.choice(SYLLABLES) for _ in range(random.randint(2, 4)))
+        for _ in range(size)
+    )
+    return list(dict.fromkeys(words))
+
+
+def build_corpus(root, size_mb, vocabulary):
+    """Write 10 KB notes, 1,000 per directory, until the corpus is roughly size_mb"""
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    size = 0
+    n = 0
+    while size < size_mb * 1024 * 1024:
+        directory = os.path.join(root, f'd{n // 1000}')
+        os.makedirs(directory, exist_ok=True)
+        words = random.choices(vocabulary, weights, k=1600)
+        paragraphs = (' '.join(words[i:i + 80]) + '.' for i in range(0, len(words), 80))
+        text = f"# Note {n} {words[0]}\n\n" + '\n\n'.join(paragraphs)
+        with open(os.path.join(directory, f'n{n}.md'), 'w', encoding='utf-8') as f:
+            f.write(text)
+        size += len(text)
+        n += 1
+    return n
+
+
+def time_query(index, text, runs):
+    """Return per-query latencies in seconds as measured on the query thread"""
+    timings = []
+    index.results_ready.connect(lambda query_id, results, seconds: timings.append(seconds))
+    for _ in range(runs):
+        index.search(text)
+        index.query_pool.waitForDone()
+        QCoreApplication.processEvents()
+    index.results_ready.disconnect()
+    return timings
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size-mb', type=float, default=300.0)
+    parser.add_argument('--corpus', help="index this directory instead of a generated corpus")
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    app = QCoreApplication(sys.argv)
+    random.seed(1)
+    vocabulary = build_vocabulary()
+
+    root = args.corpus or tempfile.mkdtemp(prefix='noteism-search-')
+    try:
+        if not args.corpus:
+            start = time.perf_counter()
+            notes = build_corpus(root, args.size_mb, vocabulary)
+            print(f"Generated {notes} notes ({args.size_mb:.0f} MB) in {time.perf_counter() - start:.1f} s")
+
+        index = main.SearchIndex(root)
+        start = time.perf_counter()
+        index.reconcile()
+        index.writer_pool.waitForDone()
+        size = os.path.getsize(index.database_path) / 1024 / 1024
+        print(f"Initial index: {time.perf_counter() - start:.1f} s, {size:.0f} MB on disk")
+
+        start = time.perf_counter()
+        index.reconcile()
+        index.writer_pool.waitForDone()
+        print(f"Unchanged reconcile: {time.perf_counter() - start:.2f} s\n")
+
+        queries = {
+            'everywhere': vocabulary[0],
+            'common': vocabulary[200],
+            'rare': vocabulary[-5],
+            'phrase': f'"{vocabulary[0]} {vocabulary[1]}"',
+            'prefix': vocabulary[3][:3] + '*',
+            'boolean': f'{vocabulary[10]} OR {vocabulary[20]} NOT {vocabulary[30]}',
+        }
+        print(f"{'query':<11} {'text':<36} {'median':>10}")
+        for name, text in queries.items():
+            timings = time_query(index, text, args.runs)
+            print(f"{name:<11} {text:<36} {statistics.median(timings) * 1000:>7.1f} ms")
+        index.close()
+    finally:
+        if not args.corpus:
+            shutil.rmtree(root, ignore_errors=True)
+    app.quit()
+
+
+if __name__ == '__main__':
+    main_benchmark()
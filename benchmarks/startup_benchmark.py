@@ -0,0 +1,144 @@
+"""
+Measure startup time and check it against a regression budget.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 5] [--first-paint-budget 1.5]
+        [--interactive-budget 3.0] [--import-budget 0.4] [--home DIR]
+
+Each run starts this script again in a fresh process with --report, which
+sets the editor up the way main.main() does, writes the wall-clock times
+of its startup_finished milestones and closes once interactive: the main
+window created, its first paint, and the end of the deferred startup work
+(preview, settings, session, indexes). Times are measured
+from process launch. HOME points at an empty temporary directory unless
+--home is given, so settings, session and workspace start clean. Then
+`python -X importtime` breaks down what importing main costs.
+
+Exits with status 1 if a median exceeds its budget.
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+
+def run_editor(report_path):
+    """Start the editor in this process, write its milestones to report_path once interactive, then exit"""
+    sys.path.insert(0, SRC)
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QFont
+    from PyQt5.QtWidgets import QApplication
+    import main
+
+    # Same application setup as main.main()
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    app = QApplication(sys.argv[:1])
+    app.setFont(QFont("Inter UI", 10))
+
+    editor = main.NoteismMarkdownEditor()
+
+    def report(times):
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(times, f)
+        editor.close()
+
+    editor.startup_finished.connect(report)
+    editor.show()
+    sys.exit(app.exec_())
+
+
+def launch(home):
+    """Start the editor once and return its milestones in seconds since launch"""
+    report_path = os.path.join(home, 'startup.json')
+    env = dict(os.environ, HOME=home)
+    start = time.time()
+    subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--report', report_path], 
+        env=env, check=True, timeout=120
+    )
+    with open(report_path, encoding='utf-8') as f:
+        times = json.load(f)
+    os.remove(report_path)
+    return {name: stamp - start for name, stamp in times.items()}
+
+
+def import_breakdown(limit):
+    """Return (seconds to import main, [(seconds, module)] of its slowest direct imports)"""
+    code = f"import sys; sys.path.insert(0, {SRC!r}); import main"
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], 
+        capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative) / 1e6, name.rstrip()))
+    total = next((seconds for seconds, name in rows if name.strip() == 'main'), 0.0)
+    # Direct imports are indented by one level more than main itself
+    direct = [(seconds, name.strip()) for seconds, name in rows if name.startswith('   ') and not name.startswith('    ')]
+    direct.sort(reverse=True)
+    return total, direct[:limit]
+
+
+def main_benchmark():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--first-paint-budget', type=float, default=1.5)
+    parser.add_argument('--interactive-budget', type=float, default=3.0)
+    parser.add_argument('--import-budget', type=float, default=0.4)
+    parser.add_argument('--imports', type=int, default=12, help="how many imports to list")
+    parser.add_argument('--home', help="use this HOME instead of an empty temporary one")
+    parser.add_argument('--report', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.report:
+        # One measured launch, started by launch()
+        run_editor(args.report)
+
+    home = args.home or tempfile.mkdtemp(prefix='noteism-startup-')
+    try:
+        runs = [launch(home) for _ in range(args.runs)]
+    finally:
+        if not args.home:
+            shutil.rmtree(home, ignore_errors=True)
+
+    import_seconds, slowest = import_breakdown(args.imports)
+    medians = {
+        'window_created': statistics.median(run['window_created'] for run in runs),
+        'first_paint': statistics.median(run['first_paint'] for run in runs),
+        'interactive': statistics.median(run['interactive'] for run in runs),
+    }
+    budgets = {
+        'first_paint': args.first_paint_budget,
+        'interactive': args.interactive_budget,
+        'import main': args.import_budget,
+    }
+
+    print(f"{'milestone':<16} {'median':>9} {'budget':>9}")
+    over = []
+    for name, seconds in list(medians.items()) + [('import main', import_seconds)]:
+        budget = budgets.get(name)
+        print(f"{name:<16} {seconds:>8.3f}s {f'{budget:.3f}s' if budget else '':>9}")
+        if budget and seconds > budget:
+            over.append(name)
+
+    print(f"\nSlowest imports of main ({args.imports}):")
+    for seconds, name in slowest:
+        print(f"  {seconds * 1000:>8.1f} ms  {name}")
+
+    if over:
+        print(f"\nOver budget: {', '.join(over)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main_benchmark()
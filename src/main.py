@@ -1,46 +1,62 @@
 # Standard Library Imports
 import os
 import sys
+import bisect
 import shutil
 import re
+import io
+import codecs
+import mmap
+import hashlib
+import heapq
+import itertools
+import json
+import posixpath
+import sqlite3
+import tempfile
+import threading
+import time
+import unicodedata
+import zlib
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+from html import escape
+from urllib.parse import unquote
 
-# Markdown and Syntax Highlighting
-import markdown
-from pygments.lexers import get_lexer_by_name
-from pygments.formatters import HtmlFormatter
+# markdown, mistune, pygments and QtWebEngineWidgets are imported where they
+# are first used, so the window can paint before they load
 
 # PyQt5 Core Imports
 from PyQt5.QtCore import (
-    Qt, pyqtSignal, QTimer, QDir, QModelIndex, QSize, QUrl, QSettings
+    Qt, pyqtSignal, QTimer, QDir, QModelIndex, QSize, QUrl, QSettings,
+    QObject, QRunnable, QThreadPool, QFileSystemWatcher, QAbstractItemModel
 )
 
 # PyQt5 Widgets Imports
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTabWidget, QTextEdit, QAction, QMenuBar, QMenu, QToolBar, 
-    QSplitter, QTreeWidget, QTreeWidgetItem, QHeaderView, QMessageBox, 
+    QTabWidget, QTextEdit, QPlainTextEdit, QAction, QMenuBar, QMenu, QToolBar, 
+    QSplitter, QTreeView, QHeaderView, QMessageBox, 
     QInputDialog, QLabel, QStatusBar, QListWidget, QListWidgetItem, 
     QDialog, QFormLayout, QDialogButtonBox, QLineEdit, QPushButton, 
     QFileSystemModel, QAbstractItemView, QFileDialog, QToolButton,
-    QActionGroup, QComboBox, QSpinBox
+    QActionGroup, QComboBox, QSpinBox, QAbstractScrollArea, QProgressDialog,
+    QTextBrowser, QDockWidget, QTreeWidget, QTreeWidgetItem
 )
 
-# PyQt5 Web Engine Imports
-from PyQt5.QtWebEngineWidgets import QWebEngineView
-
 # PyQt5 GUI Imports
 from PyQt5.QtGui import (
     QTextCharFormat, QTextDocument, QPalette, QKeySequence, 
     QTextBlockFormat, QStandardItemModel, QStandardItem, QFont, 
-    QSyntaxHighlighter, QTextCursor, QIcon, QColor
+    QSyntaxHighlighter, QTextCursor, QIcon, QColor, QPainter
 )
 
 # Typing
 from typing import List, Optional
 
-# QDarkStyle
-import qdarkstyle
-
 class NeonPalette:
     # Dark Theme Color Palette
     BACKGROUND_DARKEST = '#121420'  # Deep dark blue-black
@@ -61,30 +77,1631 @@ class NeonPalette:
     HIGHLIGHT_BLUE = 'rgba(52, 152, 219, 0.3)'  # Translucent highlight
 
 class MarkdownHighlighter(QSyntaxHighlighter):
+    """Incremental markdown highlighter driven by per-block states.
+    
+    Multi-line constructs (fenced code, front matter, HTML blocks) are
+    tracked with setCurrentBlockState, so QSyntaxHighlighter stops
+    re-highlighting as soon as an edited block's end state matches what it
+    was before. Inline markup is tokenized in a single pass.
+    
+    In lazy mode only blocks inside the current window are formatted; the
+    rest just carry their state forward and are flagged STATE_DEFERRED so
+    LazyHighlightScheduler can format them once they come near the viewport.
+    
+    Heading blocks also carry their ATX level in the HEADING_MASK bits, in
+    both modes, for DocumentOutline.
+    """
+    
+    # Block states; fenced code also packs the fence char and length
+    STATE_NORMAL = 0
+    STATE_FRONT_MATTER = 1
+    STATE_HTML_BLOCK = 2
+    STATE_FENCED_CODE = 3
+    STATE_MASK = 0xF
+    FENCE_TILDE = 0x10
+    FENCE_LENGTH_SHIFT = 5
+    STATE_DEFERRED = 1 << 16
+    HEADING_SHIFT = 17
+    HEADING_MASK = 0x7 << HEADING_SHIFT
+    
+    # One alternation per inline construct, in precedence order
+    INLINE_RE = re.compile(
+        r'(?P<code>``[^`]+``|`[^`]+`)'
+        r'|(?P<strong>\*\*(?=\S).+?(?<=\S)\*\*|__(?=\S).+?(?<=\S)__)'
+        r'|(?P<emphasis>\*(?=[^\s*])[^*]*?(?<=[^\s*])\*|\b_(?=[^\s_])[^_]*?(?<=[^\s_])_\b)'
+        r'|(?P<strikethrough>~~(?=\S).+?(?<=\S)~~)'
+        r'|(?P<link>!?\[[^\]]*\](?:\([^)]*\)|\[[^\]]*\]))'
+        r'|(?P<autolink><(?:https?|mailto):[^>\s]+>)'
+    )
+    INLINE_TRIGGERS = frozenset('`*_~[<')
+    BLOCKQUOTE_RE = re.compile(r'^ {0,3}>')
+    HORIZONTAL_RULE_RE = re.compile(r'^ {0,3}(?:(?:\*[ \t]*){3,}|(?:-[ \t]*){3,}|(?:_[ \t]*){3,})$')
+    
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.highlighting_rules = []
         
         # Heading formats
-        heading_format = QTextCharFormat()
-        heading_format.setForeground(QColor(NeonPalette.NEON_BLUE))
-        heading_format.setFontWeight(QFont.Bold)
-        
-        # Rule for headings
-        self.highlighting_rules.append((re.compile(r'^#+\s.*$', re.MULTILINE), heading_format))
+        self.heading_format = QTextCharFormat()
+        self.heading_format.setForeground(QColor(NeonPalette.NEON_BLUE))
+        self.heading_format.setFontWeight(QFont.Bold)
         
         # Code block format
-        code_format = QTextCharFormat()
-        code_format.setForeground(QColor(NeonPalette.NEON_GREEN))
-        code_format.setFontFamily("Fira Code")
+        self.code_format = QTextCharFormat()
+        self.code_format.setForeground(QColor(NeonPalette.NEON_GREEN))
+        self.code_format.setFontFamily("Fira Code")
+        
+        # Fence, front matter and HTML block formats
+        self.fence_format = QTextCharFormat(self.code_format)
+        self.fence_format.setForeground(QColor(NeonPalette.TEXT_MUTED))
+        self.front_matter_format = QTextCharFormat()
+        self.front_matter_format.setForeground(QColor(NeonPalette.TEXT_MUTED))
+        self.html_format = QTextCharFormat()
+        self.html_format.setForeground(QColor(NeonPalette.NEON_PURPLE))
+        
+        # Line-level formats
+        self.blockquote_format = QTextCharFormat()
+        self.blockquote_format.setForeground(QColor(NeonPalette.TEXT_MUTED))
+        self.blockquote_format.setFontItalic(True)
+        self.list_marker_format = QTextCharFormat()
+        self.list_marker_format.setForeground(QColor(NeonPalette.NEON_PURPLE))
+        self.list_marker_format.setFontWeight(QFont.Bold)
+        
+        # Inline formats, keyed by INLINE_RE group name
+        strong_format = QTextCharFormat()
+        strong_format.setFontWeight(QFont.Bold)
+        emphasis_format = QTextCharFormat()
+        emphasis_format.setFontItalic(True)
+        strikethrough_format = QTextCharFormat()
+        strikethrough_format.setFontStrikeOut(True)
+        link_format = QTextCharFormat()
+        link_format.setForeground(QColor(NeonPalette.ACCENT_BLUE))
+        link_format.setFontUnderline(True)
+        self.inline_formats = {
+            'code': self.code_format,
+            'strong': strong_format,
+            'emphasis': emphasis_format,
+            'strikethrough': strikethrough_format,
+            'link': link_format,
+            'autolink': link_format
+        }
         
-        # Rule for code blocks
-        self.highlighting_rules.append((re.compile(r'`{1,3}.*?`{1,3}', re.DOTALL), code_format))
-
+        # Lazy mode: only blocks in [window_start, window_end] get formatted
+        self.lazy = False
+        self.window_start = 0
+        self.window_end = -1
+        
+        # Blocks whose heading level changed since DocumentOutline last looked
+        self.heading_changes = []
+    
+    def set_window(self, start, end):
+        """Set the block range that is formatted while in lazy mode"""
+        self.window_start = start
+        self.window_end = end
+    
     def highlightBlock(self, text):
-        for pattern, format in self.highlighting_rules:
-            for match in pattern.finditer(text):
-                self.setFormat(match.start(), match.end() - match.start(), format)
+        old_state = self.currentBlockState()
+        previous_state = self.previousBlockState()
+        if previous_state < 0:
+            previous_state = self.STATE_NORMAL
+        previous_state &= ~(self.STATE_DEFERRED | self.HEADING_MASK)
+        state = previous_state & self.STATE_MASK
+        
+        if self.lazy and not self.window_start <= self.currentBlock().blockNumber() <= self.window_end:
+            self.setCurrentBlockState(self._next_state(text, previous_state) | self.STATE_DEFERRED)
+        elif state == self.STATE_FENCED_CODE:
+            self._highlight_fenced_code(text, previous_state)
+        elif state == self.STATE_FRONT_MATTER:
+            self.setFormat(0, len(text), self.front_matter_format)
+            closed = text.rstrip() in ('---', '...')
+            self.setCurrentBlockState(self.STATE_NORMAL if closed else self.STATE_FRONT_MATTER)
+        elif state == self.STATE_HTML_BLOCK:
+            # HTML blocks run until the next blank line
+            if text.strip():
+                self.setFormat(0, len(text), self.html_format)
+                self.setCurrentBlockState(self.STATE_HTML_BLOCK)
+            else:
+                self.setCurrentBlockState(self.STATE_NORMAL)
+        else:
+            self._highlight_normal(text)
+        
+        if state == self.STATE_NORMAL and text[:4].lstrip(' ')[:1] == '#' and ATX_HEADING_RE.match(text):
+            marker = text.lstrip(' ')
+            level = len(marker) - len(marker.lstrip('#'))
+            self.setCurrentBlockState(self.currentBlockState() | level << self.HEADING_SHIFT)
+        if old_state >= 0 and (old_state ^ self.currentBlockState()) & self.HEADING_MASK:
+            self.heading_changes.append(self.currentBlock().blockNumber())
+    
+    def _next_state(self, text, previous_state):
+        """Compute a block's end state without formatting it"""
+        state = previous_state & self.STATE_MASK
+        if state == self.STATE_FENCED_CODE:
+            fence_char = '~' if previous_state & self.FENCE_TILDE else '`'
+            stripped = text.strip()
+            closed = len(stripped) >= previous_state >> self.FENCE_LENGTH_SHIFT \
+                and stripped == fence_char * len(stripped) \
+                and len(text) - len(text.lstrip(' ')) < 4
+            return self.STATE_NORMAL if closed else previous_state
+        if state == self.STATE_FRONT_MATTER:
+            return self.STATE_NORMAL if text.rstrip() in ('---', '...') else self.STATE_FRONT_MATTER
+        if state == self.STATE_HTML_BLOCK:
+            return self.STATE_HTML_BLOCK if text.strip() else self.STATE_NORMAL
+        
+        # Every multi-line opener starts with one of these characters
+        if text.lstrip(' ')[:1] not in ('`', '~', '<', '-'):
+            return self.STATE_NORMAL
+        fence_match = FENCE_OPEN_RE.match(text)
+        if fence_match:
+            return self._fence_state(fence_match.group(1))
+        if text.rstrip() == '---' and self.currentBlock().blockNumber() == 0:
+            return self.STATE_FRONT_MATTER
+        if HTML_BLOCK_RE.match(text):
+            return self.STATE_HTML_BLOCK
+        return self.STATE_NORMAL
+    
+    def _fence_state(self, fence):
+        """Pack an opening fence into a fenced code block state"""
+        fence_state = self.STATE_FENCED_CODE | (min(len(fence), 127) << self.FENCE_LENGTH_SHIFT)
+        if fence[0] == '~':
+            fence_state |= self.FENCE_TILDE
+        return fence_state
+    
+    def _highlight_fenced_code(self, text, fence_state):
+        """Highlight a line inside fenced code and detect the closing fence"""
+        next_state = self._next_state(text, fence_state)
+        self.setFormat(0, len(text), self.code_format if next_state == fence_state else self.fence_format)
+        self.setCurrentBlockState(next_state)
+    
+    def _highlight_normal(self, text):
+        """Highlight a line outside any multi-line construct"""
+        self.setCurrentBlockState(self.STATE_NORMAL)
+        if not text:
+            return
+        
+        fence_match = FENCE_OPEN_RE.match(text)
+        if fence_match:
+            self.setFormat(0, len(text), self.fence_format)
+            self.setCurrentBlockState(self._fence_state(fence_match.group(1)))
+            return
+        
+        if text.rstrip() == '---' and self.currentBlock().blockNumber() == 0:
+            self.setFormat(0, len(text), self.front_matter_format)
+            self.setCurrentBlockState(self.STATE_FRONT_MATTER)
+            return
+        
+        if HTML_BLOCK_RE.match(text):
+            self.setFormat(0, len(text), self.html_format)
+            self.setCurrentBlockState(self.STATE_HTML_BLOCK)
+            return
+        
+        if ATX_HEADING_RE.match(text):
+            self.setFormat(0, len(text), self.heading_format)
+            return
+        
+        if self.HORIZONTAL_RULE_RE.match(text):
+            self.setFormat(0, len(text), self.list_marker_format)
+            return
+        
+        start = 0
+        quote_match = self.BLOCKQUOTE_RE.match(text)
+        if quote_match:
+            self.setFormat(0, len(text), self.blockquote_format)
+            start = quote_match.end()
+        
+        list_match = LIST_ITEM_RE.match(text[start:] if start else text)
+        if list_match:
+            self.setFormat(start + list_match.start(), list_match.end() - list_match.start(), self.list_marker_format)
+            start += list_match.end()
+        
+        if self.INLINE_TRIGGERS.isdisjoint(text):
+            return
+        
+        for match in self.INLINE_RE.finditer(text, start):
+            self.setFormat(match.start(), match.end() - match.start(), self.inline_formats[match.lastgroup])
+
+class LazyHighlightScheduler(QObject):
+    """Format visible blocks first and nearby blocks in idle-time chunks.
+    
+    Switches its highlighter into lazy mode for large documents, keeps the
+    highlighter's window around the viewport as the editor scrolls, and
+    formats deferred blocks from a queue under a per-tick time budget.
+    Blocks more than PREFETCH_SCREENS screens away stay deferred until they
+    are scrolled near.
+    """
+    
+    AUTO_THRESHOLD_CHARS = 512 * 1024
+    TICK_BUDGET_MS = 8
+    PREFETCH_SCREENS = 3
+    INITIAL_WINDOW_BLOCKS = 200
+    
+    def __init__(self, editor, highlighter):
+        super().__init__(editor)
+        self.editor = editor
+        self.highlighter = highlighter
+        self.pending = deque()
+        
+        self.process_timer = QTimer(self)
+        self.process_timer.setSingleShot(True)
+        self.process_timer.setInterval(0)
+        self.process_timer.timeout.connect(self._process_pending)
+        
+        # Coalesce bursts of scroll and resize events
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(30)
+        self.refresh_timer.timeout.connect(self.refresh)
+        
+        editor.verticalScrollBar().valueChanged.connect(self.schedule_refresh)
+        editor.verticalScrollBar().rangeChanged.connect(self.schedule_refresh)
+    
+    def configure_for_size(self, char_count):
+        """Turn lazy mode on or off for a document about to be loaded"""
+        self.set_lazy(char_count >= self.AUTO_THRESHOLD_CHARS)
+    
+    def set_lazy(self, lazy):
+        """Switch lazy highlighting on or off"""
+        if lazy == self.highlighter.lazy:
+            return
+        self.highlighter.lazy = lazy
+        if lazy:
+            # Until the first refresh, assume the top of the document is visible
+            self.highlighter.set_window(0, self.INITIAL_WINDOW_BLOCKS)
+            self.schedule_refresh()
+        else:
+            self.pending.clear()
+            self.highlighter.rehighlight()
+    
+    def schedule_refresh(self, *args):
+        if self.highlighter.lazy:
+            self.refresh_timer.start()
+    
+    def refresh(self):
+        """Recenter the window on the viewport and queue deferred blocks"""
+        if not self.highlighter.lazy:
+            return
+        
+        first = self.editor.firstVisibleBlock().blockNumber()
+        last = self.editor.cursorForPosition(self.editor.viewport().rect().bottomLeft()).blockNumber()
+        last = max(first, last)
+        margin = (last - first + 1) * self.PREFETCH_SCREENS
+        start = max(0, first - margin)
+        end = min(self.editor.document().blockCount() - 1, last + margin)
+        self.highlighter.set_window(start, end)
+        
+        # Visible blocks first, then outward from the viewport
+        self.pending = deque(range(first, last + 1))
+        below = range(last + 1, end + 1)
+        above = range(first - 1, start - 1, -1)
+        for index in range(max(len(below), len(above))):
+            if index < len(below):
+                self.pending.append(below[index])
+            if index < len(above):
+                self.pending.append(above[index])
+        self.process_timer.start()
+    
+    def _process_pending(self):
+        document = self.editor.document()
+        deadline = time.perf_counter() + self.TICK_BUDGET_MS / 1000
+        deferred = MarkdownHighlighter.STATE_DEFERRED
+        
+        while self.pending and time.perf_counter() < deadline:
+            block = document.findBlockByNumber(self.pending.popleft())
+            if block.isValid() and block.userState() != -1 and block.userState() & deferred:
+                # Re-highlighting cascades forward through deferred blocks in the window
+                self.highlighter.rehighlightBlock(block)
+        
+        if self.pending:
+            self.process_timer.start()
+
+class OutlineEntry:
+    """One heading of a DocumentOutline; replaced rather than edited when its text or level changes"""
+    __slots__ = ('block_number', 'level', 'text')
+    
+    def __init__(self, block_number, level, text):
+        self.block_number = block_number
+        self.level = level
+        self.text = text
+
+class DocumentOutline(QObject):
+    """A document's ATX headings, kept up to date from contentsChange.
+    
+    Heading levels are read from the block states MarkdownHighlighter
+    sets, so headings inside fenced code or front matter are already left
+    out. An edit rescans only the blocks it touched plus the blocks whose
+    level the highlighter reports changed further down (e.g. when a fence
+    opens); entries below the edit just have their block numbers shifted.
+    Unchanged entries keep their identity, so views can tell which parts
+    of the tree changed.
+    """
+    changed = pyqtSignal()
+    
+    def __init__(self, document, highlighter, parent=None):
+        super().__init__(parent)
+        self.document = document
+        self.highlighter = highlighter
+        self.block_count = document.blockCount()
+        self.entries = self._scan(0, self.block_count - 1)
+        # Connected after the highlighter's own slot, so block states are current here
+        document.contentsChange.connect(self._on_contents_change)
+    
+    @staticmethod
+    def heading_text(text):
+        return text.strip().lstrip('#').strip().rstrip('#').strip()
+    
+    def _scan(self, first, last):
+        entries = []
+        block = self.document.findBlockByNumber(first)
+        while block.isValid() and block.blockNumber() <= last:
+            state = block.userState()
+            if state != -1 and state & MarkdownHighlighter.HEADING_MASK:
+                level = (state & MarkdownHighlighter.HEADING_MASK) >> MarkdownHighlighter.HEADING_SHIFT
+                entries.append(OutlineEntry(block.blockNumber(), level, self.heading_text(block.text())))
+            block = block.next()
+        return entries
+    
+    def _on_contents_change(self, position, removed, added):
+        document = self.document
+        first = document.findBlock(position).blockNumber()
+        end_block = document.findBlock(position + added)
+        last = end_block.blockNumber() if end_block.isValid() else document.blockCount() - 1
+        delta = document.blockCount() - self.block_count
+        self.block_count = document.blockCount()
+        
+        # Entries inside the edited blocks are rescanned; ones below it move by delta
+        numbers = [entry.block_number for entry in self.entries]
+        start = bisect.bisect_left(numbers, first)
+        end = bisect.bisect_right(numbers, last - delta)
+        old = self.entries[start:end]
+        tail = self.entries[end:]
+        if delta:
+            for entry in tail:
+                entry.block_number += delta
+        middle = self._scan(first, last)
+        self.entries[start:] = middle + tail
+        changed = [(e.level, e.text) for e in old] != [(e.level, e.text) for e in middle]
+        
+        # Headings that appeared or vanished below the edit
+        outside = sorted({number for number in self.highlighter.heading_changes if not first <= number <= last})
+        self.highlighter.heading_changes.clear()
+        for number in outside:
+            numbers = [entry.block_number for entry in self.entries]
+            index = bisect.bisect_left(numbers, number)
+            if index < len(numbers) and numbers[index] == number:
+                del self.entries[index]
+            self.entries[index:index] = self._scan(number, number)
+            changed = True
+        
+        if changed:
+            self.changed.emit()
+
+class OutlinePanel(QWidget):
+    """Heading tree for the current editor; activating a heading moves the cursor to it.
+    
+    The tree is grouped under top-level headings. When the outline changes,
+    only the groups that differ from the ones shown are rebuilt.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.editor = None
+        self.outline = None
+        # Top-level groups currently shown, as lists of OutlineEntry
+        self.groups = []
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        
+        self.tree = QTreeWidget()
+        self.tree.setHeaderHidden(True)
+        self.tree.itemClicked.connect(self._go_to)
+        self.tree.itemActivated.connect(self._go_to)
+        layout.addWidget(self.tree)
+    
+    def set_editor(self, editor):
+        if self.outline is not None:
+            self.outline.changed.disconnect(self.refresh)
+        self.outline = getattr(editor, 'outline', None)
+        self.editor = editor if self.outline is not None else None
+        self.tree.clear()
+        self.groups = []
+        if self.outline is not None:
+            self.outline.changed.connect(self.refresh)
+        self.refresh()
+    
+    def refresh(self):
+        groups = self._group(self.outline.entries if self.outline is not None else [])
+        old = self.groups
+        
+        # Keep the unchanged groups at both ends and rebuild the ones between
+        prefix = 0
+        while prefix < min(len(old), len(groups)) and self._same_group(old[prefix], groups[prefix]):
+            prefix += 1
+        suffix = 0
+        while suffix < min(len(old), len(groups)) - prefix \
+                and self._same_group(old[-1 - suffix], groups[-1 - suffix]):
+            suffix += 1
+        
+        for _ in range(len(old) - prefix - suffix):
+            self.tree.takeTopLevelItem(prefix)
+        for offset, group in enumerate(groups[prefix:len(groups) - suffix]):
+            item = self._build_group(group)
+            self.tree.insertTopLevelItem(prefix + offset, item)
+            item.setExpanded(True)
+            self._expand(item)
+        self.groups = groups
+    
+    @staticmethod
+    def _same_group(a, b):
+        return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+    
+    @staticmethod
+    def _group(entries):
+        """Split entries into groups, each led by a heading no earlier heading outranks"""
+        groups = []
+        top_level = 7
+        for entry in entries:
+            if entry.level <= top_level:
+                groups.append([entry])
+                top_level = entry.level
+            else:
+                groups[-1].append(entry)
+        return groups
+    
+    @staticmethod
+    def _item(entry):
+        item = QTreeWidgetItem([entry.text or '(empty heading)'])
+        item.setData(0, Qt.UserRole, entry)
+        return item
+    
+    def _build_group(self, group):
+        root = self._item(group[0])
+        stack = [(group[0].level, root)]
+        for entry in group[1:]:
+            while stack[-1][0] >= entry.level:
+                stack.pop()
+            item = self._item(entry)
+            stack[-1][1].addChild(item)
+            stack.append((entry.level, item))
+        return root
+    
+    def _expand(self, item):
+        for i in range(item.childCount()):
+            item.child(i).setExpanded(True)
+            self._expand(item.child(i))
+    
+    def _go_to(self, item):
+        entry = item.data(0, Qt.UserRole)
+        if self.editor is None or entry is None:
+            return
+        block = self.editor.document().findBlockByNumber(entry.block_number)
+        if not block.isValid():
+            return
+        self.editor.setTextCursor(QTextCursor(block))
+        self.editor.centerCursor()
+        self.editor.setFocus()
+
+class DocumentStatistics(QObject):
+    """Word, line, character and UTF-8 byte counts of a document, kept from contentsChange.
+    
+    Word and byte counts are stored per block in arrays indexed by block
+    number. An edit subtracts the counts of the blocks it replaced and
+    counts only the blocks it produced; line and character counts come
+    from the document itself.
+    """
+    changed = pyqtSignal()
+    
+    def __init__(self, document, parent=None):
+        super().__init__(parent)
+        self.document = document
+        self.block_words = array('q')
+        self.block_bytes = array('q')
+        self.words = 0
+        self.text_bytes = 0
+        self._count_all()
+        document.contentsChange.connect(self._on_contents_change)
+    
+    @property
+    def lines(self):
+        return self.document.blockCount()
+    
+    @property
+    def characters(self):
+        # Block separators count as the newlines toPlainText() would return
+        return self.document.characterCount() - 1
+    
+    @property
+    def byte_count(self):
+        return self.text_bytes + self.document.blockCount() - 1
+    
+    def _count(self, first, last):
+        words = array('q')
+        sizes = array('q')
+        block = self.document.findBlockByNumber(first)
+        while block.isValid() and block.blockNumber() <= last:
+            text = block.text()
+            words.append(len(text.split()))
+            sizes.append(len(text.encode('utf-8', errors='surrogatepass')))
+            block = block.next()
+        return words, sizes
+    
+    def _count_all(self):
+        self.block_words, self.block_bytes = self._count(0, self.document.blockCount() - 1)
+        self.words = sum(self.block_words)
+        self.text_bytes = sum(self.block_bytes)
+    
+    def _on_contents_change(self, position, removed, added):
+        document = self.document
+        first = document.findBlock(position).blockNumber()
+        end_block = document.findBlock(position + added)
+        last = end_block.blockNumber() if end_block.isValid() else document.blockCount() - 1
+        # The blocks first..old_last were replaced by first..last
+        old_last = last - (document.blockCount() - len(self.block_words))
+        if first < 0 or old_last < first - 1 or old_last >= len(self.block_words):
+            self._count_all()
+        else:
+            words, sizes = self._count(first, last)
+            self.words += sum(words) - sum(self.block_words[first:old_last + 1])
+            self.text_bytes += sum(sizes) - sum(self.block_bytes[first:old_last + 1])
+            self.block_words[first:old_last + 1] = words
+            self.block_bytes[first:old_last + 1] = sizes
+        self.changed.emit()
+
+class LargeFileLoader(QObject):
+    """Stream a memory-mapped file into an editor's document in timed chunks.
+    
+    Bytes are decoded incrementally (UTF-8 with universal newlines, as
+    open() does) and appended at the end of the document from a zero-delay
+    timer, so the file never exists as one Python string and the event loop
+    keeps running between chunks. The editor is read-only and silent until
+    the load finishes or is cancelled.
+    """
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal()
+    failed = pyqtSignal(str)
+    
+    THRESHOLD_BYTES = 8 * 1024 * 1024
+    CHUNK_BYTES = 64 * 1024
+    TICK_BUDGET_MS = 30
+    
+    def __init__(self, editor, file_path, parent=None):
+        super().__init__(parent)
+        self.editor = editor
+        self.file_path = file_path
+        self.file = None
+        self.mapped = None
+        self.offset = 0
+        # Digest of the raw bytes, for the edit journal's base
+        self.digest = hashlib.blake2b(digest_size=16)
+        self.decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder('utf-8')(), 
+            translate=True
+        )
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self._load_chunks)
+    
+    def start(self):
+        """Map the file and begin appending it to the editor"""
+        self.file = open(self.file_path, 'rb')
+        try:
+            self.mapped = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+        
+        document = self.editor.document()
+        self.cursor = QTextCursor(document)
+        self.editor.setReadOnly(True)
+        self.editor.blockSignals(True)
+        # Loading is not an edit; keep it out of the undo stack
+        document.setUndoRedoEnabled(False)
+        self.timer.start()
+    
+    def cancel(self):
+        """Stop loading; the partially filled document is left as is"""
+        self.timer.stop()
+        self._close()
+    
+    def _load_chunks(self):
+        size = len(self.mapped)
+        deadline = time.perf_counter() + self.TICK_BUDGET_MS / 1000
+        
+        try:
+            while self.offset < size and time.perf_counter() < deadline:
+                chunk = self.mapped[self.offset:self.offset + self.CHUNK_BYTES]
+                self.offset += len(chunk)
+                self.digest.update(chunk)
+                self.cursor.movePosition(QTextCursor.End)
+                self.cursor.insertText(self.decoder.decode(chunk, final=self.offset >= size))
+        except UnicodeDecodeError as e:
+            self._close()
+            self.failed.emit(str(e))
+            return
+        
+        self.progress.emit(self.offset, size)
+        if self.offset < size:
+            self.timer.start()
+        else:
+            self._close()
+            self.finished.emit()
+    
+    def _close(self):
+        if self.mapped is None:
+            return
+        self.mapped.close()
+        self.file.close()
+        self.mapped = None
+        
+        document = self.editor.document()
+        document.setUndoRedoEnabled(True)
+        document.setModified(False)
+        self.editor.blockSignals(False)
+        self.editor.setReadOnly(False)
+
+def document_text_chunks(document, chunk_chars=1024 * 1024):
+    """Yield a QTextDocument's plain text block by block, in chunks of about chunk_chars"""
+    pieces = []
+    pending = 0
+    block = document.begin()
+    while block.isValid():
+        # Match toPlainText(): soft line breaks are saved as newlines
+        text = block.text().replace('\u2028', '\n')
+        block = block.next()
+        if block.isValid():
+            text += '\n'
+        pieces.append(text)
+        pending += len(text)
+        if pending >= chunk_chars:
+            yield ''.join(pieces)
+            pieces = []
+            pending = 0
+    yield ''.join(pieces)
+
+def read_text_file(file_path):
+    """Read a UTF-8 text file with universal newlines; return (text, digest of the raw bytes)"""
+    with open(file_path, 'rb') as file:
+        data = file.read()
+    text = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    return text, hashlib.blake2b(data, digest_size=16).digest()
+
+def encode_text_chunk(chunk):
+    """Encode text the way a text-mode UTF-8 file write would"""
+    if os.linesep != '\n':
+        chunk = chunk.replace('\n', os.linesep)
+    return chunk.encode('utf-8')
+
+def text_digest(chunks):
+    """Hash text chunks as they would be stored on disk (matches read_text_file's digest)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for chunk in chunks:
+        digest.update(encode_text_chunk(chunk))
+    return digest.digest()
+
+def file_signature(file_path):
+    """Return (mtime_ns, size) for a file, or None if it does not exist"""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def write_text_atomic(file_path, chunks):
+    """Write text chunks to a temp file beside file_path, fsync it and rename it over the target.
+    
+    A crash at any point leaves either the old file or the new one, never a
+    truncated mix. Returns the number of bytes written.
+    """
+    # Replace the file a symlink points to, not the link itself
+    target = os.path.realpath(file_path)
+    directory, name = os.path.split(target)
+    temp_path = os.path.join(directory, f".{name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    
+    written = 0
+    try:
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        with os.fdopen(fd, 'wb') as file:
+            for chunk in chunks:
+                written += file.write(encode_text_chunk(chunk))
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(target):
+            shutil.copymode(target, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    
+    if hasattr(os, 'O_DIRECTORY'):
+        # Persist the rename itself
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return written
+
+class FileIoTask(QRunnable):
+    """Run one callable on a file I/O worker thread"""
+    
+    def __init__(self, func):
+        super().__init__()
+        self.func = func
+    
+    def run(self):
+        self.func()
+
+class FileIoService(QObject):
+    """Run file reads and writes on worker threads and report back on the GUI thread.
+    
+    Each request gets an id; its result or error is emitted from the worker
+    and delivered to the request's callbacks through a queued connection.
+    Writes are queued per path and drained in submission order by a single
+    worker, so two saves to one file never interleave. Writes are atomic and
+    are skipped when the text hashes the same as what this service last read
+    from or wrote to an unchanged file.
+    """
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+    
+    MAX_THREADS = 4
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.next_request_id = 0
+        # Touched only on the GUI thread
+        self.callbacks = {}
+        # Shared with workers; guarded by lock
+        self.lock = threading.Lock()
+        self.write_queues = {}
+        # path key -> (digest, file_signature) of the contents known to be on disk
+        self.disk_state = {}
+        
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(self.MAX_THREADS)
+        
+        self.finished.connect(self._on_finished)
+        self.failed.connect(self._on_failed)
+    
+    def read(self, file_path, on_done=None, on_error=None):
+        """Read a text file in the background; on_done receives (contents, digest)"""
+        request_id = self._register(on_done, on_error)
+        self.thread_pool.start(FileIoTask(
+            lambda: self._run(request_id, self._read_and_record, file_path)
+        ))
+        return request_id
+    
+    def write(self, file_path, chunks, on_done=None, on_error=None):
+        """Write text chunks in the background after earlier writes to the same path.
+        
+        on_done receives (bytes_written, seconds, digest); bytes_written is 0
+        when the write was skipped because the file already holds this text.
+        """
+        request_id = self._register(on_done, on_error)
+        # Materialize the chunks here; documents must not be read off the GUI thread
+        job = (request_id, file_path, list(chunks))
+        key = self._key(file_path)
+        
+        with self.lock:
+            queue = self.write_queues.get(key)
+            if queue is not None:
+                # A worker is already draining this path and will pick the job up
+                queue.append(job)
+                return request_id
+            self.write_queues[key] = deque([job])
+        
+        self.thread_pool.start(FileIoTask(lambda: self._drain_writes(key)))
+        return request_id
+    
+    def wait_for_done(self, msecs=-1):
+        """Block until every queued read and write has finished"""
+        return self.thread_pool.waitForDone(msecs)
+    
+    @staticmethod
+    def _key(file_path):
+        return os.path.normcase(os.path.abspath(file_path))
+    
+    def _register(self, on_done, on_error):
+        self.next_request_id += 1
+        self.callbacks[self.next_request_id] = (on_done, on_error)
+        return self.next_request_id
+    
+    def _run(self, request_id, func, *args):
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.failed.emit(request_id, str(e))
+        else:
+            self.finished.emit(request_id, result)
+    
+    def _drain_writes(self, key):
+        """Run queued writes for one path in order (on a worker thread)"""
+        while True:
+            with self.lock:
+                queue = self.write_queues[key]
+                if not queue:
+                    del self.write_queues[key]
+                    return
+                request_id, file_path, chunks = queue.popleft()
+            self._run(request_id, self._write_if_changed, key, file_path, chunks)
+    
+    def _read_and_record(self, file_path):
+        content, digest = read_text_file(file_path)
+        state = (digest, file_signature(file_path))
+        with self.lock:
+            self.disk_state[self._key(file_path)] = state
+        return content, digest
+    
+    def _write_if_changed(self, key, file_path, chunks):
+        start = time.perf_counter()
+        digest = text_digest(chunks)
+        with self.lock:
+            known = self.disk_state.get(key)
+        
+        written = 0
+        if known != (digest, file_signature(file_path)):
+            written = write_text_atomic(file_path, chunks)
+            with self.lock:
+                self.disk_state[key] = (digest, file_signature(file_path))
+        return written, time.perf_counter() - start, digest
+    
+    def _on_finished(self, request_id, result):
+        on_done, _ = self.callbacks.pop(request_id, (None, None))
+        if on_done is not None:
+            on_done(result)
+    
+    def _on_failed(self, request_id, message):
+        _, on_error = self.callbacks.pop(request_id, (None, None))
+        if on_error is not None:
+            on_error(message)
+        else:
+            print(f"File I/O error: {message}")
+
+class AutoSaveEngine(QObject):
+    """Save modified tabs periodically, one tab per tick.
+    
+    Every interval the modified editors that have a file path are queued; a
+    short stagger timer then snapshots and submits one of them at a time, so
+    a window full of large notes never stalls the GUI thread in one go. The
+    writes themselves run on the file I/O service.
+    """
+    saved = pyqtSignal(str, int, float)
+    failed = pyqtSignal(str, str)
+    
+    STAGGER_MS = 250
+    
+    def __init__(self, editor_tabs, save_func, parent=None):
+        super().__init__(parent)
+        self.editor_tabs = editor_tabs
+        self.save_func = save_func
+        self.pending = deque()
+        
+        self.interval_timer = QTimer(self)
+        self.interval_timer.timeout.connect(self.queue_modified)
+        
+        self.stagger_timer = QTimer(self)
+        self.stagger_timer.setSingleShot(True)
+        self.stagger_timer.setInterval(self.STAGGER_MS)
+        self.stagger_timer.timeout.connect(self._save_next)
+    
+    def set_interval(self, minutes):
+        """Save every `minutes` minutes; 0 disables auto-save"""
+        self.pending.clear()
+        self.stagger_timer.stop()
+        if minutes > 0:
+            self.interval_timer.start(minutes * 60 * 1000)
+        else:
+            self.interval_timer.stop()
+    
+    def queue_modified(self):
+        """Queue every tab that needs saving"""
+        for i in range(self.editor_tabs.count()):
+            editor = self.editor_tabs.widget(i)
+            if self._needs_save(editor) and editor not in self.pending:
+                self.pending.append(editor)
+        if self.pending and not self.stagger_timer.isActive():
+            self._save_next()
+    
+    @staticmethod
+    def _needs_save(editor):
+        # Read-only viewers and editors that are still loading are never saved
+        return (
+            isinstance(editor, QPlainTextEdit) 
+            and not editor.isReadOnly() 
+            and bool(editor.property("file_path")) 
+            and editor.document().isModified()
+        )
+    
+    def _save_next(self):
+        while self.pending:
+            editor = self.pending.popleft()
+            try:
+                if not self._needs_save(editor):
+                    continue
+            except RuntimeError:
+                # Tab was closed while queued
+                continue
+            
+            file_path = editor.property("file_path")
+            self.save_func(
+                editor, 
+                file_path, 
+                on_saved=lambda result, path=file_path: self.saved.emit(path, result[0], result[1]),
+                on_error=lambda message, path=file_path: self.failed.emit(path, message)
+            )
+            break
+        
+        if self.pending:
+            self.stagger_timer.start()
+
+class EditJournal:
+    """Append-only log of one document's edits since its last clean save.
+    
+    The first line is a JSON header with the file path and the digest of the
+    on-disk contents the edits apply to; every further line is one
+    [position, chars_removed, inserted_text] change in document coordinates.
+    Records are buffered and appended in batches; consecutive typing is
+    merged into one record while it is still unflushed.
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, journal_path, file_path, base_digest, records=None):
+        self.journal_path = journal_path
+        self.file_path = file_path
+        self.base_digest = base_digest
+        # Records since the base; first_seq is the sequence number of records[0]
+        self.records = list(records or [])
+        self.first_seq = 0
+        self.flushed = len(self.records)
+        # Records before this sequence number belong to a pending save snapshot
+        self.sealed = 0
+        # Document length excluding the final paragraph separator
+        self.length = 0
+        if records is None:
+            self._rewrite()
+    
+    @staticmethod
+    def load(journal_path):
+        """Read a journal file; return (header, records), skipping a torn last line"""
+        with open(journal_path, 'r', encoding='utf-8') as file:
+            header = json.loads(file.readline())
+            records = []
+            for line in file:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+        return header, records
+    
+    def record(self, position, removed, text):
+        """Log one change"""
+        last = len(self.records) - 1
+        if (not removed and last >= self.flushed and self.first_seq + last >= self.sealed):
+            previous = self.records[last]
+            if not previous[1] and previous[0] + len(previous[2]) == position:
+                previous[2] += text
+                return
+        self.records.append([position, removed, text])
+    
+    def flush(self):
+        """Append buffered records to the journal file"""
+        if self.flushed == len(self.records):
+            return
+        lines = [json.dumps(entry, ensure_ascii=False) for entry in self.records[self.flushed:]]
+        with open(self.journal_path, 'a', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        self.flushed = len(self.records)
+    
+    def mark(self):
+        """Return a token for the current state, taken when a save snapshots the document"""
+        self.sealed = self.first_seq + len(self.records)
+        return self.sealed
+    
+    def compact(self, base_digest, mark):
+        """Rebase onto newly saved contents, keeping only edits made after mark"""
+        drop = mark - self.first_seq
+        if drop < 0:
+            # An older save finished after a newer compaction
+            return
+        self.records = self.records[drop:]
+        self.first_seq = mark
+        self.flushed = len(self.records)
+        self.base_digest = base_digest
+        self._rewrite()
+    
+    def _rewrite(self):
+        header = {
+            'version': self.VERSION, 
+            'path': self.file_path, 
+            'base': self.base_digest.hex()
+        }
+        lines = [json.dumps(header)]
+        lines.extend(json.dumps(entry, ensure_ascii=False) for entry in self.records)
+        temp_path = self.journal_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+        os.replace(temp_path, self.journal_path)
+
+class EditJournalManager(QObject):
+    """Journal every open file's edits so unsaved work survives a crash.
+    
+    Each editor with a file gets an EditJournal fed from its document's
+    contentsChange signal; a timer appends all pending records in one
+    batch. Journals are compacted when their file is saved and deleted when
+    their tab closes. On startup, recover() returns the journals that still
+    hold edits so they can be replayed onto their files.
+    """
+    
+    FLUSH_INTERVAL_MS = 500
+    
+    def __init__(self, directory, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.journals = []
+        
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self.flush_timer.timeout.connect(self.flush)
+    
+    def journal_path(self, file_path):
+        name = hashlib.blake2b(os.path.abspath(file_path).encode('utf-8'), digest_size=8).hexdigest()
+        return os.path.join(self.directory, f"{name}.journal")
+    
+    def attach(self, editor, file_path, base_digest, records=None):
+        """Start journaling an editor whose document matches base_digest on disk"""
+        self.detach(editor)
+        os.makedirs(self.directory, exist_ok=True)
+        
+        journal = EditJournal(self.journal_path(file_path), file_path, base_digest, records)
+        self._connect(editor, journal)
+        self.journals.append(journal)
+    
+    def detach(self, editor, keep=False):
+        """Stop journaling an editor and return its journal; the file is deleted unless keep is set"""
+        journal = getattr(editor, 'journal', None)
+        if journal is None:
+            return None
+        self._disconnect(editor)
+        self.journals.remove(journal)
+        
+        if keep:
+            journal.flush()
+        else:
+            self.delete(journal)
+        return journal
+    
+    @staticmethod
+    def delete(journal):
+        """Delete a detached journal's file"""
+        try:
+            os.remove(journal.journal_path)
+        except OSError:
+            pass
+    
+    def suspend(self, editor):
+        """Stop feeding an editor's journal but keep it open, e.g. while its tab hibernates"""
+        journal = getattr(editor, 'journal', None)
+        if journal is None:
+            return None
+        self._disconnect(editor)
+        journal.flush()
+        return journal
+    
+    def resume(self, editor, journal):
+        """Feed a suspended journal from an editor rebuilt with the same text"""
+        self._connect(editor, journal)
+    
+    def mark(self, editor):
+        """Note the journal position of a save snapshot"""
+        journal = getattr(editor, 'journal', None)
+        return journal.mark() if journal is not None else None
+    
+    def saved(self, editor, file_path, digest, mark):
+        """Compact an editor's journal after its contents were saved to file_path"""
+        journal = getattr(editor, 'journal', None)
+        if journal is not None and journal.file_path == file_path and mark is not None:
+            journal.compact(digest, mark)
+        else:
+            # First save of a new file, or Save As to a different path
+            self.attach(editor, file_path, digest)
+    
+    def flush(self):
+        for journal in self.journals:
+            try:
+                journal.flush()
+            except OSError as e:
+                print(f"Error writing edit journal: {e}")
+    
+    def close(self):
+        """Flush everything; journals without edits are removed"""
+        for journal in list(self.journals):
+            journal.flush()
+            if not journal.records:
+                try:
+                    os.remove(journal.journal_path)
+                except OSError:
+                    pass
+        self.journals = []
+    
+    def recover(self):
+        """Return {file_path: (base_digest, records, journal_path)} for journals holding edits"""
+        recovered = {}
+        if not os.path.isdir(self.directory):
+            return recovered
+        
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith('.journal'):
+                continue
+            try:
+                header, records = EditJournal.load(entry.path)
+            except (OSError, ValueError) as e:
+                print(f"Error reading edit journal {entry.name}: {e}")
+                continue
+            if not records:
+                os.remove(entry.path)
+                continue
+            recovered[header['path']] = (bytes.fromhex(header['base']), records, entry.path)
+        return recovered
+    
+    def _connect(self, editor, journal):
+        document = editor.document()
+        journal.length = document.characterCount() - 1
+        
+        def on_contents_change(position, removed, added):
+            self._on_contents_change(document, journal, position, removed, added)
+        
+        editor.journal = journal
+        editor.journal_slot = on_contents_change
+        document.contentsChange.connect(on_contents_change)
+    
+    @staticmethod
+    def _disconnect(editor):
+        try:
+            editor.document().contentsChange.disconnect(editor.journal_slot)
+        except (RuntimeError, TypeError, AttributeError):
+            # Deleted editors and hibernated tabs have nothing connected
+            pass
+        editor.journal = None
+    
+    def _on_contents_change(self, document, journal, position, removed, added):
+        # Qt counts the implicit final paragraph separator in whole-document changes
+        removed = min(removed, journal.length - position)
+        added = min(added, document.characterCount() - 1 - position)
+        journal.length += added - removed
+        if not removed and not added:
+            return
+        
+        text = ''
+        if added:
+            cursor = QTextCursor(document)
+            cursor.setPosition(position)
+            cursor.setPosition(position + added, QTextCursor.KeepAnchor)
+            text = cursor.selectedText().replace('\u2029', '\n')
+        journal.record(position, removed, text)
+        
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+class HibernatedTab(QWidget):
+    """Stand-in for a tab whose editor was released by TabHibernator.
+    
+    Keeps the text zlib-compressed, in memory or spilled to an anonymous
+    temp file when large, along with the cursor, scroll position, modified
+    flag, font and suspended edit journal needed to rebuild the editor.
+    """
+    
+    SPILL_BYTES = 1024 * 1024
+    
+    def __init__(self, editor, journal, parent=None):
+        super().__init__(parent)
+        document = editor.document()
+        self.setProperty("file_path", editor.property("file_path"))
+        self.setFont(editor.font())
+        self.tab_stop_distance = editor.tabStopDistance()
+        cursor = editor.textCursor()
+        self.anchor = cursor.anchor()
+        self.position = cursor.position()
+        self.scroll = editor.verticalScrollBar().value()
+        self.modified = document.isModified()
+        self.char_count = document.characterCount() - 1
+        self.journal = journal
+        
+        compressor = zlib.compressobj(1)
+        parts = [
+            compressor.compress(chunk.encode('utf-8', errors='surrogatepass')) 
+            for chunk in document_text_chunks(document)
+        ]
+        parts.append(compressor.flush())
+        self.compressed = b''.join(parts)
+        self.spill = None
+        if len(self.compressed) >= self.SPILL_BYTES:
+            self.spill = tempfile.TemporaryFile(prefix='noteism-tab-')
+            self.spill.write(self.compressed)
+            self.compressed = None
+    
+    def text(self):
+        if self.spill is not None:
+            self.spill.seek(0)
+            data = self.spill.read()
+        else:
+            data = self.compressed
+        return zlib.decompress(data).decode('utf-8', errors='surrogatepass')
+    
+    def release(self):
+        if self.spill is not None:
+            self.spill.close()
+            self.spill = None
+        self.compressed = None
+
+class TabHibernator(QObject):
+    """Release the editors of background tabs that are idle or least recently used.
+    
+    An editor's footprint is estimated from its document's size. Whenever
+    the total exceeds the budget, background tabs are hibernated least
+    recently used first until it fits; tabs idle for longer than the idle
+    limit are hibernated regardless. Tabs with unsaved edits are left live
+    until auto-save has written them. A hibernated tab is rebuilt when it
+    is activated. Its undo history is not kept.
+    """
+    
+    # Text, layout and highlight formats per character, and per-block overhead, roughly
+    BYTES_PER_CHAR = 8
+    BYTES_PER_BLOCK = 256
+    CHECK_INTERVAL_MS = 60 * 1000
+    
+    def __init__(self, editor_tabs, create_editor, journal_manager, parent=None):
+        super().__init__(parent)
+        self.editor_tabs = editor_tabs
+        self.create_editor = create_editor
+        self.journal_manager = journal_manager
+        self.budget_bytes = 512 * 1024 * 1024
+        self.idle_seconds = 0
+        self.current = None
+        # Set while tabs are swapped, so the resulting tab changes are ignored
+        self.swapping = False
+        
+        self.enforce_timer = QTimer(self)
+        self.enforce_timer.setSingleShot(True)
+        self.enforce_timer.setInterval(0)
+        self.enforce_timer.timeout.connect(self.enforce)
+        
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setInterval(self.CHECK_INTERVAL_MS)
+        self.idle_timer.timeout.connect(self.enforce)
+    
+    def set_budget(self, megabytes):
+        """Keep live editors under roughly this many MB; 0 disables the budget"""
+        self.budget_bytes = megabytes * 1024 * 1024
+        self.enforce_timer.start()
+    
+    def set_idle_minutes(self, minutes):
+        """Hibernate tabs unused for this many minutes; 0 disables it"""
+        self.idle_seconds = minutes * 60
+        if minutes > 0:
+            self.idle_timer.start()
+        else:
+            self.idle_timer.stop()
+    
+    def activate(self, index):
+        """Rebuild the tab at index if it is hibernated, and note when the previous tab was left"""
+        if self.swapping:
+            return
+        if isinstance(self.editor_tabs.widget(index), HibernatedTab):
+            self.restore(index)
+        now = time.monotonic()
+        if self.current is not None:
+            try:
+                self.current.last_active = now
+            except RuntimeError:
+                pass
+        self.current = self.editor_tabs.widget(index)
+        if self.current is not None:
+            self.current.last_active = now
+        self.enforce_timer.start()
+    
+    def footprint(self, editor):
+        document = editor.document()
+        return document.characterCount() * self.BYTES_PER_CHAR + document.blockCount() * self.BYTES_PER_BLOCK
+    
+    def enforce(self):
+        live = [
+            self.editor_tabs.widget(i) for i in range(self.editor_tabs.count()) 
+            if isinstance(self.editor_tabs.widget(i), QPlainTextEdit)
+        ]
+        total = sum(self.footprint(editor) for editor in live)
+        current = self.editor_tabs.currentWidget()
+        candidates = sorted(
+            (editor for editor in live if editor is not current and self._can_hibernate(editor)), 
+            key=lambda editor: getattr(editor, 'last_active', 0)
+        )
+        
+        now = time.monotonic()
+        for editor in candidates:
+            idle = self.idle_seconds and now - getattr(editor, 'last_active', 0) >= self.idle_seconds
+            if not idle and (not self.budget_bytes or total <= self.budget_bytes):
+                continue
+            total -= self.footprint(editor)
+            self.hibernate(self.editor_tabs.indexOf(editor))
+    
+    def hibernate(self, index):
+        """Replace the editor at index with a HibernatedTab and release it"""
+        editor = self.editor_tabs.widget(index)
+        journal = self.journal_manager.suspend(editor)
+        placeholder = HibernatedTab(editor, journal)
+        self._swap(index, placeholder)
+        editor.deleteLater()
+    
+    def restore(self, index):
+        """Rebuild the editor of the hibernated tab at index"""
+        placeholder = self.editor_tabs.widget(index)
+        editor = self.create_editor(placeholder.property("file_path"))
+        editor.setFont(placeholder.font())
+        editor.setTabStopDistance(placeholder.tab_stop_distance)
+        editor.highlight_scheduler.configure_for_size(placeholder.char_count)
+        editor.setPlainText(placeholder.text())
+        document = editor.document()
+        document.setModified(placeholder.modified)
+        
+        cursor = QTextCursor(document)
+        cursor.setPosition(min(placeholder.anchor, placeholder.char_count))
+        cursor.setPosition(min(placeholder.position, placeholder.char_count), QTextCursor.KeepAnchor)
+        editor.setTextCursor(cursor)
+        if placeholder.journal is not None:
+            self.journal_manager.resume(editor, placeholder.journal)
+        
+        self._swap(index, editor)
+        # Scroll once the editor has been laid out
+        scroll = placeholder.scroll
+        QTimer.singleShot(0, lambda: editor.verticalScrollBar().setValue(scroll))
+        placeholder.release()
+        placeholder.deleteLater()
+    
+    def _can_hibernate(self, editor):
+        # Editors still loading, with a save in flight, or with unsaved edits are left alone;
+        # AutoSaveEngine only writes live editors
+        return (
+            not editor.isReadOnly() 
+            and not getattr(editor, 'saves_in_flight', 0) 
+            and not editor.document().isModified()
+        )
+    
+    def _swap(self, index, widget):
+        tabs = self.editor_tabs
+        text = tabs.tabText(index)
+        tool_tip = tabs.tabToolTip(index)
+        current = tabs.currentIndex() == index
+        self.swapping = True
+        try:
+            tabs.insertTab(index, widget, text)
+            tabs.setTabToolTip(index, tool_tip)
+            if current:
+                tabs.setCurrentIndex(index)
+            tabs.removeTab(index + 1)
+        finally:
+            self.swapping = False
+
+class UnloadedTab(QWidget):
+    """Stand-in for a restored session tab; its file is read on first activation"""
+    
+    def __init__(self, file_path, view_state, text=None, parent=None):
+        super().__init__(parent)
+        self.setProperty("file_path", file_path)
+        self.view_state = view_state
+        # Contents of an untitled tab, kept in the session itself
+        self.text = text
+
+class SessionManager(QObject):
+    """Persist the open tabs to a session file so the next start can reopen them.
+    
+    The session (tab order, paths, cursor and scroll positions, current
+    tab, and the text of untitled tabs) is written a second after the last
+    tab, cursor, scroll or text change, through the file I/O service and
+    only when it differs from the last write. Unsaved edits to files are
+    already covered by their edit journals.
+    """
+    
+    VERSION = 1
+    SAVE_DELAY_MS = 1000
+    
+    def __init__(self, session_path, editor_tabs, file_io, parent=None):
+        super().__init__(parent)
+        self.session_path = session_path
+        self.editor_tabs = editor_tabs
+        self.file_io = file_io
+        self.last_saved = None
+        
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(self.SAVE_DELAY_MS)
+        self.save_timer.timeout.connect(self.save)
+        
+        editor_tabs.currentChanged.connect(self.schedule_save)
+        editor_tabs.tabCloseRequested.connect(self.schedule_save)
+        editor_tabs.tabBar().tabMoved.connect(self.schedule_save)
+    
+    def schedule_save(self, *args):
+        self.save_timer.start()
+    
+    def watch(self, widget):
+        """Save the session when a tab's cursor, scroll position or text changes"""
+        widget.verticalScrollBar().valueChanged.connect(self.schedule_save)
+        if isinstance(widget, QPlainTextEdit):
+            widget.cursorPositionChanged.connect(self.schedule_save)
+            widget.textChanged.connect(self.schedule_save)
+    
+    def load(self):
+        """Return the saved session as a dict, or None if there is none"""
+        try:
+            with open(self.session_path, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if session.get('version') != self.VERSION:
+            return None
+        return session
+    
+    def save(self):
+        self.save_timer.stop()
+        tabs = []
+        current = 0
+        for i in range(self.editor_tabs.count()):
+            state = self._tab_state(self.editor_tabs.widget(i))
+            if state is None:
+                continue
+            if i == self.editor_tabs.currentIndex():
+                current = len(tabs)
+            tabs.append(state)
+        text = json.dumps({'version': self.VERSION, 'tabs': tabs, 'current': current}, ensure_ascii=False)
+        if text == self.last_saved:
+            return
+        self.last_saved = text
+        os.makedirs(os.path.dirname(self.session_path), exist_ok=True)
+        self.file_io.write(
+            self.session_path, 
+            [text], 
+            on_error=lambda message: print(f"Error saving session: {message}")
+        )
+    
+    @staticmethod
+    def _tab_state(widget):
+        """Return a tab's saved state, or None for empty untitled tabs"""
+        if isinstance(widget, UnloadedTab):
+            state = dict(widget.view_state)
+            if widget.text:
+                state['text'] = widget.text
+            return state
+        
+        file_path = widget.property("file_path")
+        state = {'path': file_path}
+        if isinstance(widget, HibernatedTab):
+            state.update(anchor=widget.anchor, position=widget.position, scroll=widget.scroll)
+            text = widget.text() if not file_path else None
+        elif isinstance(widget, QPlainTextEdit):
+            cursor = widget.textCursor()
+            state.update(
+                anchor=cursor.anchor(), 
+                position=cursor.position(), 
+                scroll=widget.verticalScrollBar().value()
+            )
+            text = widget.toPlainText() if not file_path else None
+        else:
+            state['scroll'] = widget.verticalScrollBar().value()
+            text = None
+        
+        if not file_path:
+            if not text:
+                return None
+            state['text'] = text
+        return state
+
+class LargeFileViewer(QAbstractScrollArea):
+    """Read-only view of a memory-mapped file that decodes only visible rows.
+    
+    The scroll bar works in byte offsets instead of line numbers, so no line
+    index is built: a scroll position is snapped back to the start of its row
+    with a bounded rfind. Rows longer than MAX_LINE_BYTES are wrapped, which
+    keeps every scroll and paint proportional to the viewport, not the file.
+    """
+    
+    MAX_LINE_BYTES = 4096
+    
+    def __init__(self, file_path, parent=None):
+        super().__init__(parent)
+        self.setProperty("file_path", file_path)
+        self.file = open(file_path, 'rb')
+        try:
+            self.mapped = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+        
+        self.size = len(self.mapped)
+        self.top = 0
+        # Scroll bar values are 32-bit, so very large files scroll in coarser units
+        self.scale = max(1, self.size // (1 << 30))
+        
+        sample = self.mapped[:64 * 1024]
+        self.average_line = min(
+            self.MAX_LINE_BYTES, 
+            max(1, len(sample) // (sample.count(b'\n') + 1))
+        )
+        
+        self.setFont(QFont("Fira Code", 10))
+        self.verticalScrollBar().setSingleStep(max(1, self.average_line // self.scale))
+        self._update_scroll_range()
+    
+    def release(self):
+        """Unmap the file; call before the viewer is discarded"""
+        if not self.mapped.closed:
+            self.mapped.close()
+            self.file.close()
+    
+    def _row_bounds(self, offset):
+        """Return (end, next_start) byte offsets of the row starting at offset"""
+        limit = min(self.size, offset + self.MAX_LINE_BYTES)
+        newline = self.mapped.find(b'\n', offset, limit)
+        if newline < 0:
+            return limit, limit
+        return newline, newline + 1
+    
+    def _row_start(self, offset):
+        """Snap a byte offset back to the start of its row"""
+        floor = max(0, offset - self.MAX_LINE_BYTES)
+        newline = self.mapped.rfind(b'\n', floor, offset)
+        if newline >= 0:
+            return newline + 1
+        return 0 if floor == 0 else offset
+    
+    def _visible_rows(self):
+        return max(1, self.viewport().height() // self.fontMetrics().lineSpacing())
+    
+    def _update_scroll_range(self):
+        # Stop scrolling once the last screenful of rows is in view
+        rows = self._visible_rows()
+        offset = self.size
+        for _ in range(rows):
+            if offset == 0:
+                break
+            offset = self._row_start(offset - 1)
+        
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.setRange(0, offset // self.scale)
+        scroll_bar.setPageStep(max(1, rows * self.average_line // self.scale))
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scroll_range()
+    
+    def scrollContentsBy(self, dx, dy):
+        target = self._row_start(min(self.size, self.verticalScrollBar().value() * self.scale))
+        if dy < 0 and target <= self.top and self.top < self.size:
+            # Scrolling down inside a long row; step past it instead of snapping back
+            target = self._row_bounds(self.top)[1]
+        self.top = target
+        self.viewport().update()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.fillRect(self.viewport().rect(), QColor(NeonPalette.BACKGROUND_DARK))
+        if self.mapped.closed:
+            return
+        
+        painter.setPen(QColor(NeonPalette.TEXT_COLOR))
+        metrics = self.fontMetrics()
+        height = self.viewport().height()
+        y = metrics.ascent() + 4
+        offset = self.top
+        while y - metrics.ascent() < height and offset < self.size:
+            end, next_start = self._row_bounds(offset)
+            text = self.mapped[offset:end].decode('utf-8', errors='replace')
+            painter.drawText(10, y, text.rstrip('\r').expandtabs(4))
+            y += metrics.lineSpacing()
+            offset = next_start
 
 class MarkdownToolbar:
     @staticmethod
@@ -323,75 +1940,687 @@ class MarkdownToolbar:
         
         dialog.exec_()
     
-    @classmethod
-    def insert_horizontal_rule(cls, text_edit):
-        """Insert a horizontal rule"""
-        cursor = text_edit.textCursor()
-        cursor.insertText("\n\n---\n\n")
-        text_edit.setTextCursor(cursor)
+    @classmethod
+    def insert_horizontal_rule(cls, text_edit):
+        """Insert a horizontal rule"""
+        cursor = text_edit.textCursor()
+        cursor.insertText("\n\n---\n\n")
+        text_edit.setTextCursor(cursor)
+    
+    @classmethod
+    def insert_blockquote(cls, text_edit):
+        """Insert a blockquote"""
+        dialog = QDialog()
+        dialog.setWindowTitle("Insert Blockquote")
+        layout = QFormLayout()
+        
+        quote_input = QTextEdit()
+        quote_input.setPlaceholderText("Enter blockquote text")
+        
+        layout.addRow("Blockquote:", quote_input)
+        
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
+        )
+        layout.addRow(buttons)
+        
+        dialog.setLayout(layout)
+        
+        def insert_blockquote():
+            quote_text = quote_input.toPlainText()
+            if quote_text:
+                # Prefix each line with '>'
+                blockquote = "\n".join([f"> {line}" for line in quote_text.split('\n')])
+                
+                # Insert blockquote
+                cursor = text_edit.textCursor()
+                cursor.insertText(f"\n\n{blockquote}\n\n")
+                text_edit.setTextCursor(cursor)
+                
+                dialog.accept()
+        
+        buttons.accepted.connect(insert_blockquote)
+        buttons.rejected.connect(dialog.reject)
+        
+        dialog.exec_()
+
+class DirectoryScanner(QObject):
+    """List directories on worker threads and report entries in batches.
+    
+    Entries are (name, path, is_dir, key, size, mtime). Only subdirectories
+    and markdown files are reported. Version control, dependency and hidden
+    directories are skipped, and every directory carries its (device, inode)
+    key so callers can detect symlink cycles.
+    """
+    batch_ready = pyqtSignal(int, object)
+    finished = pyqtSignal(int)
+    failed = pyqtSignal(int, str)
+    
+    BATCH_SIZE = 256
+    SKIPPED_DIRECTORIES = {
+        '.git', '.hg', '.svn', 'node_modules', '__pycache__', 
+        '.venv', 'venv', '.noteism'
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.next_scan_id = 0
+        # Scans started before the last cancel_all() stop early
+        self.generation = 0
+        
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(2)
+    
+    def scan(self, path):
+        """List path in the background and return the scan id used in signals"""
+        self.next_scan_id += 1
+        scan_id = self.next_scan_id
+        generation = self.generation
+        self.thread_pool.start(FileIoTask(lambda: self._scan(scan_id, generation, path)))
+        return scan_id
+    
+    def cancel_all(self):
+        """Stop reporting results for scans already started"""
+        self.generation += 1
+    
+    @classmethod
+    def is_skipped(cls, name):
+        return name in cls.SKIPPED_DIRECTORIES or name.startswith('.')
+    
+    @staticmethod
+    def inode_key(path):
+        stat = os.stat(path)
+        return stat.st_dev, stat.st_ino
+    
+    def _scan(self, scan_id, generation, path):
+        batch = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if generation != self.generation:
+                        return
+                    try:
+                        if entry.is_dir():
+                            if self.is_skipped(entry.name):
+                                continue
+                            # stat() follows symlinks, so a linked directory gets its target's key
+                            stat = entry.stat()
+                            batch.append((
+                                entry.name, entry.path, True, (stat.st_dev, stat.st_ino), 0, stat.st_mtime
+                            ))
+                        elif entry.is_file() and entry.name.lower().endswith('.md'):
+                            stat = entry.stat()
+                            batch.append((entry.name, entry.path, False, None, stat.st_size, stat.st_mtime))
+                    except OSError:
+                        # Broken symlink or entry removed mid-scan
+                        continue
+                    
+                    if len(batch) >= self.BATCH_SIZE:
+                        self.batch_ready.emit(scan_id, batch)
+                        batch = []
+        except OSError as e:
+            self.failed.emit(scan_id, str(e))
+            return
+        
+        if generation == self.generation:
+            self.batch_ready.emit(scan_id, batch)
+            self.finished.emit(scan_id)
+
+def iter_note_files(directory, recursive=True):
+    """Yield the markdown files under directory, skipping the folders DirectoryScanner skips"""
+    for dir_path, dir_names, file_names in os.walk(directory):
+        dir_names[:] = [name for name in dir_names if not DirectoryScanner.is_skipped(name)]
+        for name in file_names:
+            if name.lower().endswith('.md'):
+                yield os.path.join(dir_path, name)
+        if not recursive:
+            return
+
+def workspace_relative(root, path):
+    """Return path relative to root with '/' separators, '' for root itself, or None outside it"""
+    relative = os.path.relpath(os.path.normpath(path), root)
+    if relative == os.curdir:
+        return ''
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        return None
+    return relative.replace(os.sep, '/')
+
+def workspace_absolute(root, relative):
+    return os.path.join(root, *relative.split('/'))
+
+class FileNodeTable:
+    """Array-backed storage for explorer entries.
+    
+    A node id indexes parallel arrays, so an entry costs a few dozen bytes
+    instead of a widget item. Directories keep their full path and an
+    ordered list of child ids; a file's path is its parent's path plus
+    its name, so every path is available without walking up the tree.
+    """
+    FILE, DIRECTORY, LINK_CYCLE = 0, 1, 2
+    UNLISTED, LISTING, LISTED, UNREADABLE = 0, 1, 2, 3
+    
+    def __init__(self):
+        self.parents = array('i')
+        self.rows = array('i')
+        self.kinds = array('b')
+        self.states = array('b')
+        self.sizes = array('q')
+        self.mtimes = array('d')
+        self.names = []
+        # Only directories have entries in these
+        self.children = {}
+        self.paths = {}
+        self.keys = {}
+        self.free = []
+        
+        # Node 0 is the invisible parent of the root directory
+        self.add(0, '', self.DIRECTORY, 0, 0.0, path='')
+        self.states[0] = self.LISTED
+        self.children[0] = []
+    
+    def __len__(self):
+        return len(self.names) - len(self.free)
+    
+    def add(self, parent, name, kind, size, mtime, path=None, key=None):
+        """Store a new entry under parent and return its node id"""
+        name = sys.intern(name)
+        if self.free:
+            node = self.free.pop()
+            self.parents[node] = parent
+            self.rows[node] = 0
+            self.kinds[node] = kind
+            self.states[node] = self.UNLISTED
+            self.sizes[node] = size
+            self.mtimes[node] = mtime
+            self.names[node] = name
+        else:
+            node = len(self.names)
+            self.parents.append(parent)
+            self.rows.append(0)
+            self.kinds.append(kind)
+            self.states.append(self.UNLISTED)
+            self.sizes.append(size)
+            self.mtimes.append(mtime)
+            self.names.append(name)
+        
+        if kind != self.FILE:
+            self.paths[node] = path if path is not None else os.path.join(self.paths[parent], name)
+        if key is not None:
+            self.keys[node] = key
+        return node
+    
+    def remove(self, node):
+        """Free node and all of its descendants"""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            stack.extend(self.children.pop(current, ()))
+            self.paths.pop(current, None)
+            self.keys.pop(current, None)
+            self.names[current] = None
+            self.free.append(current)
+    
+    def is_alive(self, node):
+        return node < len(self.names) and self.names[node] is not None
+    
+    def path(self, node):
+        path = self.paths.get(node)
+        if path is None:
+            path = os.path.join(self.paths[self.parents[node]], self.names[node])
+        return path
+    
+    def renumber(self, parent, start=0):
+        """Refresh the stored rows of parent's children from start onwards"""
+        children = self.children[parent]
+        for row in range(start, len(children)):
+            self.rows[children[row]] = row
+
+class FileTreeModel(QAbstractItemModel):
+    """Lazy directory tree over a FileNodeTable.
+    
+    Directories are listed in the background the first time a view
+    fetches them, then watched and re-listed when their entries change.
+    Sorting reorders the stored child lists and never touches the disk.
+    """
+    directory_changed = pyqtSignal(str)
+    
+    COLUMNS = ["Name", "Type", "Size", "Modified"]
+    NAME_COLUMN, TYPE_COLUMN, SIZE_COLUMN, MODIFIED_COLUMN = range(4)
+    PATH_ROLE = Qt.UserRole
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.table = FileNodeTable()
+        # Optional MetadataStore used for file tooltips
+        self.metadata_store = None
+        self.sort_column = self.NAME_COLUMN
+        self.sort_order = Qt.AscendingOrder
+        
+        self.scanner = DirectoryScanner(self)
+        self.scanner.batch_ready.connect(self._on_scan_batch)
+        self.scanner.finished.connect(self._on_scan_finished)
+        self.scanner.failed.connect(self._on_scan_failed)
+        # scan id -> (node, path, entries collected so far)
+        self.pending_scans = {}
+        
+        # Listed directories are watched and re-listed when their entries change
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self._on_directory_changed)
+        self.directory_nodes = {}
+        self.dirty_directories = set()
+        
+        # Coalesce bursts of changes such as a git checkout
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(200)
+        self.refresh_timer.timeout.connect(self._refresh_dirty_directories)
+    
+    def set_root(self, root_path):
+        """Show root_path as the single top-level directory"""
+        # Watcher notifications and stored paths must use the same spelling
+        root_path = os.path.normpath(root_path)
+        self.scanner.cancel_all()
+        self.pending_scans = {}
+        self.dirty_directories = set()
+        if self.watcher.directories():
+            self.watcher.removePaths(self.watcher.directories())
+        self.directory_nodes = {}
+        
+        self.beginResetModel()
+        self.table = FileNodeTable()
+        try:
+            stat = os.stat(root_path)
+            key, mtime = (stat.st_dev, stat.st_ino), stat.st_mtime
+        except OSError as e:
+            print(f"Error populating markdown tree: {e}")
+            key, mtime = None, 0.0
+        root = self.table.add(
+            0, os.path.basename(root_path), FileNodeTable.DIRECTORY, 0, mtime, path=root_path, key=key
+        )
+        self.table.children[0].append(root)
+        self.endResetModel()
+    
+    def node(self, index):
+        return index.internalId() if index.isValid() else 0
+    
+    def node_index(self, node, column=0):
+        if node == 0:
+            return QModelIndex()
+        return self.createIndex(self.table.rows[node], column, node)
+    
+    def file_path(self, index):
+        """Return the full path of the entry at index, or None"""
+        if not index.isValid():
+            return None
+        return self.table.path(self.node(index))
+    
+    def is_directory(self, index):
+        return index.isValid() and self.table.kinds[self.node(index)] != FileNodeTable.FILE
+    
+    # Qt model interface
+    
+    def index(self, row, column, parent=QModelIndex()):
+        children = self.table.children.get(self.node(parent))
+        if children is None or not 0 <= row < len(children) or not 0 <= column < len(self.COLUMNS):
+            return QModelIndex()
+        return self.createIndex(row, column, children[row])
+    
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self.node_index(self.table.parents[self.node(index)])
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        return len(self.table.children.get(self.node(parent), ()))
+    
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.COLUMNS)
+    
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        if self.table.kinds[node] != FileNodeTable.DIRECTORY:
+            return False
+        if self.table.states[node] in (FileNodeTable.UNLISTED, FileNodeTable.LISTING):
+            # Show an expand arrow until the listing says otherwise
+            return True
+        return bool(self.table.children.get(node))
+    
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        return (
+            self.table.kinds[node] == FileNodeTable.DIRECTORY 
+            and self.table.states[node] == FileNodeTable.UNLISTED
+        )
+    
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        node = self.node(parent)
+        self.table.states[node] = FileNodeTable.LISTING
+        path = self.table.path(node)
+        self.pending_scans[self.scanner.scan(path)] = (node, path, [])
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = self.node(index)
+        table = self.table
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            kind = table.kinds[node]
+            if column == self.NAME_COLUMN:
+                return table.names[node]
+            if column == self.TYPE_COLUMN:
+                if kind == FileNodeTable.FILE:
+                    return "Markdown"
+                if kind == FileNodeTable.LINK_CYCLE:
+                    return "Directory (link cycle)"
+                if table.states[node] == FileNodeTable.UNREADABLE:
+                    return "Directory (unreadable)"
+                return "Directory"
+            if column == self.SIZE_COLUMN:
+                if kind != FileNodeTable.FILE:
+                    return ""
+                size = table.sizes[node]
+                return f"{size} B" if size < 1024 else f"{size / 1024:.1f} KB"
+            if column == self.MODIFIED_COLUMN:
+                mtime = table.mtimes[node]
+                return time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime)) if mtime else ""
+        elif role == Qt.TextAlignmentRole and column == self.SIZE_COLUMN:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        elif role == Qt.ToolTipRole and table.kinds[node] == FileNodeTable.FILE:
+            # Cached facts, so hovering never reads the note itself
+            facts = self.metadata_store.note(table.path(node)) if self.metadata_store is not None else None
+            if facts is None:
+                return table.path(node)
+            return (
+                f"{facts['title']}\n{facts['word_count']} words, {len(facts['headings'])} headings"
+                + (f"\nTags: {', '.join(facts['tags'])}" if facts['tags'] else "")
+            )
+        elif role == self.PATH_ROLE:
+            return table.path(node)
+        return None
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Reorder every listed directory by column"""
+        self.sort_column = column
+        self.sort_order = order
+        self._reorder(list(self.table.children))
+    
+    # Sorting
     
-    @classmethod
-    def insert_blockquote(cls, text_edit):
-        """Insert a blockquote"""
-        dialog = QDialog()
-        dialog.setWindowTitle("Insert Blockquote")
-        layout = QFormLayout()
-        
-        quote_input = QTextEdit()
-        quote_input.setPlaceholderText("Enter blockquote text")
-        
-        layout.addRow("Blockquote:", quote_input)
-        
-        buttons = QDialogButtonBox(
-            QDialogButtonBox.Ok | QDialogButtonBox.Cancel
-        )
-        layout.addRow(buttons)
-        
-        dialog.setLayout(layout)
+    def _sorted(self, children):
+        """Return children in display order: directories first, then by the sort column"""
+        table = self.table
+        names = table.names
+        descending = self.sort_order == Qt.DescendingOrder
+        ordered = sorted(children, key=lambda node: names[node].lower(), reverse=descending)
+        if self.sort_column == self.SIZE_COLUMN:
+            ordered.sort(key=table.sizes.__getitem__, reverse=descending)
+        elif self.sort_column == self.MODIFIED_COLUMN:
+            ordered.sort(key=table.mtimes.__getitem__, reverse=descending)
+        # Stable, so each group keeps the order above
+        ordered.sort(key=lambda node: table.kinds[node] == FileNodeTable.FILE)
+        return ordered
+    
+    def _reorder(self, parents):
+        """Sort the children of each parent, keeping persistent indexes valid"""
+        table = self.table
+        changed = []
+        for parent in parents:
+            children = table.children.get(parent)
+            if children and len(children) > 1:
+                ordered = self._sorted(children)
+                if ordered != children:
+                    changed.append((parent, ordered))
+        if not changed:
+            return
         
-        def insert_blockquote():
-            quote_text = quote_input.toPlainText()
-            if quote_text:
-                # Prefix each line with '>'
-                blockquote = "\n".join([f"> {line}" for line in quote_text.split('\n')])
-                
-                # Insert blockquote
-                cursor = text_edit.textCursor()
-                cursor.insertText(f"\n\n{blockquote}\n\n")
-                text_edit.setTextCursor(cursor)
-                
-                dialog.accept()
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        for parent, ordered in changed:
+            table.children[parent] = ordered
+            table.renumber(parent)
+        new_indexes = [self.node_index(index.internalId(), index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+    
+    # Listing
+    
+    def _has_ancestor_key(self, node, key):
+        """True if node or one of its ancestors is the directory with this inode key"""
+        while node:
+            if self.table.keys.get(node) == key:
+                return True
+            node = self.table.parents[node]
+        return False
+    
+    def _on_scan_batch(self, scan_id, entries):
+        pending = self.pending_scans.get(scan_id)
+        if pending is not None:
+            # Listings are applied once complete so they can be diffed and sorted
+            pending[2].extend(entries)
+    
+    def _on_scan_finished(self, scan_id):
+        pending = self.pending_scans.pop(scan_id, None)
+        if pending is None:
+            return
+        node, path, entries = pending
+        if not self.table.is_alive(node):
+            return
+        if self.table.path(node) != path:
+            # Renamed while listing; list it again under the new path when next fetched
+            if self.table.states[node] == FileNodeTable.LISTING:
+                self.table.states[node] = FileNodeTable.UNLISTED
+            return
         
-        buttons.accepted.connect(insert_blockquote)
-        buttons.rejected.connect(dialog.reject)
+        first_listing = self.table.states[node] != FileNodeTable.LISTED
+        self.table.states[node] = FileNodeTable.LISTED
+        self.table.children.setdefault(node, [])
+        self._apply_listing(node, entries)
+        if first_listing:
+            self._watch(node)
+            if not self.table.children[node]:
+                # The expand arrow goes away
+                index = self.node_index(node)
+                self.dataChanged.emit(index, index)
+    
+    def _on_scan_failed(self, scan_id, message):
+        pending = self.pending_scans.pop(scan_id, None)
+        if pending is None:
+            return
+        node, path, entries = pending
+        if not self.table.is_alive(node) or self.table.states[node] != FileNodeTable.LISTING:
+            # A vanished directory is removed by its parent's refresh
+            return
+        print(f"Error populating markdown tree: {message}")
+        self.table.states[node] = FileNodeTable.UNREADABLE
+        index = self.node_index(node, self.TYPE_COLUMN)
+        self.dataChanged.emit(index, index)
+    
+    def _apply_listing(self, parent, entries):
+        """Update a directory's children to match a fresh listing"""
+        table = self.table
+        children = table.children[parent]
+        existing = {table.names[child]: child for child in children}
+        listed = {entry[0]: entry for entry in entries}
+        
+        removed = {
+            child for name, child in existing.items() 
+            if name not in listed or listed[name][2] != (table.kinds[child] != FileNodeTable.FILE)
+        }
+        added = [entry for name, entry in listed.items() if name not in existing or existing[name] in removed]
+        
+        # A directory that disappeared under one name and appeared under another was renamed
+        added_by_key = {entry[3]: entry for entry in added if entry[2]}
+        for child in list(removed):
+            key = table.keys.get(child)
+            entry = added_by_key.pop(key, None) if key is not None else None
+            if entry is not None:
+                removed.discard(child)
+                added.remove(entry)
+                table.names[child] = sys.intern(entry[0])
+                self._rebase(child, entry[1])
+                index = self.node_index(child)
+                self.dataChanged.emit(index, index)
+        
+        # Sizes and times of entries that stayed
+        for name, child in existing.items():
+            if child in removed or name not in listed:
+                continue
+            size, mtime = listed[name][4:6]
+            if table.sizes[child] != size or table.mtimes[child] != mtime:
+                table.sizes[child] = size
+                table.mtimes[child] = mtime
+                self.dataChanged.emit(
+                    self.node_index(child, self.SIZE_COLUMN), 
+                    self.node_index(child, self.MODIFIED_COLUMN)
+                )
         
-        dialog.exec_()
+        if removed:
+            self._remove_children(parent, removed)
+        
+        if added:
+            parent_index = self.node_index(parent)
+            first = len(children)
+            self.beginInsertRows(parent_index, first, first + len(added) - 1)
+            for name, path, is_dir, key, size, mtime in added:
+                kind = FileNodeTable.FILE
+                if is_dir:
+                    # A symlink back to an ancestor is shown but never expanded
+                    kind = FileNodeTable.LINK_CYCLE if self._has_ancestor_key(parent, key) else FileNodeTable.DIRECTORY
+                node = table.add(parent, name, kind, size, mtime, key=key if kind == FileNodeTable.DIRECTORY else None)
+                table.rows[node] = len(children)
+                children.append(node)
+            self.endInsertRows()
+        
+        self._reorder([parent])
+    
+    def _remove_children(self, parent, removed):
+        """Remove a set of parent's children in contiguous row runs"""
+        table = self.table
+        children = table.children[parent]
+        parent_index = self.node_index(parent)
+        rows = sorted((table.rows[child] for child in removed), reverse=True)
+        
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.beginRemoveRows(parent_index, first, last)
+            gone = children[first:last + 1]
+            del children[first:last + 1]
+            table.renumber(parent, first)
+            self.endRemoveRows()
+            for child in gone:
+                self._forget(child)
+                table.remove(child)
+    
+    # Watching
+    
+    def _watch(self, node):
+        path = self.table.path(node)
+        self.directory_nodes[path] = node
+        if not self.watcher.addPath(path):
+            print(f"Could not watch directory: {path}")
+    
+    def _forget(self, node):
+        """Stop watching a removed node's listed directories"""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            path = self.table.paths.get(current)
+            if path is not None and self.directory_nodes.get(path) == current:
+                del self.directory_nodes[path]
+                self.watcher.removePath(path)
+            stack.extend(self.table.children.get(current, ()))
+    
+    def _rebase(self, node, path):
+        """Point a renamed directory and its descendant directories at a new path"""
+        table = self.table
+        old_path = table.paths[node]
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            current_path = table.paths.get(current)
+            if current_path is None:
+                continue
+            if self.directory_nodes.get(current_path) == current:
+                del self.directory_nodes[current_path]
+                self.watcher.removePath(current_path)
+                table.paths[current] = path + current_path[len(old_path):]
+                self._watch(current)
+            else:
+                table.paths[current] = path + current_path[len(old_path):]
+            stack.extend(table.children.get(current, ()))
+    
+    def _on_directory_changed(self, path):
+        self.dirty_directories.add(path)
+        self.refresh_timer.start()
+    
+    def refresh_directory(self, path):
+        """Re-list one directory now, e.g. after the explorer itself changed it"""
+        self.dirty_directories.add(os.path.normpath(path))
+        self._refresh_dirty_directories()
+    
+    def _refresh_dirty_directories(self):
+        self.refresh_timer.stop()
+        dirty, self.dirty_directories = self.dirty_directories, set()
+        for path in dirty:
+            node = self.directory_nodes.get(path)
+            if node is None or not os.path.isdir(path):
+                continue
+            self.pending_scans[self.scanner.scan(path)] = (node, path, [])
+            self.directory_changed.emit(path)
 
-class MarkdownFileExplorer(QTreeWidget):
+class MarkdownFileExplorer(QTreeView):
     file_opened = pyqtSignal(str)
     
+    SORT_COLUMNS = [
+        ("Name", FileTreeModel.NAME_COLUMN), 
+        ("Modified", FileTreeModel.MODIFIED_COLUMN), 
+        ("Size", FileTreeModel.SIZE_COLUMN)
+    ]
+    
     def __init__(self):
         super().__init__()
         
+        # Entries live in a compact node table; directories are listed when expanded
+        self.file_model = FileTreeModel(self)
+        self.setModel(self.file_model)
+        
         # Set dark theme styling for file explorer
         self.setStyleSheet(f"""
-        QTreeWidget {{
+        QTreeView {{
             background-color: {NeonPalette.BACKGROUND_DARK};
             color: #FFFFFF;  /* Pure white for all text */
             border: 1px solid {NeonPalette.NEON_BLUE};
             font-family: 'Inter UI', Arial, sans-serif;
         }}
-        QTreeWidget::item {{
+        QTreeView::item {{
             background-color: {NeonPalette.BACKGROUND_DARK};
             color: #FFFFFF;  /* Pure white for all items */
             padding: 5px;
             margin: 2px;
         }}
-        QTreeWidget::item:hover {{
+        QTreeView::item:hover {{
             background-color: {NeonPalette.BACKGROUND_SECONDARY};
             color: {NeonPalette.NEON_BLUE};
         }}
-        QTreeWidget::item:selected {{
+        QTreeView::item:selected {{
             background-color: {NeonPalette.NEON_BLUE};
             color: #FFFFFF;  /* White text on selection */
         }}
@@ -412,14 +2641,19 @@ class MarkdownFileExplorer(QTreeWidget):
         }}
         """)
         
-        # Configure tree widget
-        self.setHeaderLabels(["Name", "Type"])
-        self.setColumnCount(2)
+        # Configure tree view
         self.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
+        # Every row has the same height, so large directories lay out without measuring rows
+        self.setUniformRowHeights(True)
+        self.setColumnWidth(FileTreeModel.NAME_COLUMN, 180)
+        self.setSortingEnabled(True)
+        self.sortByColumn(FileTreeModel.NAME_COLUMN, Qt.AscendingOrder)
         
         # Set specific root path for markdown files
-        self.current_root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'md')
+        self.current_root = os.path.normpath(
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'md')
+        )
         
         # Ensure the directory exists safely
         try:
@@ -431,67 +2665,33 @@ class MarkdownFileExplorer(QTreeWidget):
         self.populate_tree(self.current_root)
         
         # Connect signals
-        self.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.doubleClicked.connect(self.on_item_double_clicked)
         self.customContextMenuRequested.connect(self.show_context_menu)
     
     def populate_tree(self, root_path):
-        """Populate the tree with markdown files and directories"""
-        self.clear()
-        
-        # Create root item
-        root_item = QTreeWidgetItem([os.path.basename(root_path), "Directory"])
-        self.addTopLevelItem(root_item)
-        
-        # Recursively add markdown files and directories
-        self._add_markdown_children(root_item, root_path)
-        
-        # Expand root
-        root_item.setExpanded(True)
+        """Show root_path; its directories are listed lazily as they are expanded"""
+        self.file_model.set_root(root_path)
+        # Expanding the root fetches its listing
+        self.expand(self.file_model.index(0, 0))
     
-    def _add_markdown_children(self, parent_item, path):
-        """Recursively add markdown files and directories"""
-        try:
-            for entry in os.scandir(path):
-                # Create tree widget item
-                item = QTreeWidgetItem(parent_item)
-                
-                # Set name and type
-                item.setText(0, entry.name)
-                
-                if entry.is_dir():
-                    item.setText(1, "Directory")
-                    # Recursively add children for directories
-                    self._add_markdown_children(item, entry.path)
-                elif entry.is_file() and entry.name.lower().endswith('.md'):
-                    item.setText(1, "Markdown")
-        except Exception as e:
-            print(f"Error populating markdown tree: {e}")
+    def refresh_directory(self, path):
+        """Re-list one directory now, e.g. after the explorer itself changed it"""
+        self.file_model.refresh_directory(path)
     
-    def on_item_double_clicked(self, item, column):
-        """Handle double-click on file or directory"""
-        file_path = os.path.join(self.current_root, item.text(0))
-        
-        # Construct full path, traversing up the tree if needed
-        current_item = item
-        path_parts = [item.text(0)]
-        while current_item.parent():
-            current_item = current_item.parent()
-            if current_item.text(0) != os.path.basename(self.current_root):
-                path_parts.insert(0, current_item.text(0))
-        
-        full_path = os.path.join(self.current_root, *path_parts)
-        
-        if os.path.isdir(full_path):
-            # If it's a directory, expand/collapse
-            item.setExpanded(not item.isExpanded())
+    def on_item_double_clicked(self, index):
+        """Open markdown files; directories expand through the view itself"""
+        if not index.isValid() or self.file_model.is_directory(index):
+            return
         
-        elif os.path.isfile(full_path) and full_path.lower().endswith('.md'):
+        full_path = self.file_model.file_path(index)
+        if full_path.lower().endswith('.md'):
             # Emit signal to open markdown file
             self.file_opened.emit(full_path)
     
     def show_context_menu(self, pos):
         """Show context menu for file/directory operations"""
-        item = self.itemAt(pos)
+        index = self.indexAt(pos)
+        full_path = self.file_model.file_path(index)
         
         context_menu = QMenu(self)
         
@@ -500,20 +2700,24 @@ class MarkdownFileExplorer(QTreeWidget):
         new_folder_action = context_menu.addAction("New Folder")
         
         # If an item is selected, add rename and delete options
-        if item:
-            # Construct full path, traversing up the tree if needed
-            current_item = item
-            path_parts = [item.text(0)]
-            while current_item.parent():
-                current_item = current_item.parent()
-                if current_item.text(0) != os.path.basename(self.current_root):
-                    path_parts.insert(0, current_item.text(0))
-            
-            full_path = os.path.join(self.current_root, *path_parts)
-            
-            if os.path.exists(full_path):
-                rename_action = context_menu.addAction("Rename")
-                delete_action = context_menu.addAction("Delete")
+        if full_path and os.path.exists(full_path):
+            rename_action = context_menu.addAction("Rename")
+            delete_action = context_menu.addAction("Delete")
+        
+        # Sorting reorders the loaded entries without re-scanning
+        context_menu.addSeparator()
+        sort_menu = context_menu.addMenu("Sort By")
+        sort_group = QActionGroup(sort_menu)
+        for label, column in self.SORT_COLUMNS:
+            sort_action = sort_menu.addAction(label)
+            sort_action.setCheckable(True)
+            sort_action.setChecked(self.file_model.sort_column == column)
+            sort_action.setData(column)
+            sort_group.addAction(sort_action)
+        sort_menu.addSeparator()
+        descending_action = sort_menu.addAction("Descending")
+        descending_action.setCheckable(True)
+        descending_action.setChecked(self.file_model.sort_order == Qt.DescendingOrder)
         
         # Execute menu
         action = context_menu.exec_(self.mapToGlobal(pos))
@@ -524,10 +2728,15 @@ class MarkdownFileExplorer(QTreeWidget):
                 self.create_new_markdown_file(self.current_root)
             elif action.text() == "New Folder":
                 self.create_new_folder(self.current_root)
-            elif action and item and action.text() == "Rename":
+            elif full_path and action.text() == "Rename":
                 self.rename_file(full_path)
-            elif action and item and action.text() == "Delete":
+            elif full_path and action.text() == "Delete":
                 self.delete_file(full_path)
+            elif action in sort_group.actions():
+                self.sortByColumn(action.data(), self.file_model.sort_order)
+            elif action is descending_action:
+                order = Qt.DescendingOrder if action.isChecked() else Qt.AscendingOrder
+                self.sortByColumn(self.file_model.sort_column, order)
     
     def create_new_markdown_file(self, directory):
         """Create a new markdown file in the specified directory"""
@@ -547,73 +2756,1346 @@ class MarkdownFileExplorer(QTreeWidget):
                 with open(full_path, 'w') as f:
                     f.write("# New Markdown File\n")
                 
-                # Refresh tree and open file
-                self.populate_tree(self.current_root)
+                # Refresh the directory and open file
+                self.refresh_directory(directory)
                 self.file_opened.emit(full_path)
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not create file: {str(e)}")
     
-    def create_new_folder(self, parent_directory):
-        """Create a new folder in the specified directory"""
-        folder_name, ok = QInputDialog.getText(
-            self, 
-            "New Folder", 
-            "Enter folder name:"
-        )
+    def create_new_folder(self, parent_directory):
+        """Create a new folder in the specified directory"""
+        folder_name, ok = QInputDialog.getText(
+            self, 
+            "New Folder", 
+            "Enter folder name:"
+        )
+        
+        if ok and folder_name:
+            full_path = os.path.join(parent_directory, folder_name)
+            
+            try:
+                os.makedirs(full_path)
+                
+                # Refresh the parent directory
+                self.refresh_directory(parent_directory)
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Could not create folder: {str(e)}")
+    
+    def rename_file(self, file_path):
+        """Rename a file or folder"""
+        current_name = os.path.basename(file_path)
+        new_name, ok = QInputDialog.getText(
+            self, 
+            "Rename", 
+            "Enter new name:", 
+            text=current_name
+        )
+        
+        if ok and new_name:
+            directory = os.path.dirname(file_path)
+            new_path = os.path.join(directory, new_name)
+            
+            try:
+                os.rename(file_path, new_path)
+                
+                # Refresh the containing directory
+                self.refresh_directory(directory)
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Could not rename: {str(e)}")
+    
+    def delete_file(self, file_path):
+        """Delete a file or folder with confirmation"""
+        confirm = QMessageBox.question(
+            self, 
+            "Delete", 
+            f"Are you sure you want to delete {os.path.basename(file_path)}?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        
+        if confirm == QMessageBox.Yes:
+            try:
+                if os.path.isdir(file_path):
+                    shutil.rmtree(file_path)
+                else:
+                    os.remove(file_path)
+                
+                # Refresh the containing directory
+                self.refresh_directory(os.path.dirname(file_path))
+            except Exception as e:
+                QMessageBox.warning(self, "Error", f"Could not delete: {str(e)}")
+
+class SearchIndex(QObject):
+    """Full-text index of a workspace's notes, kept in SQLite FTS5.
+    
+    The database lives in <root>/.noteism/search.db. Updates run one at a
+    time on a writer thread and only re-read files whose size or mtime
+    changed; queries use their own connection so indexing never blocks
+    them. Queries take FTS5 syntax: "exact phrase", prefix*, AND, OR, NOT.
+    """
+    results_ready = pyqtSignal(int, object, float)
+    indexing_finished = pyqtSignal(int, int)
+    failed = pyqtSignal(str)
+    
+    SCHEMA_VERSION = 1
+    BATCH_FILES = 200
+    RESULT_LIMIT = 100
+    QUERY_MMAP_BYTES = 1 << 30
+    QUERY_CACHE_KB = 64 * 1024
+    # Marks matched terms in titles and snippets
+    MATCH_START = '\x02'
+    MATCH_END = '\x03'
+    
+    def __init__(self, root, parent=None):
+        super().__init__(parent)
+        self.root = os.path.normpath(root)
+        self.database_path = os.path.join(self.root, '.noteism', 'search.db')
+        self.connections = {}
+        # Updates started before close() stop early
+        self.generation = 0
+        self.reconcile_queued = False
+        # Only the newest query runs; older queued ones are skipped
+        self.latest_query = 0
+        
+        self.writer_pool = QThreadPool(self)
+        self.writer_pool.setMaxThreadCount(1)
+        self.query_pool = QThreadPool(self)
+        self.query_pool.setMaxThreadCount(1)
+    
+    def reconcile(self):
+        """Bring the whole index in line with the files on disk"""
+        if self.reconcile_queued:
+            return
+        self.reconcile_queued = True
+        generation = self.generation
+        self.writer_pool.start(FileIoTask(lambda: self._reconcile(self.root, True, generation)))
+    
+    def update_directory(self, path):
+        """Re-index the notes directly in path and drop ones deleted below it"""
+        generation = self.generation
+        self.writer_pool.start(FileIoTask(lambda: self._reconcile(path, False, generation)))
+    
+    def update_file(self, path):
+        """Re-index one note, e.g. after it was saved"""
+        generation = self.generation
+        self.writer_pool.start(FileIoTask(lambda: self._update_files([path], generation)))
+    
+    def search(self, text):
+        """Run a query in the background and return the id used in results_ready"""
+        self.latest_query += 1
+        query_id = self.latest_query
+        self.query_pool.start(FileIoTask(lambda: self._search(query_id, text)))
+        return query_id
+    
+    def close(self):
+        """Stop pending updates and close the database"""
+        self.generation += 1
+        self.latest_query += 1
+        self.writer_pool.waitForDone()
+        self.query_pool.waitForDone()
+        for connection in self.connections.values():
+            connection.close()
+        self.connections = {}
+    
+    @staticmethod
+    def quote_terms(text):
+        """Turn free text into an FTS5 query matching every word literally"""
+        return ' '.join('"' + term.replace('"', '""') + '"' for term in text.split())
+    
+    @staticmethod
+    def note_title(text, path):
+        """Return a note's first heading, or its file name without extension"""
+        for line in text.splitlines()[:50]:
+            if line.startswith('#'):
+                title = line.lstrip('#').strip()
+                if title:
+                    return title
+        return os.path.splitext(os.path.basename(path))[0]
+    
+    def _connect(self, name):
+        """Return the connection owned by one worker pool, opening it on first use"""
+        connection = self.connections.get(name)
+        if connection is None:
+            os.makedirs(os.path.dirname(self.database_path), exist_ok=True)
+            connection = sqlite3.connect(self.database_path, timeout=10, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            if name == 'writer':
+                self._ensure_schema(connection)
+            else:
+                # Queries read large posting lists; map the file instead of paging it in
+                connection.execute(f'PRAGMA mmap_size = {self.QUERY_MMAP_BYTES}')
+                connection.execute(f'PRAGMA cache_size = -{self.QUERY_CACHE_KB}')
+            self.connections[name] = connection
+        return connection
+    
+    def _ensure_schema(self, connection):
+        version = connection.execute('PRAGMA user_version').fetchone()[0]
+        if version == self.SCHEMA_VERSION:
+            return
+        with connection:
+            connection.execute('DROP TABLE IF EXISTS files')
+            connection.execute('DROP TABLE IF EXISTS notes')
+            connection.execute(
+                'CREATE TABLE files ('
+                'id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL, '
+                'mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL)'
+            )
+            # notes.rowid is files.id
+            # Prefix indexes keep short prefix* queries from scanning the whole vocabulary
+            connection.execute(
+                "CREATE VIRTUAL TABLE notes USING fts5("
+                "title, body, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+            # Title matches weigh five times as much as body matches
+            connection.execute("INSERT INTO notes(notes, rank) VALUES('rank', 'bm25(5.0, 1.0)')")
+            connection.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+    
+    def _known_files(self, connection, prefix):
+        """Return {relative path: (mtime_ns, size)} for indexed files under prefix"""
+        if not prefix:
+            rows = connection.execute('SELECT path, mtime_ns, size FROM files')
+        else:
+            # '0' sorts right after '/', so this range is everything below prefix/
+            rows = connection.execute(
+                'SELECT path, mtime_ns, size FROM files WHERE path >= ? AND path < ?', 
+                (prefix + '/', prefix + '0')
+            )
+        return {path: (mtime_ns, size) for path, mtime_ns, size in rows}
+    
+    def _reconcile(self, directory, recursive, generation):
+        if recursive:
+            self.reconcile_queued = False
+        prefix = workspace_relative(self.root, directory)
+        if prefix is None or generation != self.generation:
+            return
+        try:
+            connection = self._connect('writer')
+            known = self._known_files(connection, prefix)
+            
+            on_disk = {}
+            for path in iter_note_files(directory, recursive):
+                if generation != self.generation:
+                    return
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                on_disk[workspace_relative(self.root, path)] = (stat.st_mtime_ns, stat.st_size)
+            
+            changed = [path for path, signature in on_disk.items() if known.get(path) != signature]
+            if recursive:
+                removed = [path for path in known if path not in on_disk]
+            else:
+                # Notes in subdirectories are checked individually in case one was deleted
+                removed = [
+                    path for path in known 
+                    if path not in on_disk and (
+                        '/' not in path[len(prefix) + 1 if prefix else 0:] 
+                        or not os.path.exists(workspace_absolute(self.root, path))
+                    )
+                ]
+            self._apply(connection, changed, removed, generation)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error updating search index: {e}")
+            self.failed.emit(str(e))
+    
+    def _update_files(self, paths, generation):
+        try:
+            connection = self._connect('writer')
+            changed = []
+            removed = []
+            for path in paths:
+                relative = workspace_relative(self.root, path)
+                if not relative or not relative.lower().endswith('.md'):
+                    continue
+                row = connection.execute(
+                    'SELECT mtime_ns, size FROM files WHERE path = ?', (relative,)
+                ).fetchone()
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    if row is not None:
+                        removed.append(relative)
+                    continue
+                if row != (stat.st_mtime_ns, stat.st_size):
+                    changed.append(relative)
+            self._apply(connection, changed, removed, generation)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error updating search index: {e}")
+            self.failed.emit(str(e))
+    
+    def _apply(self, connection, changed, removed, generation):
+        """Re-read changed notes and drop removed ones, in batched transactions"""
+        updated = 0
+        for start in range(0, len(changed), self.BATCH_FILES):
+            if generation != self.generation:
+                return
+            with connection:
+                for relative in changed[start:start + self.BATCH_FILES]:
+                    path = workspace_absolute(self.root, relative)
+                    try:
+                        # Stat before reading so a write during the read is picked up next time
+                        stat = os.stat(path)
+                        with open(path, 'rb') as f:
+                            text = f.read().decode('utf-8', errors='replace')
+                    except OSError:
+                        removed.append(relative)
+                        continue
+                    self._store(connection, relative, stat, text)
+                    updated += 1
+        
+        with connection:
+            for relative in removed:
+                row = connection.execute('SELECT id FROM files WHERE path = ?', (relative,)).fetchone()
+                if row is not None:
+                    connection.execute('DELETE FROM notes WHERE rowid = ?', row)
+                    connection.execute('DELETE FROM files WHERE id = ?', row)
+        
+        if updated or removed:
+            self.indexing_finished.emit(updated, len(removed))
+    
+    def _store(self, connection, relative, stat, text):
+        row = connection.execute('SELECT id FROM files WHERE path = ?', (relative,)).fetchone()
+        if row is None:
+            file_id = connection.execute(
+                'INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)', 
+                (relative, stat.st_mtime_ns, stat.st_size)
+            ).lastrowid
+        else:
+            file_id = row[0]
+            connection.execute(
+                'UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?', 
+                (stat.st_mtime_ns, stat.st_size, file_id)
+            )
+            connection.execute('DELETE FROM notes WHERE rowid = ?', (file_id,))
+        connection.execute(
+            'INSERT INTO notes (rowid, title, body) VALUES (?, ?, ?)', 
+            (file_id, self.note_title(text, relative), text)
+        )
+    
+    def _match(self, connection, query):
+        # Rank inside the subquery so FTS5 can stop after the best RESULT_LIMIT rows
+        return connection.execute(
+            'SELECT files.path, hits.title, hits.snippet FROM ('
+            '  SELECT rowid, highlight(notes, 0, ?, ?) AS title, '
+            "    snippet(notes, 1, ?, ?, '…', 16) AS snippet, rank "
+            '  FROM notes WHERE notes MATCH ? ORDER BY rank LIMIT ?'
+            ') AS hits JOIN files ON files.id = hits.rowid ORDER BY hits.rank', 
+            (self.MATCH_START, self.MATCH_END, self.MATCH_START, self.MATCH_END, query, self.RESULT_LIMIT)
+        ).fetchall()
+    
+    def _search(self, query_id, text):
+        if query_id != self.latest_query:
+            return
+        start = time.perf_counter()
+        try:
+            connection = self._connect('reader')
+            try:
+                rows = self._match(connection, text)
+            except sqlite3.OperationalError:
+                # Not valid FTS5 syntax, or the index does not exist yet; search the words literally
+                rows = self._match(connection, self.quote_terms(text))
+        except sqlite3.Error as e:
+            self.failed.emit(str(e))
+            rows = []
+        results = [(workspace_absolute(self.root, path), title, snippet) for path, title, snippet in rows]
+        self.results_ready.emit(query_id, results, time.perf_counter() - start)
+
+class SearchPanel(QWidget):
+    """Query box and ranked, highlighted results from a SearchIndex"""
+    file_opened = pyqtSignal(str)
+    
+    DEBOUNCE_MS = 150
+    
+    def __init__(self, search_index, parent=None):
+        super().__init__(parent)
+        self.search_index = search_index
+        self.query_id = 0
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText('Search notes: "phrase", prefix*, AND, OR, NOT')
+        self.query_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.query_edit)
+        
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+        
+        self.results_view = QTextBrowser()
+        self.results_view.setOpenLinks(False)
+        self.results_view.anchorClicked.connect(lambda url: self.file_opened.emit(url.toLocalFile()))
+        layout.addWidget(self.results_view)
+        
+        # Search once typing pauses
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.run_search)
+        self.query_edit.textChanged.connect(self.search_timer.start)
+        self.query_edit.returnPressed.connect(self.run_search)
+        
+        self.search_index.results_ready.connect(self._on_results)
+    
+    def focus_query(self):
+        self.query_edit.setFocus()
+        self.query_edit.selectAll()
+    
+    def run_search(self):
+        self.search_timer.stop()
+        text = self.query_edit.text().strip()
+        if not text:
+            # Ignore results still in flight
+            self.query_id = 0
+            self.summary_label.clear()
+            self.results_view.clear()
+            return
+        self.query_id = self.search_index.search(text)
+    
+    def _highlight(self, text):
+        return escape(text).replace(
+            SearchIndex.MATCH_START, f'<span style="color: {NeonPalette.NEON_GREEN}; font-weight: bold;">'
+        ).replace(SearchIndex.MATCH_END, '</span>')
+    
+    def _on_results(self, query_id, results, seconds):
+        if query_id != self.query_id:
+            return
+        
+        self.summary_label.setText(f"{len(results)} results in {seconds * 1000:.0f} ms")
+        parts = []
+        for path, title, snippet in results:
+            relative = os.path.relpath(path, self.search_index.root)
+            parts.append(
+                f'<p><a href="{escape(QUrl.fromLocalFile(path).toString())}" '
+                f'style="color: {NeonPalette.NEON_BLUE};">{self._highlight(title)}</a><br>'
+                f'<span style="color: {NeonPalette.TEXT_MUTED};">{escape(relative)}</span><br>'
+                f'{self._highlight(snippet)}</p>'
+            )
+        self.results_view.setHtml(''.join(parts))
+
+class PathIndex(QObject):
+    """In-memory index of a workspace's note paths for quick-open.
+    
+    Paths are numbered shortest first and indexed by the trigrams of their
+    lowercased text and by the first one to three letters of their file
+    name. A query is first answered from those tables with contiguous
+    matches, which is fast enough to run on every keystroke. When that
+    finds fewer results than requested, a fuzzy subsequence scan runs on a
+    worker thread and its results follow through fuzzy_ready.
+    """
+    ready = pyqtSignal(int)
+    # query id, index revision the scan ran against, paths
+    fuzzy_ready = pyqtSignal(int, int, object)
+    tables_built = pyqtSignal(int, object)
+    directory_listed = pyqtSignal(str, object)
+    
+    def __init__(self, root, parent=None):
+        super().__init__(parent)
+        self.root = os.path.normpath(root)
+        self.paths = []
+        self.keys = []
+        self.names = []
+        self.trigrams = {}
+        self.name_prefixes = {}
+        self.ids = {}
+        # Rebuilds started before the newest one are dropped
+        self.generation = 0
+        self.query_id = 0
+        # Bumped on every change; fuzzy matches are reused only within one revision
+        self.revision = 0
+        # The last finished fuzzy scan; a longer query only rescans its matches
+        self.fuzzy_cache = ('', None, -1)
+        
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        # Worker results are applied on the GUI thread through queued connections
+        self.tables_built.connect(self._on_tables_built)
+        self.directory_listed.connect(self._on_directory_listed)
+    
+    def __len__(self):
+        return len(self.ids)
+    
+    def rebuild(self):
+        """Walk the workspace in the background and replace the index"""
+        self.generation += 1
+        generation = self.generation
+        self.thread_pool.start(FileIoTask(lambda: self._build(generation)))
+    
+    def update_directory(self, path):
+        """Re-list the notes directly in path and drop ones deleted below it"""
+        def list_directory():
+            try:
+                with os.scandir(path) as entries:
+                    names = [
+                        entry.name for entry in entries 
+                        if entry.name.lower().endswith('.md') and entry.is_file()
+                    ]
+            except OSError:
+                names = []
+            self.directory_listed.emit(path, names)
+        self.thread_pool.start(FileIoTask(list_directory))
+    
+    def add(self, path):
+        relative = workspace_relative(self.root, path)
+        if relative is None or relative in self.ids or not relative.lower().endswith('.md'):
+            return
+        node = len(self.paths)
+        key = relative.lower()
+        name = key[key.rfind('/') + 1:]
+        self.paths.append(relative)
+        self.keys.append(key)
+        self.names.append(name)
+        self.ids[relative] = node
+        self._index(node, key, name, self.trigrams, self.name_prefixes)
+        self.revision += 1
+    
+    def remove(self, path):
+        relative = workspace_relative(self.root, path)
+        node = self.ids.pop(relative, None) if relative is not None else None
+        if node is None:
+            return
+        # Stale ids stay in the tables; an empty key never matches
+        self.paths[node] = None
+        self.keys[node] = ''
+        self.names[node] = ''
+        self.revision += 1
+    
+    def absolute(self, relative):
+        return workspace_absolute(self.root, relative)
+    
+    def search(self, query, limit=50):
+        """Return (query id, best relative paths) from contiguous matches.
+        
+        If fewer than limit paths match contiguously, a fuzzy scan is
+        started and fuzzy_ready(query id, revision, paths) follows with the
+        full list.
+        """
+        self.query_id += 1
+        query = ''.join(query.lower().split())
+        if not query:
+            return self.query_id, []
+        
+        matches = itertools.islice(self._contiguous_matches(query), limit)
+        results = [self.paths[node] for node in matches]
+        
+        if len(results) < limit:
+            query_id = self.query_id
+            # The worker scans a snapshot; remove() and add() edit the lists in place
+            paths, keys, revision = list(self.paths), list(self.keys), self.revision
+            cached_query, cached, cached_revision = self.fuzzy_cache
+            candidates = cached if cached_revision == revision and query.startswith(cached_query) else None
+            self.thread_pool.start(FileIoTask(
+                lambda: self._fuzzy_scan(query_id, query, limit, paths, keys, candidates, revision)
+            ))
+        return self.query_id, results
+    
+    @staticmethod
+    def _index(node, key, name, trigrams, name_prefixes):
+        for i in range(len(key) - 2):
+            trigram = key[i:i + 3]
+            posting = trigrams.get(trigram)
+            if posting is None:
+                trigrams[trigram] = posting = array('i')
+            # Keys repeat trigrams; each path appears once per posting
+            if not posting or posting[-1] != node:
+                posting.append(node)
+        for length in range(1, min(len(name), 3) + 1):
+            name_prefixes.setdefault(name[:length], array('i')).append(node)
+    
+    def _build(self, generation):
+        relatives = []
+        for path in iter_note_files(self.root):
+            if generation != self.generation:
+                return
+            relatives.append(workspace_relative(self.root, path))
+        
+        # Shortest first, so postings list the likeliest results first
+        relatives.sort(key=lambda relative: (len(relative), relative.lower()))
+        keys = [relative.lower() for relative in relatives]
+        names = [key[key.rfind('/') + 1:] for key in keys]
+        trigrams = {}
+        name_prefixes = {}
+        for node, key in enumerate(keys):
+            self._index(node, key, names[node], trigrams, name_prefixes)
+        tables = (relatives, keys, names, trigrams, name_prefixes)
+        self.tables_built.emit(generation, tables)
+    
+    def _on_tables_built(self, generation, tables):
+        if generation != self.generation:
+            return
+        self.paths, self.keys, self.names, self.trigrams, self.name_prefixes = tables
+        self.ids = {relative: node for node, relative in enumerate(self.paths)}
+        self.revision += 1
+        self.ready.emit(len(self.paths))
+    
+    def _on_directory_listed(self, path, names):
+        directory = workspace_relative(self.root, path)
+        if directory is None:
+            return
+        prefix = directory + '/' if directory else ''
+        listed = {prefix + name for name in names}
+        for relative in [relative for relative in self.ids if relative.startswith(prefix)]:
+            if relative in listed:
+                continue
+            # Direct children missing from the listing are gone; deeper ones are checked
+            if '/' not in relative[len(prefix):] or not os.path.exists(self.absolute(relative)):
+                self.remove(self.absolute(relative))
+        for relative in listed:
+            if relative not in self.ids:
+                self.add(self.absolute(relative))
+    
+    def _contiguous_matches(self, query):
+        """Yield paths containing query: file name prefix, then file name, then directory.
+        
+        Each group comes out shortest first because ids are, so the caller
+        can stop after the first few. Queries of three letters or more only
+        look at paths holding the query's rarest trigram.
+        """
+        keys = self.keys
+        names = self.names
+        if len(query) < 3:
+            candidates = range(len(keys))
+        else:
+            postings = [self.trigrams.get(query[i:i + 3]) for i in range(len(query) - 2)]
+            if None in postings:
+                return
+            candidates = min(postings, key=len)
+        
+        seen = set()
+        for node in self.name_prefixes.get(query[:3], ()):
+            if names[node].startswith(query):
+                seen.add(node)
+                yield node
+        for node in candidates:
+            if query in names[node] and node not in seen:
+                seen.add(node)
+                yield node
+        for node in candidates:
+            if query in keys[node] and node not in seen:
+                yield node
+    
+    def _fuzzy_scan(self, query_id, query, limit, paths, keys, candidates, revision):
+        if query_id != self.query_id:
+            return
+        # Each character is matched at its first occurrence after the previous one
+        pattern = re.compile(''.join(
+            re.escape(char) + (f'[^{re.escape(query[i + 1])}]*' if i + 1 < len(query) else '')
+            for i, char in enumerate(query)
+        ))
+        matches = []
+        ranked = []
+        nodes = range(len(keys)) if candidates is None else candidates
+        for count, node in enumerate(nodes):
+            if count % 4096 == 0 and query_id != self.query_id:
+                # A newer query superseded this one
+                return
+            key = keys[node]
+            match = pattern.search(key)
+            if match is None:
+                continue
+            matches.append(node)
+            in_name = pattern.search(key, key.rfind('/') + 1)
+            if in_name is not None:
+                ranked.append((4, in_name.end() - in_name.start(), len(key), node))
+            else:
+                ranked.append((5, match.end() - match.start(), len(key), node))
+        
+        self.fuzzy_cache = (query, matches, revision)
+        results = [paths[node] for *_, node in heapq.nsmallest(limit, ranked)]
+        self.fuzzy_ready.emit(query_id, revision, [relative for relative in results if relative is not None])
+
+class QuickOpenDialog(QDialog):
+    """Ctrl+P palette: type part of a path, pick a note from the ranked list"""
+    file_selected = pyqtSignal(str)
+    
+    RESULT_LIMIT = 50
+    
+    def __init__(self, path_index, parent=None):
+        super().__init__(parent)
+        self.path_index = path_index
+        self.query_id = 0
+        self.setWindowTitle("Quick Open")
+        self.setWindowFlags(Qt.Popup | Qt.FramelessWindowHint)
+        self.resize(560, 380)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+        
+        self.query_edit = QLineEdit()
+        self.query_edit.setPlaceholderText("Type to find a note by name or path")
+        self.query_edit.installEventFilter(self)
+        layout.addWidget(self.query_edit)
+        
+        self.results_list = QListWidget()
+        self.results_list.itemActivated.connect(self._open_item)
+        layout.addWidget(self.results_list)
+        
+        self.query_edit.textChanged.connect(self._search)
+        self.query_edit.returnPressed.connect(
+            lambda: self._open_item(self.results_list.currentItem())
+        )
+        self.path_index.fuzzy_ready.connect(self._on_fuzzy_results)
+    
+    def open(self):
+        """Show the palette centered over its parent with an empty query"""
+        self.query_edit.clear()
+        self.results_list.clear()
+        parent = self.parentWidget()
+        if parent is not None:
+            center = parent.mapToGlobal(parent.rect().center())
+            self.move(center.x() - self.width() // 2, center.y() - self.height() // 2)
+        self.show()
+        self.query_edit.setFocus()
+    
+    def eventFilter(self, watched, event):
+        # Arrow keys move through the results while the query keeps focus
+        if watched is self.query_edit and event.type() == event.KeyPress:
+            if event.key() in (Qt.Key_Down, Qt.Key_Up, Qt.Key_PageDown, Qt.Key_PageUp):
+                QApplication.sendEvent(self.results_list, event)
+                return True
+        return super().eventFilter(watched, event)
+    
+    def _search(self, text):
+        self.query_id, results = self.path_index.search(text, self.RESULT_LIMIT)
+        self._show(results)
+    
+    def _on_fuzzy_results(self, query_id, revision, results):
+        # Paths added or removed since the scan started would be out of date
+        if query_id != self.query_id or revision != self.path_index.revision:
+            return
+        shown = {self.results_list.item(row).data(Qt.UserRole) for row in range(self.results_list.count())}
+        extra = [relative for relative in results if relative not in shown]
+        self._show(extra[:self.RESULT_LIMIT - len(shown)], append=True)
+    
+    def _show(self, results, append=False):
+        if not append:
+            self.results_list.clear()
+        for relative in results:
+            directory, _, name = relative.rpartition('/')
+            item = QListWidgetItem(f"{name}    {directory}" if directory else name)
+            item.setData(Qt.UserRole, relative)
+            self.results_list.addItem(item)
+        if self.results_list.currentRow() < 0 and self.results_list.count():
+            self.results_list.setCurrentRow(0)
+    
+    def _open_item(self, item):
+        if item is None:
+            return
+        self.hide()
+        self.file_selected.emit(self.path_index.absolute(item.data(Qt.UserRole)))
+
+# Link and tag syntax recorded by the metadata store
+INLINE_LINK_RE = re.compile(r'(?<!!)\[[^\]\n]*\]\(\s*(?:<([^>\n]*)>|([^)\s]+))[^)\n]*\)')
+WIKI_LINK_RE = re.compile(r'\[\[([^\]|#\n]+)(?:#[^\]|\n]*)?(?:\|[^\]\n]*)?\]\]')
+TAG_RE = re.compile(r'(?<![\w#&/])#([A-Za-z][\w/-]*)')
+REFERENCE_LINK_DEF_RE = re.compile(r'^ {0,3}\[[^\]^][^\]]*\]:[ \t]*(?:<([^>\n]*)>|(\S+))')
+
+def extract_note_facts(path):
+    """Read a note and return the facts the metadata store keeps, or None if it is unreadable.
+    
+    Runs in scanner worker processes. Returns (path, mtime_ns, size, title,
+    word_count, headings, links, tags): headings are (level, text, line)
+    and links are (target, line, is_wiki), with zero-based lines. A
+    reference link is recorded once, at its definition.
+    """
+    try:
+        # Stat before reading so a write during the read is picked up next time
+        stat = os.stat(path)
+        with open(path, 'rb') as f:
+            text = f.read().decode('utf-8', errors='replace')
+    except OSError:
+        return None
+    
+    headings = []
+    links = []
+    tags = set()
+    fence = None
+    for line_number, line in enumerate(text.splitlines()):
+        if fence is not None:
+            if line.lstrip(' ').startswith(fence) and not line.strip().strip(fence[0]):
+                fence = None
+            continue
+        fence_match = FENCE_OPEN_RE.match(line)
+        if fence_match:
+            fence = fence_match.group(1)
+            continue
+        
+        if ATX_HEADING_RE.match(line):
+            marker = line.lstrip(' ')
+            level = len(marker) - len(marker.lstrip('#'))
+            heading = marker[level:].strip().rstrip('#').strip()
+            headings.append((level, heading, line_number))
+            continue
+        
+        reference_match = REFERENCE_LINK_DEF_RE.match(line)
+        if reference_match:
+            links.append((reference_match.group(1) or reference_match.group(2), line_number, False))
+            continue
+        if '[' in line:
+            links.extend(
+                (angled or bare, line_number, False) for angled, bare in INLINE_LINK_RE.findall(line)
+            )
+            links.extend((target.strip(), line_number, True) for target in WIKI_LINK_RE.findall(line))
+        if '#' in line:
+            tags.update(TAG_RE.findall(line))
+    
+    title = headings[0][1] if headings else os.path.splitext(os.path.basename(path))[0]
+    return path, stat.st_mtime_ns, stat.st_size, title, len(text.split()), headings, links, sorted(tags)
+
+def extract_note_facts_batch(paths):
+    """Extract facts for several notes in one worker round trip"""
+    return [extract_note_facts(path) for path in paths]
+
+class MetadataStore(QObject):
+    """Facts about every note, cached in SQLite and keyed by mtime and size.
+    
+    The database lives in <root>/.noteism/metadata.db and holds each note's
+    title, word count, headings, tags and outgoing links. Updates run on a
+    writer thread; when many files changed, they are parsed by a process
+    pool using every core, otherwise on the writer thread itself. Lookups
+    through note() and links_from() read the database on the GUI thread.
+    """
+    scan_finished = pyqtSignal(int, int, float)
+    notes_changed = pyqtSignal(object)
+    
+    SCHEMA_VERSION = 2
+    # Changed files parsed per worker task, and the count that justifies starting workers
+    BATCH_FILES = 64
+    POOL_THRESHOLD = 256
+    
+    def __init__(self, root, parent=None):
+        super().__init__(parent)
+        self.root = os.path.normpath(root)
+        self.database_path = os.path.join(self.root, '.noteism', 'metadata.db')
+        self.writer = None
+        self.reader = None
+        # Updates started before close() stop early
+        self.generation = 0
+        self.reconcile_queued = False
+        
+        self.writer_pool = QThreadPool(self)
+        self.writer_pool.setMaxThreadCount(1)
+    
+    def reconcile(self):
+        """Bring the whole store in line with the files on disk"""
+        if self.reconcile_queued:
+            return
+        self.reconcile_queued = True
+        generation = self.generation
+        self.writer_pool.start(FileIoTask(lambda: self._reconcile(self.root, True, generation)))
+    
+    def update_directory(self, path):
+        """Re-read the notes directly in path and drop ones deleted below it"""
+        generation = self.generation
+        self.writer_pool.start(FileIoTask(lambda: self._reconcile(path, False, generation)))
+    
+    def update_file(self, path):
+        """Re-read one note, e.g. after it was saved"""
+        generation = self.generation
+        self.writer_pool.start(FileIoTask(lambda: self._update_file(path, generation)))
+    
+    def close(self):
+        """Stop pending updates and close the database"""
+        self.generation += 1
+        self.writer_pool.waitForDone()
+        for connection in (self.writer, self.reader):
+            if connection is not None:
+                connection.close()
+        self.writer = self.reader = None
+    
+    def note(self, path):
+        """Return a note's cached facts as a dict, or None if it is not in the store"""
+        relative = workspace_relative(self.root, path)
+        try:
+            row = self._reader().execute(
+                'SELECT mtime_ns, size, title, word_count, headings, tags FROM notes WHERE path = ?', 
+                (relative,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+        mtime_ns, size, title, word_count, headings, tags = row
+        return {
+            'mtime_ns': mtime_ns, 
+            'size': size, 
+            'title': title, 
+            'word_count': word_count, 
+            'headings': json.loads(headings), 
+            'tags': json.loads(tags)
+        }
+    
+    def links_from(self, path):
+        """Return a note's outgoing links as (target, line, is_wiki) tuples"""
+        relative = workspace_relative(self.root, path)
+        try:
+            return [
+                (target, line, bool(wiki)) for target, line, wiki in self._reader().execute(
+                    'SELECT target, line, wiki FROM links WHERE source = ? ORDER BY line', (relative,)
+                )
+            ]
+        except sqlite3.Error:
+            return []
+    
+    def summary(self):
+        """Return (note count, total words) across the workspace"""
+        try:
+            count, words = self._reader().execute('SELECT count(*), total(word_count) FROM notes').fetchone()
+        except sqlite3.Error:
+            return 0, 0
+        return count, int(words)
+    
+    def snapshot(self):
+        """Return (note paths, links as (source, target, line, wiki)) read through a private connection.
         
-        if ok and folder_name:
-            full_path = os.path.join(parent_directory, folder_name)
+        Safe to call from any thread, for consumers that build their own indexes.
+        """
+        if not os.path.exists(self.database_path):
+            return [], []
+        connection = sqlite3.connect(self.database_path, timeout=10)
+        try:
+            paths = [path for path, in connection.execute('SELECT path FROM notes')]
+            links = connection.execute('SELECT source, target, line, wiki FROM links').fetchall()
+        finally:
+            connection.close()
+        return paths, links
+    
+    def _reader(self):
+        if self.reader is None:
+            self.reader = sqlite3.connect(self.database_path, timeout=10)
+        return self.reader
+    
+    def _connect(self):
+        if self.writer is None:
+            os.makedirs(os.path.dirname(self.database_path), exist_ok=True)
+            self.writer = sqlite3.connect(self.database_path, timeout=10, check_same_thread=False)
+            self.writer.execute('PRAGMA journal_mode=WAL')
+            self.writer.execute('PRAGMA synchronous=NORMAL')
+            self._ensure_schema(self.writer)
+        return self.writer
+    
+    def _ensure_schema(self, connection):
+        version = connection.execute('PRAGMA user_version').fetchone()[0]
+        if version == self.SCHEMA_VERSION:
+            return
+        with connection:
+            connection.execute('DROP TABLE IF EXISTS notes')
+            connection.execute('DROP TABLE IF EXISTS links')
+            connection.execute(
+                'CREATE TABLE notes ('
+                'path TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL, '
+                'title TEXT NOT NULL, word_count INTEGER NOT NULL, headings TEXT NOT NULL, '
+                'tags TEXT NOT NULL) WITHOUT ROWID'
+            )
+            # Link targets are stored as written; resolving them is up to the reader
+            connection.execute(
+                'CREATE TABLE links ('
+                'source TEXT NOT NULL, target TEXT NOT NULL, line INTEGER NOT NULL, wiki INTEGER NOT NULL)'
+            )
+            connection.execute('CREATE INDEX links_source ON links (source)')
+            connection.execute('CREATE INDEX links_target ON links (target)')
+            connection.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+    
+    def _reconcile(self, directory, recursive, generation):
+        if recursive:
+            self.reconcile_queued = False
+        prefix = workspace_relative(self.root, directory)
+        if prefix is None or generation != self.generation:
+            return
+        start = time.perf_counter()
+        try:
+            connection = self._connect()
+            if not prefix:
+                rows = connection.execute('SELECT path, mtime_ns, size FROM notes')
+            else:
+                # '0' sorts right after '/', so this range is everything below prefix/
+                rows = connection.execute(
+                    'SELECT path, mtime_ns, size FROM notes WHERE path >= ? AND path < ?', 
+                    (prefix + '/', prefix + '0')
+                )
+            known = {path: (mtime_ns, size) for path, mtime_ns, size in rows}
+            
+            on_disk = {}
+            for path in iter_note_files(directory, recursive):
+                if generation != self.generation:
+                    return
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                on_disk[workspace_relative(self.root, path)] = (stat.st_mtime_ns, stat.st_size)
             
+            changed = [path for path, signature in on_disk.items() if known.get(path) != signature]
+            if recursive:
+                removed = [path for path in known if path not in on_disk]
+            else:
+                # Notes in subdirectories are checked individually in case one was deleted
+                removed = [
+                    path for path in known 
+                    if path not in on_disk and (
+                        '/' not in path[len(prefix) + 1 if prefix else 0:] 
+                        or not os.path.exists(workspace_absolute(self.root, path))
+                    )
+                ]
+            self._apply(connection, changed, removed, generation, start)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error updating metadata store: {e}")
+    
+    def _update_file(self, path, generation):
+        relative = workspace_relative(self.root, path)
+        if not relative or not relative.lower().endswith('.md'):
+            return
+        start = time.perf_counter()
+        try:
+            connection = self._connect()
+            row = connection.execute('SELECT mtime_ns, size FROM notes WHERE path = ?', (relative,)).fetchone()
             try:
-                os.makedirs(full_path)
-                
-                # Refresh tree
-                self.populate_tree(self.current_root)
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Could not create folder: {str(e)}")
+                stat = os.stat(path)
+            except OSError:
+                if row is not None:
+                    self._apply(connection, [], [relative], generation, start)
+                return
+            if row != (stat.st_mtime_ns, stat.st_size):
+                self._apply(connection, [relative], [], generation, start)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Error updating metadata store: {e}")
     
-    def rename_file(self, file_path):
-        """Rename a file or folder"""
-        current_name = os.path.basename(file_path)
-        new_name, ok = QInputDialog.getText(
-            self, 
-            "Rename", 
-            "Enter new name:", 
-            text=current_name
-        )
+    def _apply(self, connection, changed, removed, generation, start):
+        """Extract facts for changed notes and drop removed ones"""
+        paths = [workspace_absolute(self.root, relative) for relative in changed]
+        batches = [paths[i:i + self.BATCH_FILES] for i in range(0, len(paths), self.BATCH_FILES)]
+        updated = 0
         
-        if ok and new_name:
-            directory = os.path.dirname(file_path)
-            new_path = os.path.join(directory, new_name)
-            
+        if len(paths) >= self.POOL_THRESHOLD:
             try:
-                os.rename(file_path, new_path)
-                
-                # Refresh tree
-                self.populate_tree(self.current_root)
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Could not rename: {str(e)}")
+                # Spawned rather than forked: forking a process that runs Qt threads is unsafe
+                with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=get_context('spawn')) as executor:
+                    futures = [executor.submit(extract_note_facts_batch, batch) for batch in batches]
+                    for future in as_completed(futures):
+                        if generation != self.generation:
+                            executor.shutdown(cancel_futures=True)
+                            return
+                        updated += self._store(connection, future.result())
+                batches = []
+            except (BrokenProcessPool, OSError) as e:
+                # Workers could not start or died; finish on this thread
+                print(f"Metadata scanner falling back to one thread: {e}")
+                updated = 0
+        
+        for batch in batches:
+            if generation != self.generation:
+                return
+            updated += self._store(connection, extract_note_facts_batch(batch))
+        
+        with connection:
+            for relative in removed:
+                connection.execute('DELETE FROM notes WHERE path = ?', (relative,))
+                connection.execute('DELETE FROM links WHERE source = ?', (relative,))
+        
+        # Emitted even when nothing changed so a warm start still reports its totals
+        self.scan_finished.emit(updated, len(removed), time.perf_counter() - start)
+        if updated or removed:
+            self.notes_changed.emit(
+                [workspace_absolute(self.root, relative) for relative in changed + removed]
+            )
     
-    def delete_file(self, file_path):
-        """Delete a file or folder with confirmation"""
-        confirm = QMessageBox.question(
-            self, 
-            "Delete", 
-            f"Are you sure you want to delete {os.path.basename(file_path)}?",
-            QMessageBox.Yes | QMessageBox.No
+    def _store(self, connection, results):
+        """Write one batch of extracted facts in a transaction and return how many were stored"""
+        stored = 0
+        with connection:
+            for facts in results:
+                if facts is None:
+                    continue
+                path, mtime_ns, size, title, word_count, headings, links, tags = facts
+                relative = workspace_relative(self.root, path)
+                connection.execute(
+                    'INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?, ?, ?)', 
+                    (relative, mtime_ns, size, title, word_count, json.dumps(headings), json.dumps(tags))
+                )
+                connection.execute('DELETE FROM links WHERE source = ?', (relative,))
+                connection.executemany(
+                    'INSERT INTO links VALUES (?, ?, ?, ?)', 
+                    [(relative, target, line, wiki) for target, line, wiki in links]
+                )
+                stored += 1
+        return stored
+
+# Link targets that leave the workspace or stay within the note
+EXTERNAL_LINK_RE = re.compile(r'^(?:[A-Za-z][\w+.-]*:|//|#)')
+
+class LinkGraph(QObject):
+    """Backlinks and broken links between a workspace's notes.
+    
+    Built from the links recorded in a MetadataStore. Each edge is keyed by
+    what its target names rather than the note it resolves to: a
+    workspace-relative path for Markdown and reference links, a lowercased
+    note name for wikilinks. The reverse map from those keys to linking
+    notes answers backlinks() in O(backlinks), and creating or deleting a
+    note changes which keys resolve without touching any edge. When notes
+    change, only their outgoing edges are replaced.
+    """
+    ready = pyqtSignal()
+    changed = pyqtSignal()
+    graph_built = pyqtSignal(int, object)
+    
+    # More changed notes than this are picked up by a rebuild instead
+    REBUILD_THRESHOLD = 500
+    
+    def __init__(self, metadata_store, parent=None):
+        super().__init__(parent)
+        self.store = metadata_store
+        self.root = metadata_store.root
+        # source -> [(key, target, line)] and key -> {source: [(target, line)]}
+        self.outgoing = {}
+        self.incoming = {}
+        self.notes = set()
+        # Lowercased note name -> number of notes with that name
+        self.names = {}
+        # Builds started before the newest one are dropped
+        self.generation = 0
+        self.building = False
+        # Notes changed while a build was running, applied once it lands
+        self.pending = set()
+        
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+        self.graph_built.connect(self._on_graph_built)
+        self.store.notes_changed.connect(self.update_notes)
+    
+    def rebuild(self):
+        """Load every link from the metadata store in the background and replace the graph"""
+        self.generation += 1
+        self.building = True
+        self.pending.clear()
+        generation = self.generation
+        self.thread_pool.start(FileIoTask(lambda: self._build(generation)))
+    
+    def update_notes(self, paths):
+        """Replace the outgoing edges of notes the metadata store re-read or dropped"""
+        if self.building:
+            self.pending.update(paths)
+            return
+        if len(paths) > self.REBUILD_THRESHOLD:
+            self.rebuild()
+            return
+        for path in paths:
+            self._update_note(path)
+        self.changed.emit()
+    
+    def backlinks(self, path):
+        """Return [(source path, [(target, line)])] for the notes linking to path"""
+        relative = workspace_relative(self.root, path)
+        if not relative:
+            return []
+        sources = {}
+        for key in (('path', relative), ('name', self.note_name(relative))):
+            for source, links in self.incoming.get(key, {}).items():
+                sources.setdefault(source, []).extend(links)
+        return [
+            (workspace_absolute(self.root, source), sorted(links, key=lambda link: link[1])) 
+            for source, links in sorted(sources.items())
+        ]
+    
+    def broken_links(self):
+        """Return [(source path, target, line)] for links to notes that do not exist"""
+        broken = [
+            (source, target, line) 
+            for key, sources in self.incoming.items() if not self._resolves(key) 
+            for source, links in sources.items() 
+            for target, line in links
+        ]
+        broken.sort()
+        return [(workspace_absolute(self.root, source), target, line) for source, target, line in broken]
+    
+    @staticmethod
+    def note_name(relative):
+        return posixpath.splitext(posixpath.basename(relative))[0].lower()
+    
+    @staticmethod
+    def link_key(source, target, wiki):
+        """Return the key a link from source is indexed under, or None if it does not name a note"""
+        if wiki:
+            target = target.strip().strip('/')
+            if target.lower().endswith('.md'):
+                target = target[:-3]
+            if not target:
+                return None
+            if '/' in target:
+                return ('path', posixpath.normpath(target) + '.md')
+            return ('name', target.lower())
+        
+        if EXTERNAL_LINK_RE.match(target):
+            return None
+        target = unquote(target.split('#', 1)[0].split('?', 1)[0])
+        if not target:
+            return None
+        if target.startswith('/'):
+            relative = posixpath.normpath(target.lstrip('/'))
+        else:
+            relative = posixpath.normpath(posixpath.join(posixpath.dirname(source), target))
+        if relative in (posixpath.curdir, posixpath.pardir) or relative.startswith('../'):
+            return None
+        extension = posixpath.splitext(relative)[1].lower()
+        if not extension:
+            relative += '.md'
+        elif extension != '.md':
+            return None
+        return ('path', relative)
+    
+    @classmethod
+    def _add_edges(cls, outgoing, incoming, source, links):
+        edges = []
+        for target, line, wiki in links:
+            key = cls.link_key(source, target, wiki)
+            if key is None:
+                continue
+            edges.append((key, target, line))
+            incoming.setdefault(key, {}).setdefault(source, []).append((target, line))
+        if edges:
+            outgoing[source] = edges
+    
+    def _resolves(self, key):
+        kind, target = key
+        return target in self.notes if kind == 'path' else target in self.names
+    
+    def _build(self, generation):
+        try:
+            paths, links = self.store.snapshot()
+        except sqlite3.Error as e:
+            print(f"Error loading link graph: {e}")
+            paths, links = [], []
+        
+        by_source = {}
+        for source, target, line, wiki in links:
+            by_source.setdefault(source, []).append((target, line, wiki))
+        outgoing = {}
+        incoming = {}
+        for source, source_links in by_source.items():
+            if generation != self.generation:
+                return
+            self._add_edges(outgoing, incoming, source, source_links)
+        
+        names = {}
+        for relative in paths:
+            name = self.note_name(relative)
+            names[name] = names.get(name, 0) + 1
+        self.graph_built.emit(generation, (outgoing, incoming, set(paths), names))
+    
+    def _on_graph_built(self, generation, tables):
+        if generation != self.generation:
+            return
+        self.outgoing, self.incoming, self.notes, self.names = tables
+        self.building = False
+        pending = list(self.pending)
+        self.pending.clear()
+        self.ready.emit()
+        if pending:
+            self.update_notes(pending)
+    
+    def _update_note(self, path):
+        relative = workspace_relative(self.root, path)
+        if not relative:
+            return
+        for key, target, line in self.outgoing.pop(relative, ()):
+            sources = self.incoming.get(key)
+            if sources is None:
+                continue
+            sources.pop(relative, None)
+            if not sources:
+                del self.incoming[key]
+        
+        name = self.note_name(relative)
+        if self.store.note(path) is None:
+            if relative in self.notes:
+                self.notes.discard(relative)
+                self.names[name] -= 1
+                if not self.names[name]:
+                    del self.names[name]
+            return
+        if relative not in self.notes:
+            self.notes.add(relative)
+            self.names[name] = self.names.get(name, 0) + 1
+        self._add_edges(self.outgoing, self.incoming, relative, self.store.links_from(path))
+
+class BacklinksPanel(QWidget):
+    """Notes linking to the current one, or the workspace's broken links"""
+    file_opened = pyqtSignal(str)
+    
+    def __init__(self, link_graph, parent=None):
+        super().__init__(parent)
+        self.link_graph = link_graph
+        self.current_path = None
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        
+        header = QHBoxLayout()
+        self.summary_label = QLabel()
+        header.addWidget(self.summary_label, 1)
+        self.report_button = QPushButton("Broken links")
+        self.report_button.setCheckable(True)
+        self.report_button.toggled.connect(self.refresh)
+        header.addWidget(self.report_button)
+        layout.addLayout(header)
+        
+        self.links_view = QTextBrowser()
+        self.links_view.setOpenLinks(False)
+        self.links_view.anchorClicked.connect(lambda url: self.file_opened.emit(url.toLocalFile()))
+        layout.addWidget(self.links_view)
+        
+        self.link_graph.ready.connect(self.refresh)
+        self.link_graph.changed.connect(self.refresh)
+    
+    def set_current_file(self, path):
+        self.current_path = path
+        if not self.report_button.isChecked():
+            self.refresh()
+    
+    def refresh(self):
+        if self.report_button.isChecked():
+            self._show_broken_links()
+        else:
+            self._show_backlinks()
+    
+    def _note_link(self, path):
+        facts = self.link_graph.store.note(path)
+        title = facts['title'] if facts is not None else os.path.basename(path)
+        relative = os.path.relpath(path, self.link_graph.root)
+        return (
+            f'<a href="{escape(QUrl.fromLocalFile(path).toString())}" '
+            f'style="color: {NeonPalette.NEON_BLUE};">{escape(title)}</a> '
+            f'<span style="color: {NeonPalette.TEXT_MUTED};">{escape(relative)}</span>'
         )
-        
-        if confirm == QMessageBox.Yes:
-            try:
-                if os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-                else:
-                    os.remove(file_path)
-                
-                # Refresh tree
-                self.populate_tree(self.current_root)
-            except Exception as e:
-                QMessageBox.warning(self, "Error", f"Could not delete: {str(e)}")
+    
+    def _show_backlinks(self):
+        if not self.current_path:
+            self.summary_label.setText("No file")
+            self.links_view.clear()
+            return
+        backlinks = self.link_graph.backlinks(self.current_path)
+        self.summary_label.setText(f"{len(backlinks)} linking notes")
+        parts = []
+        for source, links in backlinks:
+            lines = ', '.join(str(line + 1) for target, line in links)
+            parts.append(f'<p>{self._note_link(source)}<br>line {lines}</p>')
+        self.links_view.setHtml(''.join(parts))
+    
+    def _show_broken_links(self):
+        broken = self.link_graph.broken_links()
+        self.summary_label.setText(f"{len(broken)} broken links")
+        parts = []
+        previous = None
+        for source, target, line in broken:
+            if source != previous:
+                if previous is not None:
+                    parts.append('</p>')
+                parts.append(f'<p>{self._note_link(source)}')
+                previous = source
+            parts.append(f'<br>line {line + 1}: <code>{escape(target)}</code>')
+        if previous is not None:
+            parts.append('</p>')
+        self.links_view.setHtml(''.join(parts))
 
 class ThemeManager:
     """Manages application themes and styling"""
@@ -669,6 +4151,7 @@ class ThemeManager:
         self._update_markdown_editors()
         self._update_toolbars()
         self._update_menus()
+        self._update_preview()
         
         # Store current theme
         self.current_theme = theme_name
@@ -677,23 +4160,23 @@ class ThemeManager:
         """Update file explorer styling"""
         for explorer in self.main_window.findChildren(MarkdownFileExplorer):
             explorer.setStyleSheet(f"""
-            QTreeWidget {{
+            QTreeView {{
                 background-color: {NeonPalette.BACKGROUND_DARK};
                 color: {NeonPalette.TEXT_COLOR};
                 border: 1px solid {NeonPalette.NEON_BLUE};
                 font-family: 'Inter UI', Arial, sans-serif;
             }}
-            QTreeWidget::item {{
+            QTreeView::item {{
                 background-color: {NeonPalette.BACKGROUND_DARK};
                 color: {NeonPalette.TEXT_COLOR};
                 padding: 5px;
                 margin: 2px;
             }}
-            QTreeWidget::item:hover {{
+            QTreeView::item:hover {{
                 background-color: {NeonPalette.BACKGROUND_SECONDARY};
                 color: {NeonPalette.NEON_BLUE};
             }}
-            QTreeWidget::item:selected {{
+            QTreeView::item:selected {{
                 background-color: {NeonPalette.NEON_BLUE};
                 color: {NeonPalette.TEXT_COLOR};
             }}
@@ -701,9 +4184,9 @@ class ThemeManager:
     
     def _update_markdown_editors(self):
         """Update markdown editor styling"""
-        for editor in self.main_window.findChildren(QTextEdit):
+        for editor in self.main_window.findChildren(QPlainTextEdit):
             editor.setStyleSheet(f"""
-            QTextEdit {{
+            QPlainTextEdit {{
                 background-color: {NeonPalette.BACKGROUND_DARK};
                 color: {NeonPalette.TEXT_COLOR};
                 border: 1px solid {NeonPalette.NEON_BLUE};
@@ -734,27 +4217,903 @@ class ThemeManager:
             }}
             """)
     
-    def _update_menus(self):
-        """Update menu styling"""
-        for menu in self.main_window.findChildren(QMenu):
-            menu.setStyleSheet(f"""
-            QMenu {{
-                background-color: {NeonPalette.BACKGROUND_DARK};
-                color: {NeonPalette.TEXT_COLOR};
-                border: 1px solid {NeonPalette.NEON_BLUE};
-            }}
-            QMenu::item {{
-                background-color: {NeonPalette.BACKGROUND_DARK};
-                color: {NeonPalette.TEXT_COLOR};
-                padding: 5px;
-            }}
-            QMenu::item:selected {{
-                background-color: {NeonPalette.NEON_BLUE};
-                color: {NeonPalette.TEXT_COLOR};
-            }}
-            """)
+    def _update_preview(self):
+        """Rebuild the preview page with the new palette"""
+        self.main_window.preview_patcher.invalidate()
+        self.main_window.preview_cache.clear()
+        self.main_window.update_preview()
+    
+    def _update_menus(self):
+        """Update menu styling"""
+        for menu in self.main_window.findChildren(QMenu):
+            menu.setStyleSheet(f"""
+            QMenu {{
+                background-color: {NeonPalette.BACKGROUND_DARK};
+                color: {NeonPalette.TEXT_COLOR};
+                border: 1px solid {NeonPalette.NEON_BLUE};
+            }}
+            QMenu::item {{
+                background-color: {NeonPalette.BACKGROUND_DARK};
+                color: {NeonPalette.TEXT_COLOR};
+                padding: 5px;
+            }}
+            QMenu::item:selected {{
+                background-color: {NeonPalette.NEON_BLUE};
+                color: {NeonPalette.TEXT_COLOR};
+            }}
+            """)
+
+def warm_up_imports():
+    """Import the markdown engines and Pygments ahead of the first render"""
+    import markdown
+    import mistune
+    import mistune.toc
+    import pygments.formatters
+    import pygments.lexers
+
+class CodeHighlighter:
+    """Pygments code highlighting with cached lexers, formatters and output.
+    
+    Highlighted HTML is kept in a bounded LRU keyed on (language, style,
+    code hash), and lexer and formatter instances are created once per
+    language and style instead of once per code block.
+    """
+    
+    def __init__(self, style='monokai', max_entries=512):
+        self.style = style
+        self.max_entries = max_entries
+        self.cache = OrderedDict()
+        self.lexers = {}
+        self.formatters = {}
+        self.lock = threading.Lock()
+    
+    def highlight(self, code, language=None, style=None):
+        """Return the highlighted HTML for a code block"""
+        language = (language or 'text').lower()
+        style = style or self.style
+        key = (language, style, hashlib.blake2b(code.encode('utf-8'), digest_size=16).digest())
+        
+        with self.lock:
+            html = self.cache.get(key)
+            if html is not None:
+                self.cache.move_to_end(key)
+                return html
+            
+            lexer = self._lexer(language)
+            if lexer is None:
+                html = f'<pre><code>{escape(code)}</code></pre>'
+            else:
+                import pygments
+                # HtmlFormatter already wraps its output in div.highlight > pre
+                html = pygments.highlight(code, lexer, self._formatter(style))
+            
+            self.cache[key] = html
+            if len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+            return html
+    
+    def _lexer(self, language):
+        """Return a cached lexer, or None if Pygments does not know the language"""
+        if language not in self.lexers:
+            from pygments.lexers import get_lexer_by_name
+            from pygments.util import ClassNotFound
+            try:
+                self.lexers[language] = get_lexer_by_name(language)
+            except ClassNotFound:
+                self.lexers[language] = None
+        return self.lexers[language]
+    
+    def _formatter(self, style):
+        """Return a cached inline-style HTML formatter"""
+        if style not in self.formatters:
+            from pygments.formatters import HtmlFormatter
+            self.formatters[style] = HtmlFormatter(noclasses=True, style=style)
+        return self.formatters[style]
+
+# Reconciles the preview container with an ordered list of block keys.
+# Blocks already in the DOM are kept (and moved if needed), new ones are
+# created from the HTML in the patch, and anything left over is removed.
+PREVIEW_PATCH_SCRIPT = """
+window.noteismPatch = function (patch) {
+    var root = document.getElementById('noteism-preview');
+    var existing = {};
+    for (var node = root.firstElementChild; node; node = node.nextElementSibling) {
+        existing[node.getAttribute('data-key')] = node;
+    }
+    var cursor = root.firstElementChild;
+    patch.order.forEach(function (key) {
+        var block = existing[key];
+        if (block) {
+            delete existing[key];
+        } else {
+            block = document.createElement('div');
+            block.className = 'md-block';
+            block.setAttribute('data-key', key);
+            block.innerHTML = patch.blocks[key];
+        }
+        if (block === cursor) {
+            cursor = cursor.nextElementSibling;
+        } else {
+            root.insertBefore(block, cursor);
+        }
+    });
+    Object.keys(existing).forEach(function (key) {
+        root.removeChild(existing[key]);
+    });
+};
+"""
+
+def build_preview_shell(html_content='<p>Markdown Preview</p>'):
+    """Build the persistent preview page that block patches are applied to"""
+    full_html = f"""
+    <html>
+    <head>
+        <style>
+            html, body {{ 
+                background-color: {NeonPalette.BACKGROUND_DARK} !important; 
+                color: {NeonPalette.TEXT_COLOR} !important; 
+                font-family: 'Inter UI', Arial, sans-serif; 
+                padding: 20px;
+                margin: 0;
+            }}
+            ::-webkit-scrollbar {{
+                width: 10px;
+                background-color: {NeonPalette.BACKGROUND_SECONDARY};
+            }}
+            ::-webkit-scrollbar-thumb {{
+                background-color: {NeonPalette.NEON_BLUE};
+                border-radius: 5px;
+            }}
+            pre {{ 
+                background-color: {NeonPalette.BACKGROUND_SECONDARY} !important; 
+                padding: 15px; 
+                border-radius: 5px; 
+                border: 1px solid {NeonPalette.NEON_BLUE};
+                overflow-x: auto;
+                color: {NeonPalette.TEXT_COLOR} !important;
+            }}
+            code {{ 
+                color: {NeonPalette.NEON_GREEN} !important; 
+                font-family: 'Fira Code', monospace; 
+                background-color: {NeonPalette.BACKGROUND_SECONDARY} !important;
+                padding: 2px 4px;
+                border-radius: 3px;
+            }}
+            h1, h2, h3 {{ 
+                color: {NeonPalette.NEON_BLUE} !important; 
+                border-bottom: 1px solid {NeonPalette.NEON_BLUE};
+                padding-bottom: 0.3em;
+            }}
+            a {{ 
+                color: {NeonPalette.ACCENT_BLUE} !important; 
+                text-decoration: none; 
+            }}
+            a:hover {{ 
+                text-decoration: underline; 
+                color: {NeonPalette.NEON_BLUE} !important; 
+            }}
+            blockquote {{
+                border-left: 4px solid {NeonPalette.NEON_PURPLE};
+                padding-left: 10px;
+                color: {NeonPalette.TEXT_MUTED} !important;
+                font-style: italic;
+                background-color: {NeonPalette.BACKGROUND_SECONDARY} !important;
+            }}
+            p, li, td, th {{
+                color: {NeonPalette.TEXT_COLOR} !important;
+            }}
+        </style>
+    </head>
+    <body>
+        <div id="noteism-preview">{html_content}</div>
+        <script>{PREVIEW_PATCH_SCRIPT}</script>
+    </body>
+    </html>
+    """
+    
+    return full_html
+
+# Top-level markdown block patterns used by the incremental renderer
+FENCE_OPEN_RE = re.compile(r'^ {0,3}(`{3,}|~{3,})[ \t]*([\w+#.-]*)')
+ATX_HEADING_RE = re.compile(r'^ {0,3}#{1,6}(?:[ \t]|$)')
+LIST_ITEM_RE = re.compile(r'^ {0,3}(?:[*+-]|\d+[.)])[ \t]+')
+TABLE_SEPARATOR_RE = re.compile(r'^ {0,3}\|?[ \t]*:?-+:?[ \t]*(?:\|[ \t]*:?-+:?[ \t]*)*\|?[ \t]*$')
+HTML_BLOCK_RE = re.compile(
+    r'^ {0,3}<(address|article|aside|blockquote|details|div|dl|fieldset|figure|'
+    r'footer|form|h[1-6]|header|nav|ol|p|pre|section|table|ul)[\s>/]',
+    re.IGNORECASE
+)
+REFERENCE_DEF_RE = re.compile(r'^ {0,3}\[([^\]^][^\]]*)\]:[ \t]*\S')
+FOOTNOTE_DEF_RE = re.compile(r'^ {0,3}\[\^([^\]]+)\]:[ \t]?(.*)$')
+FOOTNOTE_REF_RE = re.compile(r'\[\^([^\]\s]+)\](?!:)')
+LINK_LABEL_RE = re.compile(r'\[([^\[\]]+)\]')
+HEADING_ID_RE = re.compile(r'(<h[1-6] id=")([^"]+)(")')
+
+def _is_blank(line):
+    return not line.strip()
+
+def _is_indented(line):
+    return line.startswith('    ') or line.startswith('\t')
+
+def _normalize_label(label):
+    return ' '.join(label.lower().split())
+
+def split_markdown_blocks(markdown_text, footnotes=False):
+    """Split markdown into top-level blocks.
+    
+    Returns a tuple of (blocks, reference_defs, footnote_defs). Blocks are
+    (kind, text) pairs in document order. Reference definitions are pulled
+    out of the flow and keyed by normalized label so every block can be
+    rendered with the definitions it uses; footnote definitions are only
+    extracted when footnotes is True.
+    """
+    lines = markdown_text.split('\n')
+    line_count = len(lines)
+    blocks = []
+    reference_defs = {}
+    footnote_defs = {}
+    
+    i = 0
+    while i < line_count:
+        line = lines[i]
+        if _is_blank(line):
+            i += 1
+            continue
+        
+        # Fenced code runs to its closing fence; unterminated fences are text
+        fence_match = FENCE_OPEN_RE.match(line)
+        if fence_match:
+            fence = fence_match.group(1)
+            close_re = re.compile(r'^ {0,3}%s{%d,}[ \t]*$' % (re.escape(fence[0]), len(fence)))
+            j = i + 1
+            while j < line_count and not close_re.match(lines[j]):
+                j += 1
+            if j < line_count:
+                blocks.append(('code', '\n'.join(lines[i:j + 1])))
+                i = j + 1
+                continue
+        
+        if ATX_HEADING_RE.match(line):
+            blocks.append(('heading', line))
+            i += 1
+            continue
+        
+        footnote_match = FOOTNOTE_DEF_RE.match(line) if footnotes else None
+        if footnote_match:
+            body = [footnote_match.group(2)]
+            j = i + 1
+            while j < line_count:
+                if _is_indented(lines[j]):
+                    body.append(lines[j][4:] if lines[j].startswith('    ') else lines[j][1:])
+                    j += 1
+                elif _is_blank(lines[j]) and j + 1 < line_count and _is_indented(lines[j + 1]):
+                    body.append('')
+                    j += 1
+                elif not _is_blank(lines[j]) and not FOOTNOTE_DEF_RE.match(lines[j]) \
+                        and not REFERENCE_DEF_RE.match(lines[j]) and not _is_blank(lines[j - 1]):
+                    # Lazy continuation of the footnote paragraph
+                    body.append(lines[j])
+                    j += 1
+                else:
+                    break
+            footnote_defs[footnote_match.group(1)] = '\n'.join(body)
+            i = j
+            continue
+        
+        reference_match = REFERENCE_DEF_RE.match(line)
+        if reference_match:
+            reference_defs[_normalize_label(reference_match.group(1))] = line
+            i += 1
+            continue
+        
+        j = i + 1
+        if _is_indented(line):
+            # Indented code continues across blank lines
+            kind = 'code'
+            while j < line_count and (_is_blank(lines[j]) or _is_indented(lines[j])):
+                j += 1
+            while _is_blank(lines[j - 1]):
+                j -= 1
+        elif HTML_BLOCK_RE.match(line):
+            # Raw HTML may contain blank lines; run to the closing tag
+            kind = 'html'
+            closing = f'</{HTML_BLOCK_RE.match(line).group(1).lower()}>'
+            j = i
+            while j < line_count and closing not in lines[j].lower():
+                j += 1
+            j = min(j + 1, line_count)
+            while j < line_count and not _is_blank(lines[j]):
+                j += 1
+        elif LIST_ITEM_RE.match(line):
+            # Lists continue across blank lines while items or indented content follow
+            kind = 'list'
+            while j < line_count:
+                if _is_blank(lines[j]):
+                    k = j
+                    while k < line_count and _is_blank(lines[k]):
+                        k += 1
+                    if k < line_count and (_is_indented(lines[k]) or LIST_ITEM_RE.match(lines[k])):
+                        j = k
+                        continue
+                    break
+                if not _is_indented(lines[j]) and (
+                        FENCE_OPEN_RE.match(lines[j]) or ATX_HEADING_RE.match(lines[j])):
+                    break
+                j += 1
+        else:
+            kind = 'paragraph'
+            while j < line_count and not _is_blank(lines[j]) \
+                    and not FENCE_OPEN_RE.match(lines[j]) \
+                    and not ATX_HEADING_RE.match(lines[j]) \
+                    and not REFERENCE_DEF_RE.match(lines[j]) \
+                    and not (footnotes and FOOTNOTE_DEF_RE.match(lines[j])):
+                j += 1
+            if j - i > 1 and '|' in line and TABLE_SEPARATOR_RE.match(lines[i + 1]):
+                kind = 'table'
+        
+        blocks.append((kind, '\n'.join(lines[i:j])))
+        i = j
+    
+    return blocks, reference_defs, footnote_defs
+
+# Python-Markdown extension profiles, one reusable Markdown instance each
+MARKDOWN_PROFILES = {
+    'preview': {
+        'extensions': ['fenced_code', 'codehilite'],
+        'extension_configs': {}
+    },
+    'export': {
+        'extensions': [
+            'markdown.extensions.extra', 
+            'markdown.extensions.codehilite', 
+            'markdown.extensions.toc',
+            'markdown.extensions.tables',
+            'markdown.extensions.fenced_code'
+        ],
+        'extension_configs': {
+            'markdown.extensions.codehilite': {
+                'css_class': 'highlight',
+                'linenums': False,
+                'guess_lang': False
+            }
+        }
+    }
+}
+
+# mistune plugin equivalents of the Python-Markdown profiles above
+MISTUNE_PROFILES = {
+    'preview': {
+        'plugins': ['table', 'footnotes', 'strikethrough'],
+        'toc': False
+    },
+    'export': {
+        'plugins': ['table', 'footnotes', 'def_list', 'abbr'],
+        'toc': True
+    }
+}
+
+def slugify_heading(text):
+    """Build a heading id the same way Python-Markdown's toc extension does"""
+    value = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    value = re.sub(r'[^\w\s-]', '', value).strip().lower()
+    return re.sub(r'[-\s]+', '-', value)
+
+class MarkdownConverter:
+    """Convert markdown with reusable markdown.Markdown instances.
+    
+    Building a Markdown object loads and configures every extension, so one
+    instance is built per profile and reset() between documents. Instances
+    are per thread, which lets the preview worker and the GUI thread convert
+    concurrently.
+    """
+    
+    name = 'python-markdown'
+    
+    def __init__(self, profiles=None):
+        self.profiles = profiles or MARKDOWN_PROFILES
+        self.local = threading.local()
+    
+    def convert(self, markdown_text, profile='preview'):
+        """Convert markdown to HTML using the named extension profile"""
+        return self.instance(profile).reset().convert(markdown_text)
+    
+    def instance(self, profile):
+        """Return this thread's Markdown instance for a profile"""
+        instances = getattr(self.local, 'instances', None)
+        if instances is None:
+            instances = self.local.instances = {}
+        
+        md = instances.get(profile)
+        if md is None:
+            import markdown
+            config = self.profiles[profile]
+            md = markdown.Markdown(
+                extensions=config['extensions'], 
+                extension_configs=config['extension_configs']
+            )
+            instances[profile] = md
+        return md
+
+class MistuneConverter:
+    """Convert markdown with mistune 3, the fast engine for live preview.
+    
+    Exposes the same convert(markdown_text, profile) interface as
+    MarkdownConverter, with tables, footnotes and TOC heading ids provided
+    by mistune plugins. Raw HTML is passed through as Python-Markdown does.
+    """
+    name = 'mistune'
+    
+    def __init__(self, profiles=None):
+        self.profiles = profiles or MISTUNE_PROFILES
+        self.local = threading.local()
+    
+    def convert(self, markdown_text, profile='preview'):
+        """Convert markdown to HTML using the named plugin profile"""
+        return self.instance(profile)(markdown_text)
+    
+    def instance(self, profile):
+        """Return this thread's mistune Markdown instance for a profile"""
+        instances = getattr(self.local, 'instances', None)
+        if instances is None:
+            instances = self.local.instances = {}
+        
+        md = instances.get(profile)
+        if md is None:
+            import mistune
+            from mistune.toc import add_toc_hook
+            config = self.profiles[profile]
+            md = mistune.create_markdown(escape=False, plugins=config['plugins'])
+            if config['toc']:
+                add_toc_hook(md, min_level=1, max_level=6, heading_id=self._heading_id)
+            instances[profile] = md
+        return md
+    
+    def _heading_id(self, token, index):
+        """Unique slug ids for headings, reset at the first heading of each document"""
+        if index == 0:
+            self.local.heading_ids = set()
+        seen = self.local.heading_ids
+        
+        base = slugify_heading(token['text'])
+        heading_id = base
+        count = 0
+        while heading_id in seen or not heading_id:
+            count += 1
+            heading_id = f'{base}_{count}'
+        seen.add(heading_id)
+        return heading_id
+
+# Markdown engines selectable for the live preview
+MARKDOWN_ENGINES = {
+    MarkdownConverter.name: MarkdownConverter,
+    MistuneConverter.name: MistuneConverter
+}
+
+class IncrementalMarkdownRenderer:
+    """Render markdown block by block with a per-block HTML cache.
+    
+    The document is split into top-level blocks and each block's HTML is
+    cached under a hash of its source plus the link definitions it uses,
+    so an edit only re-renders the blocks it touched. Footnotes are
+    numbered document-wide and collected into a trailing footnote block.
+    """
+    
+    def __init__(self, converter, profile, code_block_renderer=None, 
+                 footnotes=False, max_entries=4096):
+        self.converter = converter
+        self.profile = profile
+        self.code_block_renderer = code_block_renderer
+        self.footnotes = footnotes
+        self.max_entries = max_entries
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def render(self, markdown_text):
+        """Render a whole document to HTML"""
+        return '\n'.join(html for _, html in self.render_blocks(markdown_text))
+    
+    def render_blocks(self, markdown_text):
+        """Render a document to a list of (block_hash, html) pairs"""
+        blocks, reference_defs, footnote_defs = split_markdown_blocks(
+            markdown_text, footnotes=self.footnotes
+        )
+        footnote_numbers = {
+            label: number for number, label in enumerate(footnote_defs, 1)
+        }
+        
+        rendered = []
+        for kind, text in blocks:
+            if kind == 'code':
+                source = text
+            else:
+                source = self._with_definitions(
+                    self._replace_footnote_refs(text, footnote_numbers), reference_defs
+                )
+            rendered.append(self._render_cached(kind, source))
+        
+        self._dedupe_heading_ids(rendered)
+        
+        if footnote_defs:
+            rendered.append(self._render_footnotes(footnote_defs, reference_defs))
+        
+        return rendered
+    
+    def clear(self):
+        """Drop every cached block"""
+        with self.lock:
+            self.cache.clear()
+    
+    def _dedupe_heading_ids(self, rendered):
+        """Make heading ids unique across blocks, as the toc extension would"""
+        seen = set()
+        
+        def unique(match):
+            heading_id = match.group(2)
+            while heading_id in seen:
+                base, _, count = heading_id.rpartition('_')
+                heading_id = f'{base}_{int(count) + 1}' if base and count.isdigit() else f'{heading_id}_1'
+            seen.add(heading_id)
+            return match.group(1) + heading_id + match.group(3)
+        
+        for index, (key, html) in enumerate(rendered):
+            if '<h' not in html or ' id="' not in html:
+                continue
+            unique_html = HEADING_ID_RE.sub(unique, html)
+            if unique_html != html:
+                rendered[index] = (f'{key}:{index}', unique_html)
+    
+    def _with_definitions(self, text, reference_defs):
+        """Append the reference definitions a block actually uses"""
+        if not reference_defs or '[' not in text:
+            return text
+        used = []
+        for label in LINK_LABEL_RE.findall(text):
+            definition = reference_defs.get(_normalize_label(label))
+            if definition and definition not in used:
+                used.append(definition)
+        if not used:
+            return text
+        return text + '\n\n' + '\n'.join(used)
+    
+    def _replace_footnote_refs(self, text, footnote_numbers):
+        """Swap footnote references for their document-wide numbered markup"""
+        if not footnote_numbers or '[^' not in text:
+            return text
+        
+        def replace(match):
+            label = match.group(1)
+            number = footnote_numbers.get(label)
+            if number is None:
+                return match.group(0)
+            return (f'<sup id="fnref:{label}"><a class="footnote-ref" '
+                    f'href="#fn:{label}">{number}</a></sup>')
+        
+        return FOOTNOTE_REF_RE.sub(replace, text)
+    
+    def _render_footnotes(self, footnote_defs, reference_defs):
+        """Render the trailing footnote list"""
+        items = []
+        for number, (label, body) in enumerate(footnote_defs.items(), 1):
+            _, html = self._render_cached('footnote', self._with_definitions(body, reference_defs))
+            html = html.rstrip()
+            backref = (f'&#160;<a class="footnote-backref" href="#fnref:{label}" '
+                       f'title="Jump back to footnote {number} in the text">&#8617;</a>')
+            if html.endswith('</p>'):
+                html = html[:-4] + backref + '</p>'
+            else:
+                html += f'\n<p>{backref}</p>'
+            items.append(f'<li id="fn:{label}">\n{html}\n</li>')
+        
+        html = '<div class="footnote">\n<hr />\n<ol>\n' + '\n'.join(items) + '\n</ol>\n</div>'
+        return hashlib.blake2b(html.encode('utf-8'), digest_size=16).hexdigest(), html
+    
+    def _render_cached(self, kind, source):
+        """Return (hash, html) for a block, rendering it only on a cache miss"""
+        converter = self.converter
+        key = hashlib.blake2b(
+            f'{converter.name}\0{kind}\0{source}'.encode('utf-8'), digest_size=16
+        ).hexdigest()
+        with self.lock:
+            html = self.cache.get(key)
+            if html is not None:
+                self.cache.move_to_end(key)
+                return key, html
+        
+        html = self._render_block(converter, kind, source)
+        
+        with self.lock:
+            self.cache[key] = html
+            if len(self.cache) > self.max_entries:
+                self.cache.popitem(last=False)
+        return key, html
+    
+    def _render_block(self, converter, kind, source):
+        """Render a single block"""
+        if kind == 'code' and self.code_block_renderer:
+            lines = source.split('\n')
+            fence_match = FENCE_OPEN_RE.match(source)
+            if fence_match:
+                code = '\n'.join(lines[1:-1]) + '\n'
+                return self.code_block_renderer(code, fence_match.group(2) or None)
+            # Indented code block
+            code = '\n'.join(line[4:] if line.startswith('    ') else line[1:] for line in lines)
+            return self.code_block_renderer(code + '\n', None)
+        
+        return converter.convert(source, self.profile)
+
+class PreviewRenderSignals(QObject):
+    """Signals emitted by a preview render task back to the GUI thread"""
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+class PreviewRenderTask(QRunnable):
+    """Render one immutable markdown snapshot on a worker thread"""
+    
+    def __init__(self, generation, markdown_text, render_func):
+        super().__init__()
+        self.generation = generation
+        self.markdown_text = markdown_text
+        self.render_func = render_func
+        self.signals = PreviewRenderSignals()
+    
+    def run(self):
+        try:
+            html = self.render_func(self.markdown_text)
+        except Exception as e:
+            self.signals.failed.emit(self.generation, str(e))
+        else:
+            self.signals.finished.emit(self.generation, html)
+
+class PreviewRenderPipeline(QObject):
+    """Debounced, off-thread preview rendering.
+    
+    Bursts of edits are coalesced by a single-shot timer. When it fires, the
+    editor text is snapshotted and rendered on a worker thread; results that
+    belong to an older generation than the latest edit are discarded. Each
+    result is reported with the editor and document revision it was
+    rendered from.
+    """
+    # editor, document revision, blocks
+    rendered = pyqtSignal(object, int, object)
+    
+    DEFAULT_DEBOUNCE_MS = 150
+    
+    def __init__(self, render_func, debounce_ms=DEFAULT_DEBOUNCE_MS, parent=None):
+        super().__init__(parent)
+        self.render_func = render_func
+        
+        # Generation of the most recent edit; bumped on every schedule()
+        self.generation = 0
+        self.pending_editor = None
+        self.active_task = None
+        # (editor, revision) of the snapshot being rendered
+        self.active_source = None
+        
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce_ms)
+        self.debounce_timer.timeout.connect(self._start_render)
+        
+        # A single worker keeps renders ordered and never competes with itself
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+    
+    def set_debounce(self, debounce_ms):
+        """Change the quiet period required before a render starts"""
+        self.debounce_timer.setInterval(max(0, int(debounce_ms)))
+    
+    def schedule(self, editor):
+        """Request a render of the editor's text once edits settle"""
+        if editor is None:
+            return
+        self.generation += 1
+        self.pending_editor = editor
+        self.debounce_timer.start()
+    
+    def _start_render(self):
+        """Snapshot the pending editor and hand it to the worker"""
+        if self.active_task is not None or self.pending_editor is None:
+            # A finished render will pick up the pending editor
+            return
+        
+        editor, self.pending_editor = self.pending_editor, None
+        try:
+            markdown_text = editor.toPlainText()
+            revision = editor.document().revision()
+        except RuntimeError:
+            # Editor was closed while the timer was pending
+            return
+        
+        task = PreviewRenderTask(self.generation, markdown_text, self.render_func)
+        task.signals.finished.connect(self._on_render_finished)
+        task.signals.failed.connect(self._on_render_failed)
+        
+        # Keep the task (and its signals object) alive until it reports back
+        self.active_task = task
+        self.active_source = (editor, revision)
+        self.thread_pool.start(task)
+    
+    def _on_render_finished(self, generation, result):
+        self.active_task = None
+        (editor, revision), self.active_source = self.active_source, None
+        if generation == self.generation:
+            self.rendered.emit(editor, revision, result)
+        elif not self.debounce_timer.isActive():
+            # Stale result; render the newer edits that arrived meanwhile
+            self._start_render()
+    
+    def _on_render_failed(self, generation, message):
+        self.active_task = None
+        self.active_source = None
+        print(f"Error rendering preview: {message}")
+        if generation != self.generation and not self.debounce_timer.isActive():
+            self._start_render()
+
+class PreviewDomPatcher(QObject):
+    """Keep one preview page loaded and patch changed blocks into it.
+    
+    The shell page is loaded once; each render is then sent through
+    runJavaScript as the ordered list of block keys plus HTML for only the
+    keys the page does not already hold. Unchanged blocks stay in the DOM,
+    so scroll position survives and the page never flickers.
+    """
+    
+    def __init__(self, view, shell_builder, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.shell_builder = shell_builder
+        
+        # Keys currently present in the page, in order
+        self.dom_keys = []
+        self.shell_loaded = False
+        self.shell_ready = False
+        self.pending_blocks = None
+        self.pending_scroll = None
+        
+        self.view.loadFinished.connect(self._on_load_finished)
+    
+    def load_shell(self):
+        """(Re)load the shell page; patches queue until it has finished loading"""
+        self.dom_keys = []
+        self.shell_loaded = True
+        self.shell_ready = False
+        self.view.setHtml(self.shell_builder())
+    
+    def invalidate(self):
+        """Force the shell to be rebuilt before the next patch (e.g. after a theme change)"""
+        self.shell_loaded = False
+        self.shell_ready = False
+    
+    def show_page(self, html):
+        """Replace the preview with a standalone page"""
+        self.invalidate()
+        self.view.setHtml(html)
+    
+    def apply(self, blocks, scroll=None):
+        """Patch a list of (block_hash, html) pairs into the page, then scroll to scroll if given"""
+        self.pending_blocks = blocks
+        if scroll is not None:
+            self.pending_scroll = scroll
+        if not self.shell_loaded:
+            self.load_shell()
+        elif self.shell_ready:
+            self._flush()
+    
+    def _on_load_finished(self, ok):
+        if not self.shell_loaded or self.shell_ready:
+            # A standalone page or a navigation inside the shell
+            return
+        self.shell_ready = ok
+        if ok and self.pending_blocks is not None:
+            self._flush()
+    
+    def scroll_position(self):
+        """Return the page's vertical scroll offset"""
+        return self.view.page().scrollPosition().y()
+    
+    def _flush(self):
+        blocks, self.pending_blocks = self.pending_blocks, None
+        scroll, self.pending_scroll = self.pending_scroll, None
+        
+        # Identical blocks may repeat, so DOM keys carry an occurrence count
+        occurrences = {}
+        order = []
+        html_by_key = {}
+        for block_hash, html in blocks:
+            count = occurrences.get(block_hash, 0)
+            occurrences[block_hash] = count + 1
+            key = f'{block_hash}-{count}'
+            order.append(key)
+            html_by_key[key] = html
+        
+        present = set(self.dom_keys)
+        patch = {
+            'order': order,
+            'blocks': {key: html for key, html in html_by_key.items() if key not in present}
+        }
+        self.dom_keys = order
+        script = f'window.noteismPatch({json.dumps(patch)});'
+        if scroll is not None:
+            script += f' window.scrollTo(0, {float(scroll)});'
+        self.view.page().runJavaScript(script)
+
+class PreviewCacheEntry:
+    """A tab's last rendered preview, the revision it was rendered from and its scroll offset"""
+    __slots__ = ('revision', 'blocks', 'size', 'scroll')
+    
+    def __init__(self, revision, blocks, size, scroll=0):
+        self.revision = revision
+        self.blocks = blocks
+        self.size = size
+        self.scroll = scroll
+
+class PreviewCache:
+    """Memory-bounded LRU of each tab's last rendered preview.
+    
+    Entries are keyed by editor and remember the document revision they
+    were rendered from, so a tab whose text has not changed since can be
+    shown again without rendering. Least recently shown tabs are dropped
+    once the HTML held exceeds the budget; an editor's entry goes with it
+    when the editor is deleted.
+    """
+    
+    # Key, tuple and list overhead per block, roughly
+    BYTES_PER_BLOCK = 128
+    
+    def __init__(self, budget_bytes=32 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+    
+    def get(self, editor):
+        """Return the editor's entry, or None, marking it most recently used"""
+        entry = self.entries.get(editor)
+        if entry is not None:
+            self.entries.move_to_end(editor)
+        return entry
+    
+    def store(self, editor, revision, blocks):
+        """Remember the blocks rendered from the editor's text at revision"""
+        entry = self.entries.get(editor)
+        if entry is None:
+            # Closed and hibernated tabs delete their editor
+            editor.destroyed.connect(lambda: self.discard(editor))
+            entry = PreviewCacheEntry(revision, blocks, 0)
+            self.entries[editor] = entry
+        else:
+            self.total_bytes -= entry.size
+            entry.revision = revision
+            entry.blocks = blocks
+            self.entries.move_to_end(editor)
+        entry.size = sum(len(html) + self.BYTES_PER_BLOCK for _, html in blocks)
+        self.total_bytes += entry.size
+        
+        # The entry just stored is always kept, even if it alone is over budget
+        while self.total_bytes > self.budget_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.total_bytes -= evicted.size
+    
+    def set_scroll(self, editor, scroll):
+        """Remember where the editor's preview was scrolled"""
+        entry = self.entries.get(editor)
+        if entry is not None:
+            entry.scroll = scroll
+    
+    def discard(self, editor):
+        """Forget the editor's entry"""
+        entry = self.entries.pop(editor, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+    
+    def clear(self):
+        """Drop every entry, e.g. when rendered output would no longer match"""
+        self.entries.clear()
+        self.total_bytes = 0
 
 class NoteismMarkdownEditor(QMainWindow):
+    # Wall-clock times of the startup milestones, emitted once startup is done
+    startup_finished = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Noteism - Markdown Editor")
@@ -799,7 +5158,7 @@ class NoteismMarkdownEditor(QMainWindow):
         }}
         
         /* Text Edit / Markdown Editor */
-        QTextEdit {{
+        QTextEdit, QPlainTextEdit {{
             background-color: {NeonPalette.BACKGROUND_DARK};
             color: {NeonPalette.TEXT_COLOR};
             border: 1px solid {NeonPalette.NEON_BLUE};
@@ -887,40 +5246,81 @@ class NoteismMarkdownEditor(QMainWindow):
         self.editor_tabs = QTabWidget()
         self.editor_tabs.setTabsClosable(True)
         self.editor_tabs.tabCloseRequested.connect(self.close_tab)
+        self.editor_tabs.currentChanged.connect(self._on_current_tab_changed)
+        self.editor_tabs.currentChanged.connect(self.show_tab_preview)
+        
+        # Files at least this many MB open in the read-only viewer (0 disables it)
+        self.large_file_viewer_mb = 0
+        
+        # Block-level renderers keep per-block HTML caches between renders
+        self.code_highlighter = CodeHighlighter(style='monokai')
+        self.markdown_engines = {
+            name: engine() for name, engine in MARKDOWN_ENGINES.items()
+        }
+        self.preview_renderer = IncrementalMarkdownRenderer(
+            self.markdown_engines[MistuneConverter.name], 
+            'preview', 
+            code_block_renderer=self.code_highlighter.highlight,
+            footnotes=True
+        )
+        self.export_renderer = IncrementalMarkdownRenderer(
+            self.markdown_engines[MarkdownConverter.name], 
+            'export', 
+            footnotes=True
+        )
+        
+        # File reads and writes run on worker threads
+        self.file_io = FileIoService(self)
+        
+        # Unsaved edits are journaled for crash recovery
+        self.journal_manager = EditJournalManager(
+            os.path.join(self.current_root, '.noteism', 'recovery'), 
+            parent=self
+        )
+        self.pending_recovery = {}
+        self.auto_saver = AutoSaveEngine(self.editor_tabs, self._write_editor, parent=self)
+        self.auto_saver.saved.connect(
+            lambda file_path, written, seconds: self._report_save("Auto-saved", file_path, written, seconds)
+        )
+        self.auto_saver.failed.connect(
+            lambda file_path, message: self.statusBar().showMessage(f"Auto-save failed: {message}", 3000)
+        )
+        
+        # Preview rendering runs debounced on a worker thread
+        self.preview_pipeline = PreviewRenderPipeline(self.render_preview, parent=self)
+        self.preview_pipeline.rendered.connect(self._on_preview_rendered)
+        
+        # Each tab's last render is kept, so switching tabs shows it at once
+        self.preview_cache = PreviewCache()
+        # Editor whose text the preview page currently shows
+        self.preview_editor = None
+        
+        # Background tabs release their editors when idle or over the memory budget
+        self.tab_hibernator = TabHibernator(self.editor_tabs, self._create_editor, self.journal_manager, parent=self)
+        
+        # Open tabs are remembered across restarts
+        self.session_manager = SessionManager(
+            os.path.join(self.current_root, '.noteism', 'session.json'), 
+            self.editor_tabs, 
+            self.file_io, 
+            parent=self
+        )
+        
+        # Right Pane: Markdown Preview, created by finish_startup after the first paint.
+        # Set before the first tab, whose currentChanged reaches show_tab_preview
+        self.preview_view = QWidget()
+        self.preview_patcher = None
         
         # Create initial tab
         self.create_new_tab()
         
-        # Right Pane: Markdown Preview
-        self.preview_view = QWebEngineView()
-        
-        # Set initial dark theme HTML for preview pane
-        self.preview_view.setHtml(f"""
-        <html>
-        <head>
-            <style>
-                html, body {{ 
-                    background-color: {NeonPalette.BACKGROUND_DARK} !important; 
-                    color: {NeonPalette.TEXT_COLOR} !important; 
-                    font-family: 'Inter UI', Arial, sans-serif; 
-                    padding: 20px;
-                    margin: 0;
-                }}
-                p {{ 
-                    color: {NeonPalette.TEXT_COLOR} !important; 
-                }}
-            </style>
-        </head>
-        <body>
-            <p>Markdown Preview</p>
-        </body>
-        </html>
-        """)
+        self.startup_times = {'window_created': None, 'first_paint': None, 'interactive': None}
         
         # Add widgets to splitter
         splitter.addWidget(self.file_explorer)
         splitter.addWidget(self.editor_tabs)
         splitter.addWidget(self.preview_view)
+        self.main_splitter = splitter
         
         # Set splitter sizes
         splitter.setSizes([200, 600, 400])
@@ -935,18 +5335,90 @@ class NoteismMarkdownEditor(QMainWindow):
         # Connect file explorer signal
         self.file_explorer.file_opened.connect(self.open_markdown_file)
         
+        # Notes under the explorer root are indexed for full-text search
+        self.search_index = SearchIndex(self.file_explorer.current_root, parent=self)
+        self.search_index.indexing_finished.connect(
+            lambda updated, removed: self.statusBar().showMessage(
+                f"Search index: {updated} updated, {removed} removed", 2000
+            )
+        )
+        self.file_explorer.file_model.directory_changed.connect(self.search_index.update_directory)
+        
+        # Titles, headings, links and word counts are cached per note
+        self.metadata_store = MetadataStore(self.file_explorer.current_root, parent=self)
+        self.metadata_store.scan_finished.connect(lambda updated, removed, seconds: self.update_workspace_summary())
+        # The read-only viewer's word count comes from the store
+        self.metadata_store.scan_finished.connect(self.update_status)
+        self.file_explorer.file_model.directory_changed.connect(self.metadata_store.update_directory)
+        self.file_explorer.file_model.metadata_store = self.metadata_store
+        
+        # Backlinks are looked up in a link graph kept in step with the metadata store
+        self.link_graph = LinkGraph(self.metadata_store, parent=self)
+        
+        # Note paths are kept in memory for quick-open
+        self.path_index = PathIndex(self.file_explorer.current_root, parent=self)
+        self.file_explorer.file_model.directory_changed.connect(self.path_index.update_directory)
+        self.quick_open_dialog = None
+        
+        # Create dockable panels
+        self.create_panels()
+        
         # Create status bar
         self.create_status_bar()
         
-        # Connect signals
-        self.current_editor().textChanged.connect(self.update_preview)
-        
         # Initialize QSettings for persistent configuration
         self.settings = QSettings('CloudWerx Lab', 'Noteism')
         
+        QApplication.instance().applicationStateChanged.connect(self._on_application_state_changed)
+        self.startup_times['window_created'] = time.time()
+    
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.startup_times['first_paint'] is None:
+            self.startup_times['first_paint'] = time.time()
+            # Posted after this paint, so the rest of startup never delays it
+            QTimer.singleShot(0, self.finish_startup)
+    
+    def finish_startup(self):
+        """Create the preview, restore settings and the session, and start the indexes"""
+        # Markdown engines and Pygments load on a worker while the web view is built
+        self.preview_pipeline.thread_pool.start(FileIoTask(warm_up_imports))
+        self.create_preview()
+        
         # Restore previous settings
         self.restore_settings()
         
+        # Reopen the previous session's tabs, then files with edits it never saved
+        self.restore_session()
+        self.recover_unsaved_edits()
+        
+        # Catch up with notes changed while the app was closed or in the background
+        self.search_index.reconcile()
+        self.metadata_store.reconcile()
+        self.link_graph.rebuild()
+        self.path_index.rebuild()
+        
+        QTimer.singleShot(0, self._on_startup_idle)
+    
+    def _on_startup_idle(self):
+        self.startup_times['interactive'] = time.time()
+        self.startup_finished.emit(dict(self.startup_times))
+    
+    def create_preview(self):
+        """Replace the preview placeholder with the web view and load the persistent page"""
+        # main() sets AA_ShareOpenGLContexts, which lets this import follow QApplication
+        from PyQt5.QtWebEngineWidgets import QWebEngineView
+        
+        placeholder = self.preview_view
+        self.preview_view = QWebEngineView()
+        self.main_splitter.replaceWidget(self.main_splitter.indexOf(placeholder), self.preview_view)
+        placeholder.deleteLater()
+        
+        # Renders are patched into the persistent page
+        self.preview_patcher = PreviewDomPatcher(self.preview_view, build_preview_shell, parent=self)
+        self.preview_patcher.load_shell()
+        self.update_preview()
+        
     def change_font_family(self, font_name):
         """Change font family for all open editors"""
         font = QFont(font_name)
@@ -973,47 +5445,114 @@ class NoteismMarkdownEditor(QMainWindow):
         """Set tab width for all open editors"""
         for i in range(self.editor_tabs.count()):
             editor = self.editor_tabs.widget(i)
-            editor.setTabStopDistance(width * 10)  # Approximate pixel width
+            if isinstance(editor, QPlainTextEdit):
+                editor.setTabStopDistance(width * 10)  # Approximate pixel width
+            elif isinstance(editor, HibernatedTab):
+                editor.tab_stop_distance = width * 10
         
         # Persist tab width preference
         self.settings.setValue("editor/tab_width", width)
     
+    def set_preview_debounce(self, debounce_ms):
+        """Set how long typing must pause before the preview re-renders"""
+        self.preview_pipeline.set_debounce(debounce_ms)
+        
+        # Persist preview debounce preference
+        self.settings.setValue("markdown/preview_debounce_ms", debounce_ms)
+    
+    def set_preview_engine(self, engine_name):
+        """Choose the markdown engine used for the live preview"""
+        if engine_name not in self.markdown_engines:
+            engine_name = MistuneConverter.name
+        
+        if self.preview_renderer.converter.name != engine_name:
+            # Cached blocks are keyed per engine, but rendered tabs are not
+            self.preview_renderer.converter = self.markdown_engines[engine_name]
+            self.preview_cache.clear()
+            self.update_preview()
+        
+        # Persist preview engine preference
+        self.settings.setValue("markdown/preview_engine", engine_name)
+    
+    def set_large_file_viewer_threshold(self, megabytes):
+        """Open files of at least this many MB in the read-only viewer; 0 disables it"""
+        self.large_file_viewer_mb = megabytes
+        
+        # Persist large file viewer preference
+        self.settings.setValue("editor/large_file_viewer_mb", megabytes)
+    
+    def set_tab_memory_budget(self, megabytes):
+        """Hibernate background tabs once open editors use roughly this many MB; 0 disables it"""
+        self.tab_hibernator.set_budget(megabytes)
+        
+        # Persist tab memory budget preference
+        self.settings.setValue("editor/tab_memory_budget_mb", megabytes)
+    
+    def set_tab_idle_minutes(self, minutes):
+        """Hibernate background tabs unused for this many minutes; 0 disables it"""
+        self.tab_hibernator.set_idle_minutes(minutes)
+        
+        # Persist tab idle preference
+        self.settings.setValue("editor/tab_idle_minutes", minutes)
+    
     def set_auto_save_interval(self, interval):
-        """Set auto save interval and start/stop timer"""
-        # Stop existing timer if it exists
-        if hasattr(self, 'auto_save_timer'):
-            self.auto_save_timer.stop()
-        
-        # If interval is 0, auto-save is disabled
-        if interval > 0:
-            # Create or recreate timer
-            self.auto_save_timer = QTimer(self)
-            self.auto_save_timer.timeout.connect(self.auto_save)
-            self.auto_save_timer.start(interval * 60 * 1000)  # Convert minutes to milliseconds
+        """Set auto save interval in minutes; 0 disables auto-save"""
+        self.auto_saver.set_interval(interval)
         
         # Persist auto-save preference
         self.settings.setValue("editor/auto_save_interval", interval)
     
-    def auto_save(self):
-        """Automatically save all modified files"""
-        for i in range(self.editor_tabs.count()):
-            editor = self.editor_tabs.widget(i)
-            file_path = editor.property("file_path")
-            
-            # Check if file has been saved before and is modified
-            if file_path and editor.document().isModified():
+    def _write_editor(self, editor, file_path, on_saved=None, on_error=None):
+        """Snapshot an editor's text and write it to file_path in the background"""
+        document = editor.document()
+        revision = document.revision()
+        journal_mark = self.journal_manager.mark(editor)
+        # Tabs are not hibernated while a save of theirs is in flight
+        editor.saves_in_flight += 1
+        
+        def saved(result):
+            editor.saves_in_flight -= 1
+            closed_journal = getattr(editor, 'closed_journal', None)
+            if closed_journal is not None:
+                # The tab closed while its last write was in flight; the edits are on disk now
+                if not editor.saves_in_flight:
+                    self.journal_manager.delete(closed_journal)
+            else:
                 try:
-                    with open(file_path, 'w', encoding='utf-8') as file:
-                        file.write(editor.toPlainText())
-                    
-                    # Mark document as not modified after saving
-                    editor.document().setModified(False)
-                    
-                    # Show status message
-                    self.statusBar().showMessage(f"Auto-saved: {os.path.basename(file_path)}", 2000)
-                except Exception as e:
-                    # Show error if auto-save fails
-                    self.statusBar().showMessage(f"Auto-save failed: {str(e)}", 3000)
+                    # Edits made while the write was in flight keep the tab modified
+                    if document.revision() == revision:
+                        document.setModified(False)
+                    self.journal_manager.saved(editor, file_path, result[2], journal_mark)
+                except RuntimeError:
+                    # Tab was closed before the write finished
+                    pass
+            if result[0]:
+                self.search_index.update_file(file_path)
+                self.metadata_store.update_file(file_path)
+            self.path_index.add(file_path)
+            if on_saved is not None:
+                on_saved(result)
+        
+        def failed(message):
+            try:
+                editor.saves_in_flight -= 1
+            except RuntimeError:
+                pass
+            if on_error is not None:
+                on_error(message)
+        
+        self.file_io.write(file_path, document_text_chunks(document), saved, failed)
+    
+    def _report_save(self, action, file_path, written, seconds):
+        """Show a finished save's size and latency in the status bar"""
+        name = os.path.basename(file_path)
+        if written:
+            size = f"{written} bytes" if written < 1024 else f"{written / 1024:.1f} KB"
+            self.last_save_label.setText(f"Last save: {size} in {seconds * 1000:.0f} ms")
+            self.statusBar().showMessage(f"{action}: {name}", 2000)
+        else:
+            self.last_save_label.setText(f"Last save: unchanged ({seconds * 1000:.0f} ms)")
+            self.statusBar().showMessage(f"{action}: {name} (unchanged on disk)", 2000)
     
     def restore_settings(self):
         """Restore previously saved application settings"""
@@ -1023,40 +5562,69 @@ class NoteismMarkdownEditor(QMainWindow):
         tab_width = self.settings.value("editor/tab_width", 4, type=int)
         auto_save_interval = self.settings.value("editor/auto_save_interval", 0, type=int)
         preview_style = self.settings.value("markdown/preview_style", "Default")
+        preview_engine = self.settings.value("markdown/preview_engine", MistuneConverter.name)
+        large_file_viewer_mb = self.settings.value("editor/large_file_viewer_mb", 0, type=int)
+        tab_memory_budget_mb = self.settings.value("editor/tab_memory_budget_mb", 512, type=int)
+        tab_idle_minutes = self.settings.value("editor/tab_idle_minutes", 30, type=int)
+        preview_debounce = self.settings.value(
+            "markdown/preview_debounce_ms", 
+            PreviewRenderPipeline.DEFAULT_DEBOUNCE_MS, 
+            type=int
+        )
         theme = self.settings.value("application/theme", "Neon Dark")
         
-        # These methods will be called after initialization to apply saved settings
-        QTimer.singleShot(0, lambda: [
-            self.change_font_family(font_family),
-            self.change_font_size(font_size),
-            self.set_tab_width(tab_width),
-            self.set_auto_save_interval(auto_save_interval),
-            self.change_preview_style(preview_style),
-            self.theme_manager.apply_theme(theme)
-        ])
+        # Called from finish_startup, once the preview exists
+        self.change_font_family(font_family)
+        self.change_font_size(font_size)
+        self.set_tab_width(tab_width)
+        self.set_auto_save_interval(auto_save_interval)
+        self.change_preview_style(preview_style)
+        self.set_preview_debounce(preview_debounce)
+        self.set_preview_engine(preview_engine)
+        self.set_large_file_viewer_threshold(large_file_viewer_mb)
+        self.set_tab_memory_budget(tab_memory_budget_mb)
+        self.set_tab_idle_minutes(tab_idle_minutes)
+        self.theme_manager.apply_theme(theme)
     
     def create_new_tab(self, file_path=None):
         """Create a new markdown editor tab"""
-        editor = QTextEdit()
+        editor = self._create_editor(file_path)
+        
+        # Determine tab name
+        tab_name = os.path.basename(file_path) if file_path else "Untitled"
+        
+        # Add tab; the tooltip holds the path used when saving
+        tab_index = self.editor_tabs.addTab(editor, tab_name)
+        if file_path:
+            self.editor_tabs.setTabToolTip(tab_index, file_path)
+        self.editor_tabs.setCurrentIndex(tab_index)
+        
+        return editor
+    
+    def _create_editor(self, file_path=None):
+        """Build an editor widget for file_path without adding it to a tab"""
+        # QPlainTextEdit relayouts only the edited block, unlike QTextEdit
+        editor = QPlainTextEdit()
         editor.setFont(QFont("Fira Code", 10))
+        editor.saves_in_flight = 0
+        
+        # Add markdown highlighter, lazy for large documents
+        editor.highlighter = MarkdownHighlighter(editor.document())
+        editor.highlight_scheduler = LazyHighlightScheduler(editor, editor.highlighter)
+        editor.outline = DocumentOutline(editor.document(), editor.highlighter, parent=editor)
         
-        # Add markdown highlighter
-        MarkdownHighlighter(editor.document())
+        # Status bar counts follow edits; nothing is recounted while idle
+        editor.statistics = DocumentStatistics(editor.document(), parent=editor)
+        editor.statistics.changed.connect(lambda: self._on_editor_status_changed(editor))
+        editor.cursorPositionChanged.connect(lambda: self._on_editor_status_changed(editor, cursor_only=True))
+        editor.selectionChanged.connect(lambda: self._on_editor_selection_changed(editor))
         
         # Connect text changed signal
         editor.textChanged.connect(self.update_preview)
+        self.session_manager.watch(editor)
         
-        # Determine tab name
         if file_path:
-            tab_name = os.path.basename(file_path)
             editor.setProperty("file_path", file_path)
-        else:
-            tab_name = "Untitled"
-        
-        # Add tab
-        tab_index = self.editor_tabs.addTab(editor, tab_name)
-        self.editor_tabs.setCurrentIndex(tab_index)
-        
         return editor
     
     def current_editor(self):
@@ -1065,122 +5633,313 @@ class NoteismMarkdownEditor(QMainWindow):
     
     def close_tab(self, index):
         """Close a specific tab"""
+        widget = self.editor_tabs.widget(index)
+        if widget is None:
+            return
         self.editor_tabs.removeTab(index)
+        self._dispose_tab_widget(widget)
         
         # Ensure at least one tab remains
         if self.editor_tabs.count() == 0:
             self.create_new_tab()
     
+    def _dispose_tab_widget(self, widget):
+        """Release a removed tab's widget, its journal and any file it maps"""
+        if isinstance(widget, LargeFileViewer):
+            widget.release()
+        else:
+            # With a save in flight the journal is kept until the write lands; if it fails, it is replayed
+            if getattr(widget, 'saves_in_flight', 0):
+                widget.closed_journal = self.journal_manager.detach(widget, keep=True)
+            else:
+                self.journal_manager.detach(widget)
+            if isinstance(widget, HibernatedTab):
+                widget.release()
+        widget.deleteLater()
+    
+    def _start_journal(self, editor, file_path, digest):
+        """Journal a freshly loaded editor, replaying edits recovered from an earlier session"""
+        recovered = self.pending_recovery.pop(os.path.abspath(file_path), None)
+        if recovered is None:
+            self.journal_manager.attach(editor, file_path, digest)
+            return
+        
+        base_digest, records, journal_path = recovered
+        name = os.path.basename(file_path)
+        if base_digest != digest:
+            # The file changed on disk after the journal was written; set the journal aside
+            os.replace(journal_path, journal_path + '.stale')
+            self.journal_manager.attach(editor, file_path, digest)
+            self.statusBar().showMessage(f"Could not recover edits to {name}: file changed on disk", 5000)
+            return
+        
+        cursor = QTextCursor(editor.document())
+        for position, removed, text in records:
+            cursor.setPosition(position)
+            cursor.setPosition(position + removed, QTextCursor.KeepAnchor)
+            cursor.insertText(text)
+        self.journal_manager.attach(editor, file_path, digest, records)
+        self.statusBar().showMessage(f"Recovered unsaved edits: {name}", 5000)
+    
+    def recover_unsaved_edits(self):
+        """Reopen files whose journals hold edits that were never saved"""
+        for file_path, recovered in self.journal_manager.recover().items():
+            journal_path = recovered[2]
+            if not os.path.exists(file_path):
+                os.replace(journal_path, journal_path + '.stale')
+                continue
+            self.pending_recovery[os.path.abspath(file_path)] = recovered
+            # Tabs restored from the session replay their edits when they are first loaded
+            if self._find_tab(file_path) == -1:
+                self.open_markdown_file(file_path)
+    
+    def _on_current_tab_changed(self, index):
+        """Wake hibernated tabs and only offer formatting tools for editable tabs"""
+        if isinstance(self.editor_tabs.widget(index), UnloadedTab):
+            # Loading adds the real tab and makes it current, which comes back here
+            self._load_unloaded_tab(index)
+            return
+        self.tab_hibernator.activate(index)
+        widget = self.editor_tabs.widget(index)
+        self.formatting_toolbar.setEnabled(isinstance(widget, QPlainTextEdit))
+    
+    def _find_tab(self, file_path):
+        """Return the index of the tab holding file_path, or -1"""
+        for i in range(self.editor_tabs.count()):
+            if self.editor_tabs.widget(i).property("file_path") == file_path:
+                return i
+        return -1
+    
+    def restore_session(self):
+        """Reopen the previous session's tabs; only the current one is loaded now"""
+        session = self.session_manager.load()
+        if not session:
+            return
+        
+        # Replace the empty tab created at startup
+        initial = self.editor_tabs.widget(0) if self.editor_tabs.count() == 1 else None
+        if not isinstance(initial, QPlainTextEdit) or initial.property("file_path") \
+                or not initial.document().isEmpty():
+            initial = None
+        
+        current = None
+        for i, state in enumerate(session.get('tabs', [])):
+            file_path = state.get('path')
+            if file_path and not os.path.exists(file_path):
+                continue
+            placeholder = UnloadedTab(file_path, state, text=state.get('text'))
+            index = self.editor_tabs.addTab(
+                placeholder, os.path.basename(file_path) if file_path else "Untitled"
+            )
+            if file_path:
+                self.editor_tabs.setTabToolTip(index, file_path)
+            if i <= session.get('current', 0) or current is None:
+                current = index
+        if current is None:
+            return
+        
+        self.editor_tabs.setCurrentIndex(current)
+        if initial is not None:
+            self.close_tab(self.editor_tabs.indexOf(initial))
+    
+    def _load_unloaded_tab(self, index):
+        """Load a restored session tab in place of its placeholder"""
+        placeholder = self.editor_tabs.widget(index)
+        file_path = placeholder.property("file_path")
+        try:
+            if file_path:
+                self.load_file_into_new_tab(file_path, placeholder.view_state)
+            else:
+                editor = self.create_new_tab()
+                editor.setPlainText(placeholder.text or '')
+                editor.document().setModified(True)
+                self._apply_view_state(editor, placeholder.view_state)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Could not open file: {str(e)}")
+            self.close_tab(self.editor_tabs.indexOf(placeholder))
+            return
+        
+        # The new tab is current now; move it to where the placeholder was
+        self.editor_tabs.removeTab(self.editor_tabs.indexOf(placeholder))
+        placeholder.deleteLater()
+        self.editor_tabs.tabBar().moveTab(self.editor_tabs.count() - 1, index)
+    
+    @staticmethod
+    def _apply_view_state(widget, view_state):
+        """Restore a tab's saved cursor and scroll position"""
+        if not view_state:
+            return
+        if isinstance(widget, QPlainTextEdit):
+            length = widget.document().characterCount() - 1
+            cursor = widget.textCursor()
+            cursor.setPosition(min(view_state.get('anchor', 0), length))
+            cursor.setPosition(min(view_state.get('position', 0), length), QTextCursor.KeepAnchor)
+            widget.setTextCursor(cursor)
+        # Scroll once the widget has been laid out
+        scroll = view_state.get('scroll', 0)
+        QTimer.singleShot(0, lambda: widget.verticalScrollBar().setValue(scroll))
+    
     def open_markdown_file(self, file_path):
         """Open a markdown file in the editor"""
+        # Check if file is already open
+        index = self._find_tab(file_path)
+        if index != -1:
+            # Activate existing tab
+            self.editor_tabs.setCurrentIndex(index)
+            return
+        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            self.load_file_into_new_tab(file_path)
+        except Exception as e:
+            QMessageBox.warning(self, "Error", f"Could not open file: {str(e)}")
+    
+    def load_file_into_new_tab(self, file_path, view_state=None):
+        """Open a file in a new tab, streaming large files and mapping huge ones read-only"""
+        file_size = os.path.getsize(file_path)
+        
+        if self.large_file_viewer_mb and file_size >= self.large_file_viewer_mb * 1024 * 1024:
+            viewer = LargeFileViewer(file_path)
+            self.session_manager.watch(viewer)
+            tab_index = self.editor_tabs.addTab(viewer, f"{os.path.basename(file_path)} (read-only)")
+            self.editor_tabs.setTabToolTip(tab_index, file_path)
+            self.editor_tabs.setCurrentIndex(tab_index)
+            self._apply_view_state(viewer, view_state)
+            return
+        
+        if file_size < LargeFileLoader.THRESHOLD_BYTES:
+            # The tab stays read-only until the background read completes
+            editor = self.create_new_tab(file_path)
+            editor.setReadOnly(True)
             
-            # Check if file is already open
-            for i in range(self.editor_tabs.count()):
-                editor = self.editor_tabs.widget(i)
-                if editor.property("file_path") == file_path:
-                    # Activate existing tab
-                    self.editor_tabs.setCurrentIndex(i)
-                    return
+            def loaded(result):
+                content, digest = result
+                try:
+                    editor.highlight_scheduler.configure_for_size(len(content))
+                    editor.setPlainText(content)
+                    editor.setReadOnly(False)
+                    self._start_journal(editor, file_path, digest)
+                    self._apply_view_state(editor, view_state)
+                except RuntimeError:
+                    # Tab was closed before the read finished
+                    pass
             
-            # Create new tab and set content
-            editor = self.create_new_tab(file_path)
-            editor.setPlainText(content)
+            def failed(message):
+                try:
+                    self.close_tab(self.editor_tabs.indexOf(editor))
+                except RuntimeError:
+                    pass
+                QMessageBox.warning(self, "Error", f"Could not open file: {message}")
+            
+            self.file_io.read(file_path, loaded, failed)
+            return
         
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Could not open file: {str(e)}")
+        editor = self.create_new_tab(file_path)
+        editor.highlight_scheduler.configure_for_size(file_size)
+        try:
+            self._stream_into_editor(editor, file_path, view_state)
+        except Exception:
+            self.close_tab(self.editor_tabs.indexOf(editor))
+            raise
+    
+    def _stream_into_editor(self, editor, file_path, view_state=None):
+        """Load a large file into an editor in chunks behind a cancellable progress dialog"""
+        loader = LargeFileLoader(editor, file_path, parent=editor)
+        progress = QProgressDialog(
+            f"Loading {os.path.basename(file_path)}...", 
+            "Cancel", 
+            0, 
+            1000, 
+            self
+        )
+        progress.setWindowTitle("Opening Large File")
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        
+        def on_progress(done, total):
+            progress.setValue(int(done * 1000 / total))
+        
+        def dismiss():
+            # Closing the dialog emits canceled, so disconnect first
+            progress.canceled.disconnect(on_canceled)
+            progress.close()
+            progress.deleteLater()
+            loader.deleteLater()
+        
+        def on_finished():
+            dismiss()
+            self._start_journal(editor, file_path, loader.digest.digest())
+            self._apply_view_state(editor, view_state)
+            # Loading bypassed the undo stack, so the document revision never moved
+            self.preview_cache.discard(editor)
+            self.update_preview()
+        
+        def on_failed(message):
+            dismiss()
+            self.close_tab(self.editor_tabs.indexOf(editor))
+            QMessageBox.warning(self, "Error", f"Could not open file: {message}")
+        
+        def on_canceled():
+            loader.cancel()
+            dismiss()
+            self.close_tab(self.editor_tabs.indexOf(editor))
+        
+        loader.progress.connect(on_progress)
+        loader.finished.connect(on_finished)
+        loader.failed.connect(on_failed)
+        progress.canceled.connect(on_canceled)
+        loader.start()
     
     def update_preview(self):
-        """Convert markdown to HTML and update preview"""
+        """Schedule a debounced background render of the current editor"""
         editor = self.current_editor()
-        markdown_text = editor.toPlainText()
-        
-        # Use Pygments for code block syntax highlighting
-        def highlight_code_blocks(match):
-            code = match.group(1)
-            language = match.group(2) or 'text'
-            try:
-                lexer = get_lexer_by_name(language)
-                formatter = HtmlFormatter(noclasses=True, style='monokai')
-                highlighted_code = pygments.highlight(code, lexer, formatter)
-                return f'<pre>{highlighted_code}</pre>'
-            except Exception:
-                return f'<pre><code>{code}</code></pre>'
-        
-        # Markdown with code block highlighting
-        code_block_pattern = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
-        markdown_with_code = code_block_pattern.sub(highlight_code_blocks, markdown_text)
+        if not isinstance(editor, QPlainTextEdit):
+            return
+        entry = self.preview_cache.get(editor)
+        if editor is self.preview_editor and entry is not None \
+                and entry.revision == editor.document().revision():
+            # The preview already shows this text
+            return
+        self.preview_pipeline.schedule(editor)
+    
+    def show_tab_preview(self, index):
+        """Show the current tab's cached preview at once, rendering only if its text changed"""
+        editor = self.current_editor()
+        if self.preview_patcher is None or editor is self.preview_editor \
+                or not isinstance(editor, QPlainTextEdit):
+            return
         
-        html_content = markdown.markdown(markdown_with_code, extensions=['fenced_code', 'codehilite'])
+        if self.preview_editor is not None:
+            self.preview_cache.set_scroll(self.preview_editor, self.preview_patcher.scroll_position())
         
-        full_html = f"""
-        <html>
-        <head>
-            <style>
-                html, body {{ 
-                    background-color: {NeonPalette.BACKGROUND_DARK} !important; 
-                    color: {NeonPalette.TEXT_COLOR} !important; 
-                    font-family: 'Inter UI', Arial, sans-serif; 
-                    padding: 20px;
-                    margin: 0;
-                }}
-                ::-webkit-scrollbar {{
-                    width: 10px;
-                    background-color: {NeonPalette.BACKGROUND_SECONDARY};
-                }}
-                ::-webkit-scrollbar-thumb {{
-                    background-color: {NeonPalette.NEON_BLUE};
-                    border-radius: 5px;
-                }}
-                pre {{ 
-                    background-color: {NeonPalette.BACKGROUND_SECONDARY} !important; 
-                    padding: 15px; 
-                    border-radius: 5px; 
-                    border: 1px solid {NeonPalette.NEON_BLUE};
-                    overflow-x: auto;
-                    color: {NeonPalette.TEXT_COLOR} !important;
-                }}
-                code {{ 
-                    color: {NeonPalette.NEON_GREEN} !important; 
-                    font-family: 'Fira Code', monospace; 
-                    background-color: {NeonPalette.BACKGROUND_SECONDARY} !important;
-                    padding: 2px 4px;
-                    border-radius: 3px;
-                }}
-                h1, h2, h3 {{ 
-                    color: {NeonPalette.NEON_BLUE} !important; 
-                    border-bottom: 1px solid {NeonPalette.NEON_BLUE};
-                    padding-bottom: 0.3em;
-                }}
-                a {{ 
-                    color: {NeonPalette.ACCENT_BLUE} !important; 
-                    text-decoration: none; 
-                }}
-                a:hover {{ 
-                    text-decoration: underline; 
-                    color: {NeonPalette.NEON_BLUE} !important; 
-                }}
-                blockquote {{
-                    border-left: 4px solid {NeonPalette.NEON_PURPLE};
-                    padding-left: 10px;
-                    color: {NeonPalette.TEXT_MUTED} !important;
-                    font-style: italic;
-                    background-color: {NeonPalette.BACKGROUND_SECONDARY} !important;
-                }}
-                p, li, td, th {{
-                    color: {NeonPalette.TEXT_COLOR} !important;
-                }}
-            </style>
-        </head>
-        <body>
-            {html_content}
-        </body>
-        </html>
-        """
+        entry = self.preview_cache.get(editor)
+        if entry is None:
+            # Shown once the render for this tab arrives
+            self.preview_editor = None
+            self.preview_pipeline.schedule(editor)
+            return
         
-        self.preview_view.setHtml(full_html)
+        self.preview_patcher.apply(entry.blocks, scroll=entry.scroll)
+        self.preview_editor = editor
+        if entry.revision != editor.document().revision():
+            self.preview_pipeline.schedule(editor)
+    
+    def render_preview(self, markdown_text):
+        """Render preview blocks for a text snapshot (runs on the preview worker)"""
+        return self.preview_renderer.render_blocks(markdown_text)
+    
+    def _on_preview_rendered(self, editor, revision, blocks):
+        """Cache a finished preview render and patch it in if its tab is current"""
+        try:
+            self.preview_cache.store(editor, revision, blocks)
+        except RuntimeError:
+            # The tab was closed while it rendered
+            return
+        if self.preview_patcher is None or editor is not self.current_editor():
+            return
+        # A tab shown for the first time starts at the top; re-renders keep the scroll
+        scroll = None if editor is self.preview_editor else 0
+        self.preview_patcher.apply(blocks, scroll=scroll)
+        self.preview_editor = editor
 
     def generate_markdown_html(self, markdown_text, style='Default'):
         """
@@ -1398,24 +6157,8 @@ class NoteismMarkdownEditor(QMainWindow):
         # Combine CSS
         full_css = base_css + (style_css.get(style, style_css['Default']) + syntax_css)
         
-        # Convert markdown to HTML
-        html_content = markdown.markdown(
-            markdown_text, 
-            extensions=[
-                'markdown.extensions.extra', 
-                'markdown.extensions.codehilite', 
-                'markdown.extensions.toc',
-                'markdown.extensions.tables',
-                'markdown.extensions.fenced_code'
-            ],
-            extension_configs={
-                'markdown.extensions.codehilite': {
-                    'css_class': 'highlight',
-                    'linenums': False,
-                    'guess_lang': False
-                }
-            }
-        )
+        # Convert markdown to HTML, re-rendering only changed blocks
+        html_content = self.export_renderer.render(markdown_text)
         
         # Combine CSS and HTML content
         full_html = f"""
@@ -1439,9 +6182,12 @@ class NoteismMarkdownEditor(QMainWindow):
         # Regenerate preview for all open tabs
         for i in range(self.editor_tabs.count()):
             editor = self.editor_tabs.widget(i)
+            # Empty tabs (such as the one at startup) have nothing to restyle
+            if not isinstance(editor, QPlainTextEdit) or editor.document().isEmpty():
+                continue
             markdown_text = editor.toPlainText()
             preview_html = self.generate_markdown_html(markdown_text, style)
-            self.preview_view.setHtml(preview_html)
+            self.preview_patcher.show_page(preview_html)
         
         # Persist preview style preference
         self.settings.setValue("markdown/preview_style", style)
@@ -1464,16 +6210,22 @@ class NoteismMarkdownEditor(QMainWindow):
         open_file_action.triggered.connect(self.open_file)
         file_menu.addAction(open_file_action)
         
+        # Quick Open Action
+        quick_open_action = QAction("Quick Open", self)
+        quick_open_action.setShortcut("Ctrl+P")
+        quick_open_action.triggered.connect(self.show_quick_open)
+        file_menu.addAction(quick_open_action)
+        
         # Save File Action
         save_file_action = QAction("Save", self)
         save_file_action.setShortcut("Ctrl+S")
-        save_file_action.triggered.connect(self.save_current_file)
+        save_file_action.triggered.connect(lambda: self.save_current_file())
         file_menu.addAction(save_file_action)
         
         # Save As Action
         save_as_action = QAction("Save As", self)
         save_as_action.setShortcut("Ctrl+Shift+S")
-        save_as_action.triggered.connect(self.save_file_as)
+        save_as_action.triggered.connect(lambda: self.save_file_as())
         file_menu.addAction(save_as_action)
         
         # Close Tab Action
@@ -1487,6 +6239,15 @@ class NoteismMarkdownEditor(QMainWindow):
         exit_action.setShortcut("Alt+F4")
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
+        
+        # View Menu; panels add their toggle actions in create_panels
+        self.view_menu = menubar.addMenu("&View")
+        
+        search_action = QAction("Search Notes", self)
+        search_action.setShortcut("Ctrl+Shift+F")
+        search_action.triggered.connect(self.show_search_panel)
+        self.view_menu.addAction(search_action)
+        self.view_menu.addSeparator()
 
         # Theme Menu
         theme_menu = menubar.addMenu("&Theme")
@@ -1577,6 +6338,26 @@ class NoteismMarkdownEditor(QMainWindow):
             tab_width_menu.addAction(width_action)
             tab_width_group.addAction(width_action)
         
+        # Large Files
+        large_files_menu = editor_settings_menu.addMenu("Read-Only Viewer For Files Over")
+        viewer_thresholds = [
+            ("Disabled", 0),
+            ("50 MB", 50),
+            ("100 MB", 100),
+            ("250 MB", 250),
+            ("500 MB", 500)
+        ]
+        viewer_threshold_group = QActionGroup(self)
+        viewer_threshold_group.setExclusive(True)
+        for label, megabytes in viewer_thresholds:
+            threshold_action = QAction(label, self, checkable=True)
+            threshold_action.setChecked(megabytes == 0)
+            threshold_action.triggered.connect(
+                lambda checked, mb=megabytes: self.set_large_file_viewer_threshold(mb)
+            )
+            large_files_menu.addAction(threshold_action)
+            viewer_threshold_group.addAction(threshold_action)
+        
         # Markdown Settings Submenu
         markdown_settings_menu = settings_menu.addMenu("Markdown")
         
@@ -1600,6 +6381,23 @@ class NoteismMarkdownEditor(QMainWindow):
             preview_style_menu.addAction(style_action)
             preview_style_group.addAction(style_action)
         
+        # Preview Engine
+        preview_engine_menu = markdown_settings_menu.addMenu("Preview Engine")
+        preview_engines = [
+            ("mistune (fast)", MistuneConverter.name),
+            ("Python-Markdown", MarkdownConverter.name)
+        ]
+        preview_engine_group = QActionGroup(self)
+        preview_engine_group.setExclusive(True)
+        for label, engine_name in preview_engines:
+            engine_action = QAction(label, self, checkable=True)
+            engine_action.setChecked(engine_name == MistuneConverter.name)
+            engine_action.triggered.connect(
+                lambda checked, en=engine_name: self.set_preview_engine(en)
+            )
+            preview_engine_menu.addAction(engine_action)
+            preview_engine_group.addAction(engine_action)
+        
         # Auto Save Settings
         auto_save_menu = settings_menu.addMenu("Auto Save")
         auto_save_intervals = [
@@ -1629,6 +6427,8 @@ class NoteismMarkdownEditor(QMainWindow):
         """Change editor line spacing"""
         for i in range(self.editor_tabs.count()):
             editor = self.editor_tabs.widget(i)
+            if not isinstance(editor, QPlainTextEdit):
+                continue
             cursor_format = QTextBlockFormat()
             cursor_format.setLineHeight(
                 line_spacing * 100, 
@@ -1639,15 +6439,6 @@ class NoteismMarkdownEditor(QMainWindow):
             cursor.setBlockFormat(cursor_format)
             editor.setTextCursor(cursor)
     
-    def set_auto_save_interval(self, interval):
-        """Set auto save interval"""
-        if interval > 0:
-            self.status_update_timer.stop()
-            self.status_update_timer.setInterval(interval * 60 * 1000)  # Convert to milliseconds
-            self.status_update_timer.start()
-        else:
-            self.status_update_timer.stop()
-    
     def open_preferences_dialog(self):
         """Open a comprehensive preferences dialog"""
         dialog = QDialog(self)
@@ -1746,27 +6537,9 @@ class NoteismMarkdownEditor(QMainWindow):
                     self.editor_tabs.setCurrentIndex(i)
                     return
             
-            # Read file contents
+            # Open in a new tab with the filename as title and full path as tooltip
             try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    content = file.read()
-                
-                # Create new tab
-                editor = self.create_new_tab()
-                editor.setPlainText(content)
-                
-                # Set file path as a property of the editor
-                editor.setProperty("file_path", file_path)
-                
-                # Add tab with filename and full path as tooltip
-                tab_index = self.editor_tabs.addTab(
-                    editor, 
-                    os.path.basename(file_path)
-                )
-                self.editor_tabs.setTabToolTip(tab_index, file_path)
-                
-                # Set current tab
-                self.editor_tabs.setCurrentIndex(tab_index)
+                self.load_file_into_new_tab(file_path)
             
             except Exception as e:
                 QMessageBox.warning(
@@ -1775,8 +6548,8 @@ class NoteismMarkdownEditor(QMainWindow):
                     f"Could not open file: {str(e)}"
                 )
     
-    def save_current_file(self):
-        """Save the current file"""
+    def save_current_file(self, on_saved=None):
+        """Save the current file; on_saved is called once the write has succeeded"""
         current_index = self.editor_tabs.currentIndex()
         if current_index == -1:
             return
@@ -1784,34 +6557,48 @@ class NoteismMarkdownEditor(QMainWindow):
         current_editor = self.editor_tabs.widget(current_index)
         current_file_path = self.editor_tabs.tabToolTip(current_index)
         
+        if not isinstance(current_editor, QPlainTextEdit) or current_editor.isReadOnly():
+            self.statusBar().showMessage("This tab is read-only", 2000)
+            return
+        
         if current_file_path:
-            # Existing file, save directly
-            try:
-                with open(current_file_path, 'w', encoding='utf-8') as file:
-                    file.write(current_editor.toPlainText())
-                
-                # Update tab name to reflect saved state
-                self.editor_tabs.setTabText(
-                    current_index, 
-                    os.path.basename(current_file_path)
-                )
-            except Exception as e:
-                QMessageBox.warning(
+            def saved(result):
+                self._report_save("Saved", current_file_path, result[0], result[1])
+                # Update tab name to reflect saved state; the tab may have moved or closed
+                try:
+                    index = self.editor_tabs.indexOf(current_editor)
+                except RuntimeError:
+                    return
+                if index != -1:
+                    self.editor_tabs.setTabText(index, os.path.basename(current_file_path))
+                if on_saved is not None:
+                    on_saved()
+            
+            # Existing file, save in the background
+            self._write_editor(
+                current_editor, 
+                current_file_path, 
+                on_saved=saved,
+                on_error=lambda message: QMessageBox.warning(
                     self, 
                     "Error", 
-                    f"Could not save file: {str(e)}"
+                    f"Could not save file: {message}"
                 )
+            )
         else:
             # No existing file, call save as
-            self.save_file_as()
+            self.save_file_as(on_saved)
     
-    def save_file_as(self):
-        """Save the current file with a new name"""
+    def save_file_as(self, on_saved=None):
+        """Save the current file with a new name; on_saved is called once the write has succeeded"""
         current_index = self.editor_tabs.currentIndex()
         if current_index == -1:
             return
         
         current_editor = self.editor_tabs.widget(current_index)
+        if not isinstance(current_editor, QPlainTextEdit) or current_editor.isReadOnly():
+            self.statusBar().showMessage("This tab is read-only", 2000)
+            return
         
         file_path, _ = QFileDialog.getSaveFileName(
             self, 
@@ -1825,23 +6612,35 @@ class NoteismMarkdownEditor(QMainWindow):
             if not file_path.lower().endswith('.md'):
                 file_path += '.md'
             
-            try:
-                with open(file_path, 'w', encoding='utf-8') as file:
-                    file.write(current_editor.toPlainText())
+            def saved(result):
+                self._report_save("Saved", file_path, result[0], result[1])
+                # The tab only points at the new path once it has been written
+                try:
+                    index = self.editor_tabs.indexOf(current_editor)
+                except RuntimeError:
+                    return
+                if index == -1:
+                    return
+                current_editor.setProperty("file_path", file_path)
                 
                 # Update tab with new filename and path
-                self.editor_tabs.setTabText(
-                    current_index, 
-                    os.path.basename(file_path)
-                )
-                self.editor_tabs.setTabToolTip(current_index, file_path)
+                self.editor_tabs.setTabText(index, os.path.basename(file_path))
+                self.editor_tabs.setTabToolTip(index, file_path)
+                self._update_backlinks_panel()
+                self.session_manager.schedule_save()
+                if on_saved is not None:
+                    on_saved()
             
-            except Exception as e:
-                QMessageBox.warning(
+            self._write_editor(
+                current_editor, 
+                file_path, 
+                on_saved=saved,
+                on_error=lambda message: QMessageBox.warning(
                     self, 
                     "Error", 
-                    f"Could not save file: {str(e)}"
+                    f"Could not save file: {message}"
                 )
+            )
     
     def close_current_tab(self):
         """Close the current tab"""
@@ -1851,7 +6650,7 @@ class NoteismMarkdownEditor(QMainWindow):
             current_editor = self.editor_tabs.widget(current_index)
             
             # If the file has unsaved changes, prompt for save
-            if current_editor.document().isModified():
+            if isinstance(current_editor, QPlainTextEdit) and current_editor.document().isModified():
                 reply = QMessageBox.question(
                     self, 
                     'Save Changes', 
@@ -1860,16 +6659,95 @@ class NoteismMarkdownEditor(QMainWindow):
                 )
                 
                 if reply == QMessageBox.Save:
-                    self.save_current_file()
+                    # Close once the write has landed; a failed or cancelled save keeps the tab open
+                    self.save_current_file(on_saved=lambda: self._close_saved_tab(current_editor))
+                    return
                 elif reply == QMessageBox.Cancel:
                     return
             
             # Close the tab
             self.editor_tabs.removeTab(current_index)
+            self._dispose_tab_widget(current_editor)
+    
+    def _close_saved_tab(self, editor):
+        """Close an editor's tab after a save, unless it was edited again meanwhile"""
+        try:
+            index = self.editor_tabs.indexOf(editor)
+            modified = editor.document().isModified()
+        except RuntimeError:
+            return
+        if index != -1 and not modified:
+            self.editor_tabs.removeTab(index)
+            self._dispose_tab_widget(editor)
+    
+    def closeEvent(self, event):
+        """Let background saves finish before the window closes"""
+        self.session_manager.save()
+        self.file_io.wait_for_done()
+        # Deliver the finished saves so their journals are compacted
+        QApplication.processEvents()
+        # Journals that still hold edits are replayed on the next start
+        self.journal_manager.close()
+        self.search_index.close()
+        self.metadata_store.close()
+        super().closeEvent(event)
+    
+    def create_panels(self):
+        """Create the dockable side panels and their View menu toggles"""
+        self.search_panel = SearchPanel(self.search_index)
+        self.search_panel.file_opened.connect(self.open_markdown_file)
+        self.search_dock = QDockWidget("Search", self)
+        self.search_dock.setObjectName("search_dock")
+        self.search_dock.setWidget(self.search_panel)
+        self.addDockWidget(Qt.LeftDockWidgetArea, self.search_dock)
+        self.search_dock.hide()
+        self.view_menu.addAction(self.search_dock.toggleViewAction())
+        
+        self.backlinks_panel = BacklinksPanel(self.link_graph)
+        self.backlinks_panel.file_opened.connect(self.open_markdown_file)
+        self.backlinks_dock = QDockWidget("Backlinks", self)
+        self.backlinks_dock.setObjectName("backlinks_dock")
+        self.backlinks_dock.setWidget(self.backlinks_panel)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.backlinks_dock)
+        self.backlinks_dock.hide()
+        self.view_menu.addAction(self.backlinks_dock.toggleViewAction())
+        self.editor_tabs.currentChanged.connect(self._update_backlinks_panel)
+        self._update_backlinks_panel()
+        
+        self.outline_panel = OutlinePanel()
+        self.outline_dock = QDockWidget("Outline", self)
+        self.outline_dock.setObjectName("outline_dock")
+        self.outline_dock.setWidget(self.outline_panel)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.outline_dock)
+        self.outline_dock.hide()
+        self.view_menu.addAction(self.outline_dock.toggleViewAction())
+        self.editor_tabs.currentChanged.connect(lambda index: self.outline_panel.set_editor(self.current_editor()))
+        self.outline_panel.set_editor(self.current_editor())
+    
+    def _update_backlinks_panel(self):
+        editor = self.current_editor()
+        self.backlinks_panel.set_current_file(editor.property("file_path") if editor is not None else None)
+    
+    def _on_application_state_changed(self, state):
+        if state == Qt.ApplicationActive:
+            self.search_index.reconcile()
+            self.metadata_store.reconcile()
+    
+    def show_quick_open(self):
+        if self.quick_open_dialog is None:
+            self.quick_open_dialog = QuickOpenDialog(self.path_index, self)
+            self.quick_open_dialog.file_selected.connect(self.open_markdown_file)
+        self.quick_open_dialog.open()
+    
+    def show_search_panel(self):
+        self.search_dock.show()
+        self.search_dock.raise_()
+        self.search_panel.focus_query()
     
     def create_toolbar(self):
         toolbar = QToolBar("Markdown Formatting")
         self.addToolBar(toolbar)
+        self.formatting_toolbar = toolbar
         
         # Text Formatting
         bold_action = QAction("Bold", self)
@@ -1950,6 +6828,9 @@ class NoteismMarkdownEditor(QMainWindow):
         self.line_count_label = QLabel("Lines: 0")
         self.cursor_pos_label = QLabel("Pos: 0, 0")
         self.char_count_label = QLabel("Chars: 0")
+        self.last_save_label = QLabel("")
+        self.selection_label = QLabel("")
+        self.workspace_label = QLabel("")
         
         status_bar.addPermanentWidget(self.file_format_label)
         status_bar.addPermanentWidget(self.file_size_label)
@@ -1957,26 +6838,81 @@ class NoteismMarkdownEditor(QMainWindow):
         status_bar.addPermanentWidget(self.line_count_label)
         status_bar.addPermanentWidget(self.cursor_pos_label)
         status_bar.addPermanentWidget(self.char_count_label)
+        status_bar.addPermanentWidget(self.selection_label)
+        status_bar.addPermanentWidget(self.last_save_label)
+        status_bar.addPermanentWidget(self.workspace_label)
+        
+        # Selection counts are taken once the selection settles
+        self.selection_status_timer = QTimer(self)
+        self.selection_status_timer.setSingleShot(True)
+        self.selection_status_timer.setInterval(150)
+        self.selection_status_timer.timeout.connect(self.update_selection_status)
+        
+        self.editor_tabs.currentChanged.connect(self.update_status)
+        self.update_status()
+        
+    def update_workspace_summary(self):
+        """Show the workspace's note and word totals from the metadata store"""
+        count, words = self.metadata_store.summary()
+        self.workspace_label.setText(f"Workspace: {count} notes, {words} words")
+    
+    def _on_editor_status_changed(self, editor, cursor_only=False):
+        if editor is not self.current_editor():
+            return
+        if cursor_only:
+            self.update_cursor_position()
+        else:
+            self.update_status()
+    
+    def _on_editor_selection_changed(self, editor):
+        if editor is self.current_editor():
+            self.selection_status_timer.start()
+    
+    def update_status(self, *args):
+        """Show the current tab's document statistics in the status bar"""
+        editor = self.current_editor()
+        if isinstance(editor, LargeFileViewer):
+            # The viewer never decodes the whole file; its word count comes from the metadata store
+            self.file_size_label.setText(f"Size: {editor.size} bytes")
+            facts = self.metadata_store.note(editor.property("file_path"))
+            if facts is not None:
+                self.word_count_label.setText(f"Words: {facts['word_count']}")
+            self.selection_label.clear()
+            return
+        if not isinstance(editor, QPlainTextEdit):
+            return
         
-        # Update status periodically
-        self.status_update_timer = QTimer(self)
-        self.status_update_timer.timeout.connect(self.update_status)
-        self.status_update_timer.start(1000)  # Update every second
-        
-    def update_status(self):
-        """Update document statistics in status bar"""
-        text = self.current_editor().toPlainText()
-        cursor = self.current_editor().textCursor()
-        
-        self.file_size_label.setText(f"Size: {len(text)} bytes")
-        self.word_count_label.setText(f"Words: {len(text.split())}")
-        self.line_count_label.setText(f"Lines: {text.count(chr(10)) + 1}")
+        statistics = editor.statistics
+        self.file_size_label.setText(f"Size: {statistics.byte_count} bytes")
+        self.word_count_label.setText(f"Words: {statistics.words}")
+        self.line_count_label.setText(f"Lines: {statistics.lines}")
+        self.char_count_label.setText(f"Chars: {statistics.characters}")
+        self.update_cursor_position()
+        self.update_selection_status()
+    
+    def update_cursor_position(self):
+        editor = self.current_editor()
+        if not isinstance(editor, QPlainTextEdit):
+            return
+        cursor = editor.textCursor()
         self.cursor_pos_label.setText(
             f"Pos: {cursor.blockNumber() + 1}, {cursor.columnNumber()}"
         )
-        self.char_count_label.setText(f"Chars: {len(text)}")
+    
+    def update_selection_status(self):
+        """Count the selected text, only when there is a selection"""
+        self.selection_status_timer.stop()
+        editor = self.current_editor()
+        if not isinstance(editor, QPlainTextEdit) or not editor.textCursor().hasSelection():
+            self.selection_label.clear()
+            return
+        # Paragraph separators stand in for newlines in selectedText()
+        text = editor.textCursor().selectedText().replace('\u2029', '\n')
+        self.selection_label.setText(f"Selected: {len(text.split())} words, {len(text)} chars")
         
 def main():
+    # Lets QtWebEngineWidgets be imported after the application exists
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     
     # Set application-wide font
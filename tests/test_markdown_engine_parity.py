@@ -0,0 +1,43 @@
+"""
+HTML parity between the preview engines on the shared feature corpus.
+
+The corpus and normalization live in benchmarks/markdown_engine_benchmark.py,
+whose 'parity' mode prints a diff for each mismatching document.
+"""
+import os
+import sys
+
+import pytest
+
+pytest.importorskip('PyQt5')
+pytest.importorskip('markdown')
+pytest.importorskip('mistune')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks'))
+
+from markdown_engine_benchmark import PARITY_CORPUS, build_renderers, normalize
+
+
+@pytest.fixture(scope='module')
+def renderers():
+    return list(build_renderers('export').values())
+
+
+@pytest.mark.parametrize('name', sorted(PARITY_CORPUS))
+def test_engines_render_the_same_html(renderers, name):
+    reference, candidate = renderers
+    text = PARITY_CORPUS[name]
+    assert normalize(candidate.render(text)) == normalize(reference.render(text))
+
+
+def test_markup_in_text_and_code_spans_is_escaped(renderers):
+    for renderer in renderers:
+        html = normalize(renderer.render(PARITY_CORPUS['escaping']))
+        assert '<script' not in html
+        assert '&lt;script alert' in html
+        assert '<code>&lt;script&gt;alert("x")&lt;/script&gt;</code>' in html
+
+
+def test_normalize_keeps_escaped_text_distinct():
+    assert normalize('<p>&lt;div&gt;</p>') != normalize('<p><div></p>')
+    assert normalize('<p>&quot;a&#x27;</p>') == normalize('<p>"a\'</p>')